@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class BaseballConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "baseball"
+
+    def ready(self):
+        from .metrics import install_query_timer
+
+        # DB 연결마다 쿼리 수 / 시간 기록 (/metrics)
+        connection_created.connect(install_query_timer, dispatch_uid="baseball-metrics-query-timer")
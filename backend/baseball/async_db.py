@@ -0,0 +1,90 @@
+"""
+비동기 MySQL 조회 (aiomysql 연결 풀)
+
+ASGI 서버(uvicorn)에서 async 뷰가 RDS 응답을 기다리는 동안 이벤트 루프를 막지 않도록
+settings.DATABASES['default'] 설정으로 aiomysql 연결 풀을 만들어 사용한다.
+
+- 연결 풀은 이벤트 루프마다 하나 (처음 조회할 때 생성)
+- aiomysql이 설치되어 있지 않거나 MySQL이 아닌 DB(테스트용 SQLite 등)에서는
+  Django 연결로 스레드에서 조회한다 (결과 형식은 같음)
+"""
+
+import asyncio
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection
+
+from .metrics import record_query
+
+try:
+    import aiomysql
+except ImportError:
+    # aiomysql 패키지가 없으면 Django 연결 사용
+    aiomysql = None
+
+# 이벤트 루프 → 연결 풀
+_pools = {}
+_pool_locks = {}
+
+
+def uses_async_driver():
+    """aiomysql 연결 풀을 사용할 수 있는지 (MySQL + aiomysql 설치)"""
+    return aiomysql is not None and settings.DATABASES['default']['ENGINE'].endswith('mysql')
+
+
+async def get_pool():
+    """현재 이벤트 루프의 연결 풀 반환 (없으면 생성)"""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is not None:
+        return pool
+
+    lock = _pool_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        pool = _pools.get(loop)
+        if pool is None:
+            db = settings.DATABASES['default']
+            pool = await aiomysql.create_pool(
+                host=db['HOST'],
+                port=int(db.get('PORT') or 3306),
+                user=db['USER'],
+                password=db['PASSWORD'],
+                db=db['NAME'],
+                charset=db.get('OPTIONS', {}).get('charset', 'utf8mb4'),
+                autocommit=True,
+                minsize=settings.ASYNC_DB_POOL_MIN_SIZE,
+                maxsize=settings.ASYNC_DB_POOL_MAX_SIZE,
+                # RDS가 유휴 연결을 끊기 전에 교체 (Django CONN_MAX_AGE와 같은 값)
+                pool_recycle=db.get('CONN_MAX_AGE') or -1,
+            )
+            _pools[loop] = pool
+            print(f"🔌 비동기 DB 연결 풀 생성 (최대 {settings.ASYNC_DB_POOL_MAX_SIZE}개)")
+    return pool
+
+
+def _fetch_all_sync(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = [col[0] for col in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+async def fetch_all(sql, params=()):
+    """
+    쿼리 실행 후 컬럼명 → 값 dict 리스트 반환 (views.dictfetchall과 같은 형식)
+    SQL 자리표시자는 %s (Django 커서와 같음)
+    """
+    if not uses_async_driver():
+        return await sync_to_async(_fetch_all_sync)(sql, params)
+
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            started = time.perf_counter()
+            await cursor.execute(sql, params)
+            rows = list(await cursor.fetchall())
+            record_query(time.perf_counter() - started)
+            return rows
+
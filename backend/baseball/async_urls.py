@@ -0,0 +1,20 @@
+from django.urls import path
+from .async_views import get_players_by_position_mysql, get_player_images, get_recent_games_batch, get_2025_hitters, get_2025_pitchers, get_leaders, get_player_profile
+
+# 비동기 읽기 API (/api/async/...) - ASGI 서버에서 사용
+urlpatterns = [
+    # MySQL 테이블 직접 쿼리 API
+    path('mysql-players/', get_players_by_position_mysql, name='async-mysql-players'),
+    # 선수 이미지 목록 API
+    path('player-images/', get_player_images, name='async-player-images'),
+    # 여러 선수 최근 경기 기록 일괄 API
+    path('recent-games/', get_recent_games_batch, name='async-recent-games'),
+    # 2025 타자 목록 API
+    path('hitters-2025/', get_2025_hitters, name='async-hitters-2025'),
+    # 2025 투수 목록 API
+    path('pitchers-2025/', get_2025_pitchers, name='async-pitchers-2025'),
+    # 기록 순위표 API
+    path('leaders/', get_leaders, name='async-leaders'),
+    # 선수 프로필 통합 API
+    path('players/<int:player_id>/profile/', get_player_profile, name='async-player-profile'),
+]
@@ -0,0 +1,254 @@
+"""
+비동기 읽기 API (ASGI 전용, /api/async/...)
+
+동기 API(/api/...)와 같은 응답을 async 뷰로 제공한다.
+- 스냅샷이 최신이면 이벤트 루프에서 바로 응답 (DB 조회 없음)
+- 스냅샷 재생성은 데이터 버전당 한 번, 스레드에서 실행
+- 선수별 캐시에 없는 최근 경기 기록은 aiomysql 연결 풀로 조회해
+  RDS 응답을 기다리는 동안 다른 요청을 처리한다
+
+실행: uvicorn config.asgi:application --host 0.0.0.0 --port 8000
+"""
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+from .async_db import fetch_all
+from .leaders import parse_leaders_params
+from .metrics import record_cache
+from .renderers import MSGPACK_MEDIA_TYPE, msgpack, pack_msgpack, to_columnar
+from .responses import snapshot_response
+from .stat_lists import InvalidListQuery, has_list_params, parse_list_params
+from .views import (
+    PLAYER_CACHE_TIMEOUT,
+    group_recent_games,
+    hitters_2025_columnar_snapshot,
+    hitters_2025_list_snapshot,
+    hitters_2025_snapshot,
+    leaderboard_snapshots,
+    parse_recent_games_params,
+    pitchers_2025_columnar_snapshot,
+    pitchers_2025_list_snapshot,
+    pitchers_2025_snapshot,
+    player_cache_keys,
+    player_image_manifest_snapshot,
+    player_images_page,
+    player_profiles_snapshot,
+    players_by_position_columnar_snapshot,
+    players_by_position_snapshot,
+    profile_images,
+    profile_recent_games_key,
+    recent_games_query,
+)
+
+
+def json_response(data, status=200):
+    """DRF 응답과 같은 형식의 JSON 응답 (한글 그대로)"""
+    return JsonResponse(
+        data,
+        status=status,
+        safe=False,
+        encoder=JSONEncoder,
+        json_dumps_params={'ensure_ascii': False, 'separators': (',', ':')},
+    )
+
+
+def requested_format(request):
+    """
+    응답 형식 (동기 API의 DRF 렌더러 선택과 같은 규칙)
+    'json' / 'columnar' / 'msgpack', 지원하지 않는 형식이면 None
+    """
+    fmt = request.GET.get('format')
+    if fmt is None:
+        accept = request.headers.get('Accept', '')
+        fmt = 'msgpack' if msgpack is not None and MSGPACK_MEDIA_TYPE in accept else 'json'
+    if fmt == 'msgpack' and msgpack is None:
+        return None
+    return fmt if fmt in ('json', 'columnar', 'msgpack') else None
+
+
+def formatted_response(data, fmt, status=200):
+    """json은 그대로, columnar / msgpack은 컬럼형으로 변환해 응답"""
+    if fmt == 'json':
+        return json_response(data, status=status)
+    if fmt == 'msgpack':
+        return HttpResponse(pack_msgpack(to_columnar(data)), status=status, content_type=MSGPACK_MEDIA_TYPE)
+    return json_response(to_columnar(data), status=status)
+
+
+def not_found_format():
+    return json_response({'detail': '지원하지 않는 응답 형식입니다.'}, status=404)
+
+
+async def formatted_snapshot_response(request, fmt, instance, columnar_instance):
+    """views.formatted_snapshot_response의 비동기 버전"""
+    if fmt == 'json':
+        return snapshot_response(request, instance, await get_snapshot_state(instance))
+    state = await get_snapshot_state(columnar_instance)
+    body_format = 'msgpack' if fmt == 'msgpack' else 'json'
+    return snapshot_response(request, columnar_instance, state, body_format)
+
+
+def error_response(e, detail):
+    import traceback
+    traceback.print_exc()
+    return json_response({'error': str(e), 'detail': detail}, status=500)
+
+
+async def get_snapshot_state(instance):
+    """최신 스냅샷 상태 반환 (재생성이 필요할 때만 스레드에서 DB 조회)"""
+    state = instance.current_state()
+    if state is None:
+        state = await sync_to_async(instance.get_state)()
+    return state
+
+
+async def acached_by_key(prefix, keys, load_missing):
+    """views.cached_by_key의 비동기 버전 (같은 캐시 키를 사용하므로 동기 API와 캐시 공유)"""
+    cache_keys = player_cache_keys(prefix, keys)
+
+    # 캐시 조회는 동기 API 사용 (Django 캐시의 a* 메서드는 요청마다 스레드 전환이 생김)
+    cached = cache.get_many(list(cache_keys))
+    result = {cache_keys[cache_key]: value for cache_key, value in cached.items()}
+    missing = [key for cache_key, key in cache_keys.items() if cache_key not in cached]
+    record_cache(hits=len(result), misses=len(missing))
+
+    if missing:
+        loaded = await load_missing(missing)
+        cache.set_many(
+            {cache_key: loaded[key] for cache_key, key in cache_keys.items() if key in loaded},
+            PLAYER_CACHE_TIMEOUT
+        )
+        result.update(loaded)
+
+    return result
+
+
+async def afetch_recent_games(kind, key_field, keys):
+    """views.fetch_recent_games의 비동기 버전"""
+    async def load(missing):
+        games = await fetch_all(*recent_games_query(kind, key_field, missing))
+        return group_recent_games(games, missing)
+
+    return await acached_by_key(f'recent-games:{kind}:{key_field}', keys, load)
+
+
+async def get_players_by_position_mysql(request):
+    """GET /api/async/mysql-players/"""
+    fmt = requested_format(request)
+    if fmt is None:
+        return not_found_format()
+    try:
+        return await formatted_snapshot_response(
+            request, fmt, players_by_position_snapshot, players_by_position_columnar_snapshot
+        )
+    except Exception as e:
+        return error_response(e, 'MySQL 데이터 조회 중 오류가 발생했습니다.')
+
+
+async def stat_list_response(request, list_snapshot, full_snapshot, columnar_snapshot):
+    """2025 목록: 페이지 파라미터가 있으면 페이지, 없으면 미리 인코딩된 전체 목록"""
+    fmt = requested_format(request)
+    if fmt is None:
+        return not_found_format()
+
+    if has_list_params(request.GET):
+        state = await get_snapshot_state(list_snapshot)
+        try:
+            page = state.value.page(**parse_list_params(request.GET))
+        except InvalidListQuery as e:
+            return formatted_response({'error': str(e)}, fmt, status=400)
+        return formatted_response(page, fmt)
+
+    return await formatted_snapshot_response(request, fmt, full_snapshot, columnar_snapshot)
+
+
+async def get_2025_hitters(request):
+    """GET /api/async/hitters-2025/"""
+    try:
+        return await stat_list_response(
+            request, hitters_2025_list_snapshot, hitters_2025_snapshot, hitters_2025_columnar_snapshot
+        )
+    except Exception as e:
+        return error_response(e, '타자 목록 조회 중 오류가 발생했습니다.')
+
+
+async def get_2025_pitchers(request):
+    """GET /api/async/pitchers-2025/"""
+    try:
+        return await stat_list_response(
+            request, pitchers_2025_list_snapshot, pitchers_2025_snapshot, pitchers_2025_columnar_snapshot
+        )
+    except Exception as e:
+        return error_response(e, '투수 목록 조회 중 오류가 발생했습니다.')
+
+
+async def get_leaders(request):
+    """GET /api/async/leaders/?stat=HR&type=hitter&limit=20"""
+    fmt = requested_format(request)
+    if fmt is None:
+        return not_found_format()
+    try:
+        try:
+            kind, source, stat, qualified, limit = parse_leaders_params(request.GET)
+            board = (await get_snapshot_state(leaderboard_snapshots[(kind, source)])).value
+            return formatted_response({'type': kind, 'source': source, **board.leaders(stat, qualified, limit)}, fmt)
+        except ValueError as e:
+            return formatted_response({'error': str(e)}, fmt, status=400)
+    except Exception as e:
+        return error_response(e, '기록 순위 조회 중 오류가 발생했습니다.')
+
+
+async def get_player_images(request):
+    """GET /api/async/player-images/?player_ids=76715&names=김광현"""
+    try:
+        # 매니페스트가 최신이면 이벤트 루프에서 바로 조회
+        manifest = (await get_snapshot_state(player_image_manifest_snapshot)).value
+        try:
+            return json_response(player_images_page(manifest, request.GET))
+        except ValueError as e:
+            return json_response({'error': str(e)}, status=400)
+    except Exception as e:
+        return error_response(e, '이미지 API 처리 중 오류가 발생했습니다.')
+
+
+async def get_recent_games_batch(request):
+    """GET /api/async/recent-games/?names=양의지&names=류현진"""
+    try:
+        try:
+            key_field, keys, kinds = parse_recent_games_params(request.GET)
+        except ValueError as e:
+            return json_response({'error': str(e)}, status=400)
+
+        result = {}
+        for kind in kinds:
+            games_by_player = await afetch_recent_games(kind, key_field, keys)
+            result[f'{kind}s'] = {key: games_by_player[key] for key in keys if games_by_player[key]}
+        return json_response(result)
+    except Exception as e:
+        return error_response(e, '최근 경기 데이터 조회 중 오류가 발생했습니다.')
+
+
+async def get_player_profile(request, player_id):
+    """GET /api/async/players/<id>/profile/"""
+    try:
+        profiles = (await get_snapshot_state(player_profiles_snapshot)).value
+        profile = profiles.get(player_id)
+        if profile is None:
+            return json_response({'error': '선수를 찾을 수 없습니다.'}, status=404)
+
+        name = profile['player']['name']
+        kind = 'pitcher' if profile['player']['position'] == 'pitcher' else 'hitter'
+        key_field, key = profile_recent_games_key(profile['player'])
+        manifest = (await get_snapshot_state(player_image_manifest_snapshot)).value
+        recent_games = await afetch_recent_games(kind, key_field, [key])
+
+        return json_response({
+            **profile,
+            'images': profile_images(manifest, player_id, name),
+            'recent_games': recent_games[key],
+        })
+    except Exception as e:
+        return error_response(e, '선수 프로필 조회 중 오류가 발생했습니다.')
@@ -0,0 +1,285 @@
+"""
+크롤링 테이블 타입 / 인덱스 정리 (migrate_crawled_schema 명령, sql_script/upload.py)
+
+크롤러는 모든 기록을 VARCHAR(10) 문자열로, 일자는 '09.04' 형식으로 저장하고
+업로드 스크립트(pandas to_sql)는 문자열 컬럼을 TEXT로 만든다.
+그대로 두면 ORDER BY G DESC 같은 정렬이 문자열 순서('9' > '10')가 되고 TEXT 컬럼에는 인덱스를 걸 수 없다.
+
+- 기록 컬럼 → INT / DOUBLE ('', '-'는 NULL, '1,234'의 쉼표 제거)
+- 일자 → DATE ('09.04' + 시즌 연도, API 응답은 다시 '09.04' 형식)
+- 선수명 / 팀명 등 키 컬럼 → VARCHAR (TEXT면 인덱스를 걸 수 있게)
+- API의 WHERE / ORDER BY / JOIN 형태에 맞는 인덱스 추가
+- 변환할 수 없는 값이 있는 컬럼은 건너뛴다 (MySQL strict 모드에서 ALTER가 실패하지 않도록)
+
+MySQL 전용. 크롤러 / 업로드가 테이블을 다시 만들면 다시 실행한다 (이미 정리된 컬럼과 인덱스는 건너뜀).
+이 모듈은 Django 설정 없이도 import 가능해야 한다 (크롤러, 업로드 스크립트에서 pymysql 커서로 사용).
+"""
+
+import re
+
+# 일자('09.04')에 붙일 시즌 연도
+DEFAULT_SEASON = 2025
+
+# 정수 기록 컬럼
+INT_COLUMNS = {
+    '순위', 'G', 'PA', 'AB', 'R', 'H', '2B', '3B', 'HR', 'TB', 'RBI', 'SAC', 'SF', 'SB', 'CS',
+    'BB', 'IBB', 'HBP', 'SO', 'GDP', 'CG', 'SHO', 'W', 'L', 'SV', 'HLD', 'TBF', 'NP',
+    'WP', 'BK', 'ER', 'BSV', 'QS',
+}
+
+# 소수 기록 컬럼 (비율 기록)
+FLOAT_COLUMNS = {'AVG', 'OBP', 'SLG', 'OPS', 'ERA', 'WHIP', 'WPCT', 'FPCT'}
+
+# 날짜 컬럼
+DATE_COLUMNS = {'일자'}
+
+# 문자열 컬럼 → VARCHAR 길이 (이닝은 '158 1/3' 형식이라 문자열 유지)
+TEXT_COLUMNS = {
+    'player_id': 'VARCHAR(20)',
+    '선수명': 'VARCHAR(50)',
+    '팀명': 'VARCHAR(20)',
+    'POS': 'VARCHAR(20)',
+    '상대': 'VARCHAR(20)',
+    '결과': 'VARCHAR(10)',
+    'IP': 'VARCHAR(20)',
+}
+
+# 테이블 → 추가할 인덱스 [(인덱스명, 컬럼들)] - API 쿼리 형태
+TABLE_INDEXES = {
+    # 최근 경기: WHERE player_id / 선수명 IN (...) ORDER BY 일자
+    # (crawl_hitter_recent_games.py가 만드는 타자 로그 테이블에는 같은 이름으로 이미 있음, 업로드한 투수 로그 테이블에만 추가됨)
+    'hitter_recent_games_log': [
+        ('idx_player_id_일자', ('player_id', '일자')),
+        ('idx_선수명_일자', ('선수명', '일자')),
+    ],
+    'pitcher_recent_games_log': [
+        ('idx_player_id_일자', ('player_id', '일자')),
+        ('idx_선수명_일자', ('선수명', '일자')),
+    ],
+    # 기록 저장소: ORDER BY 선수명 (player_id는 unique_player)
+    '2025_score_hitters': [
+        ('idx_선수명', ('선수명',)),
+    ],
+    '2025_score_pitchers': [
+        ('idx_선수명', ('선수명',)),
+    ],
+    # 타자 + 포지션 JOIN (선수명, 팀명) / TB 내림차순
+    'kbo_hitters_top150': [
+        ('idx_선수명_팀명', ('선수명', '팀명')),
+        ('idx_tb', ('TB',)),
+    ],
+    # 선수 목록 투수: ORDER BY G DESC
+    'kbo_pitchers_top150': [
+        ('idx_g', ('G',)),
+        ('idx_선수명', ('선수명',)),
+    ],
+    # WHERE POS IN (...) + JOIN (선수명, 팀명) → FPCT까지 인덱스만으로 읽음
+    'kbo_defense_positions': [
+        ('idx_pos_선수명_팀명_fpct', ('POS', '선수명', '팀명', 'FPCT')),
+    ],
+}
+
+# 정리 대상 테이블
+CRAWLED_TABLES = list(TABLE_INDEXES)
+
+# 이미 원하는 타입인 컬럼 (information_schema.COLUMNS.DATA_TYPE)
+NUMERIC_TYPES = {'tinyint', 'smallint', 'mediumint', 'int', 'bigint', 'double', 'float', 'decimal'}
+DATE_TYPES = {'date', 'datetime', 'timestamp'}
+LONG_TEXT_TYPES = {'tinytext', 'text', 'mediumtext', 'longtext'}
+
+# 변환 가능한 값 (공백 / 쉼표 / '-' 정리 후)
+VALUE_PATTERNS = {
+    'int': '^-?[0-9]+$',
+    'float': '^-?[0-9]*[.]?[0-9]+$',
+    'date': '^([0-9]{1,2}[.][0-9]{1,2}|[0-9]{4}-[0-9]{2}-[0-9]{2})$',
+}
+
+NUMERIC_TEXT = re.compile(r'-?[0-9][0-9,]*(\.[0-9]+)?')
+
+
+def db_value(value):
+    """
+    크롤링 값 → DB 저장 값 (숫자 타입 컬럼에 그대로 넣을 수 있게)
+    '' / '-' → None, '1,234' → '1234', 나머지는 앞뒤 공백만 제거
+    """
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    if text in ('', '-'):
+        return None
+    if NUMERIC_TEXT.fullmatch(text):
+        return text.replace(',', '')
+    return text
+
+
+def target_type(column):
+    """컬럼의 목표 타입 (종류, SQL 타입), 정리 대상이 아니면 None"""
+    if column in INT_COLUMNS:
+        return 'int', 'INT'
+    if column in FLOAT_COLUMNS:
+        return 'float', 'DOUBLE'
+    if column in DATE_COLUMNS:
+        return 'date', 'DATE'
+    if column in TEXT_COLUMNS:
+        return 'text', TEXT_COLUMNS[column]
+    return None
+
+
+def column_changes(column_types):
+    """
+    바꿔야 하는 컬럼 목록
+
+    Args:
+        column_types: {컬럼명: DATA_TYPE} (information_schema.COLUMNS, 소문자)
+
+    Returns:
+        [(컬럼명, 종류, SQL 타입), ...] - 이미 숫자 / 날짜 / VARCHAR인 컬럼은 제외
+    """
+    changes = []
+    for column, data_type in column_types.items():
+        target = target_type(column)
+        if target is None:
+            continue
+        kind, sql_type = target
+        if kind in ('int', 'float') and data_type in NUMERIC_TYPES:
+            continue
+        if kind == 'date' and data_type in DATE_TYPES:
+            continue
+        if kind == 'text' and data_type not in LONG_TEXT_TYPES:
+            continue
+        changes.append((column, kind, sql_type))
+    return changes
+
+
+def cleaned_value(column, kind):
+    """공백 / '-' / 빈 문자열(숫자는 쉼표도)을 정리한 값 SQL 식"""
+    value = f"`{column}`" if kind == 'date' else f"REPLACE(`{column}`, ',', '')"
+    return f"NULLIF(NULLIF(TRIM({value}), ''), '-')"
+
+
+def invalid_values_query(table, column, kind, sql_type):
+    """변환할 수 없는 값의 개수 쿼리 (sql, params)"""
+    if kind == 'text':
+        length = int(re.search(r'\d+', sql_type).group())
+        return f"SELECT COUNT(*) FROM `{table}` WHERE CHAR_LENGTH(`{column}`) > %s", [length]
+    value = cleaned_value(column, kind)
+    return (
+        f"SELECT COUNT(*) FROM `{table}` WHERE {value} IS NOT NULL AND {value} NOT REGEXP %s",
+        [VALUE_PATTERNS[kind]],
+    )
+
+
+def normalize_query(table, column, kind, season):
+    """ALTER 전에 값을 정리하는 UPDATE (sql, params), 정리할 필요가 없으면 None"""
+    if kind == 'text':
+        return None
+    value = cleaned_value(column, kind)
+    if kind == 'date':
+        # '09.04' → '2025-09-04' (이미 'YYYY-MM-DD'면 그대로)
+        return (
+            f"UPDATE `{table}` SET `{column}` = CASE WHEN {value} LIKE %s THEN {value} "
+            f"ELSE DATE_FORMAT(STR_TO_DATE(CONCAT(%s, '.', {value}), %s), %s) END",
+            ['____-__-__', str(season), '%Y.%m.%d', '%Y-%m-%d'],
+        )
+    return f"UPDATE `{table}` SET `{column}` = {value}", []
+
+
+def alter_table_sql(table, changes, indexes):
+    """컬럼 타입 변경 + 인덱스 추가를 한 번의 ALTER TABLE로"""
+    parts = [f"MODIFY `{column}` {sql_type} NULL" for column, _, sql_type in changes]
+    parts += [
+        f"ADD INDEX `{name}` (" + ', '.join(f'`{column}`' for column in columns) + ")"
+        for name, columns in indexes
+    ]
+    return f"ALTER TABLE `{table}` " + ', '.join(parts)
+
+
+def table_columns(cursor, table):
+    """{컬럼명: DATA_TYPE} (테이블이 없으면 빈 dict)"""
+    cursor.execute(
+        """
+        SELECT COLUMN_NAME, DATA_TYPE FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        ORDER BY ORDINAL_POSITION
+        """,
+        [table],
+    )
+    return {row[0]: row[1].lower() for row in _tuples(cursor)}
+
+
+def table_index_names(cursor, table):
+    cursor.execute(
+        """
+        SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """,
+        [table],
+    )
+    return {row[0] for row in _tuples(cursor)}
+
+
+def plan_table(cursor, table):
+    """
+    테이블 정리 계획 (DB를 바꾸지 않음)
+
+    Returns:
+        None (테이블 없음) 또는
+        {"changes": [(컬럼, 종류, SQL 타입), ...], "skipped": [(컬럼, 사유), ...],
+         "indexes": [(인덱스명, 컬럼들), ...]}
+    """
+    column_types = table_columns(cursor, table)
+    if not column_types:
+        return None
+
+    changes, skipped = [], []
+    for column, kind, sql_type in column_changes(column_types):
+        cursor.execute(*invalid_values_query(table, column, kind, sql_type))
+        invalid = _tuples(cursor)[0][0]
+        if invalid:
+            skipped.append((column, f'{sql_type}로 변환할 수 없는 값 {invalid}개'))
+        else:
+            changes.append((column, kind, sql_type))
+
+    # 정리 후에도 TEXT로 남는 컬럼이 있는 인덱스는 추가할 수 없음
+    changed = {column for column, _, _ in changes}
+    existing = table_index_names(cursor, table)
+    indexes = []
+    for name, columns in TABLE_INDEXES.get(table, []):
+        if name in existing:
+            continue
+        missing = [column for column in columns if column not in column_types]
+        long_text = [
+            column for column in columns
+            if column_types.get(column) in LONG_TEXT_TYPES and column not in changed
+        ]
+        if missing or long_text:
+            skipped.append((name, f'인덱스 컬럼 {", ".join(missing + long_text)} 없음 또는 TEXT'))
+            continue
+        indexes.append((name, columns))
+    return {'changes': changes, 'skipped': skipped, 'indexes': indexes}
+
+
+def apply_plan(cursor, table, plan, season):
+    """plan_table() 계획 실행 (값 정리 UPDATE 후 ALTER TABLE 한 번, 일자에는 season 연도를 붙임)"""
+    if not plan['changes'] and not plan['indexes']:
+        return
+    for column, kind, _ in plan['changes']:
+        query = normalize_query(table, column, kind, season)
+        if query:
+            cursor.execute(*query)
+    cursor.execute(alter_table_sql(table, plan['changes'], plan['indexes']))
+
+
+def explain(cursor, sql, params=None):
+    """EXPLAIN 결과 → [{"table", "type", "key", "rows", "Extra", ...}, ...]"""
+    cursor.execute(f"EXPLAIN {sql}", params)
+    rows = cursor.fetchall()
+    if rows and isinstance(rows[0], dict):
+        return list(rows)
+    names = [col[0] for col in cursor.description]
+    return [dict(zip(names, row)) for row in rows]
+
+
+def _tuples(cursor):
+    """fetchall() 결과를 튜플 목록으로 (pymysql DictCursor도 지원)"""
+    return [tuple(row.values()) if isinstance(row, dict) else row for row in cursor.fetchall()]
@@ -0,0 +1,173 @@
+"""
+타자 + 수비 포지션 구체화 테이블 (kbo_hitters_with_positions)
+
+kbo_hitters_top150과 kbo_defense_positions를 선수명 + 팀명으로 JOIN한 결과를
+데이터를 올릴 때(sql_script/upload.py, build_materialized 명령) 한 번만 만들어 둔다.
+API는 JOIN 없이 이 테이블을 포지션별 TB 내림차순으로 읽는다.
+
+- 숫자 컬럼은 INT / DOUBLE (VARCHAR 문자열 정렬 문제 없음)
+- (player_id, position) UNIQUE, (position, TB) 인덱스
+- MySQL은 새 테이블을 채운 뒤 RENAME TABLE로 한 번에 교체 (baseball/materialize.py)
+
+이 모듈은 Django 설정 없이도 import 가능해야 한다 (업로드 스크립트에서 pymysql 커서로 사용).
+"""
+
+from .materialize import replace_table
+
+MATERIALIZED_TABLE = 'kbo_hitters_with_positions'
+
+# 포지션 매핑: DB 포지션 → 프론트엔드 포지션 키
+POSITION_MAPPING = {
+    'P': 'pitcher',      # 투수
+    'C': 'catcher',      # 포수
+    '1B': 'first',       # 1루수
+    '2B': 'second',      # 2루수
+    '3B': 'third',       # 3루수
+    'SS': 'shortstop',   # 유격수
+    'LF': 'left',        # 좌익수
+    'CF': 'center',      # 중견수
+    'RF': 'right',       # 우익수
+}
+
+# 한글 포지션 → 영문 포지션 매핑 (수비 테이블용)
+POSITION_KR_TO_EN = {
+    '포수': 'C',
+    '1루수': '1B',
+    '2루수': '2B',
+    '3루수': '3B',
+    '유격수': 'SS',
+    '좌익수': 'LF',
+    '중견수': 'CF',
+    '우익수': 'RF',
+    '지명타자': 'DH',
+}
+
+# 타자 포지션 → 수비 테이블 한글 포지션 (kbo_defense_positions.POS)
+HITTER_POSITION_KR = {
+    POSITION_MAPPING[db_position]: position_kr
+    for position_kr, db_position in POSITION_KR_TO_EN.items()
+    if db_position in POSITION_MAPPING
+}
+
+# 수비 테이블 한글 포지션 → 프론트엔드 포지션 키
+POSITION_KR_TO_FRONTEND = {v: k for k, v in HITTER_POSITION_KR.items()}
+
+
+def to_int(value):
+    """'1,234' / 1234 → 1234, 빈 값이나 숫자가 아니면 None"""
+    try:
+        return int(float(str(value).replace(',', '').strip()))
+    except (TypeError, ValueError):
+        return None
+
+
+def to_float(value):
+    """'0.314' → 0.314, 빈 값이나 숫자가 아니면 None"""
+    try:
+        return float(str(value).replace(',', '').strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def to_text(value):
+    return None if value is None else str(value)
+
+
+# 구체화 테이블 컬럼 (컬럼명, SQL 타입, 변환 함수)
+COLUMNS = [
+    ('player_id', 'INT', to_int),
+    ('position', 'VARCHAR(20)', to_text),
+    ('포지션', 'VARCHAR(20)', to_text),
+    ('순위', 'INT', to_int),
+    ('선수명', 'VARCHAR(50)', to_text),
+    ('팀명', 'VARCHAR(20)', to_text),
+    ('AVG', 'DOUBLE', to_float),
+    ('G', 'INT', to_int),
+    ('PA', 'INT', to_int),
+    ('AB', 'INT', to_int),
+    ('H', 'INT', to_int),
+    ('2B', 'INT', to_int),
+    ('3B', 'INT', to_int),
+    ('HR', 'INT', to_int),
+    ('TB', 'INT', to_int),
+    ('RBI', 'INT', to_int),
+    ('SAC', 'INT', to_int),
+    ('SF', 'INT', to_int),
+    ('R', 'INT', to_int),
+    ('수비율', 'DOUBLE', to_float),
+]
+COLUMN_NAMES = [name for name, _, _ in COLUMNS]
+
+
+def source_query():
+    """크롤링 테이블 JOIN 쿼리 (sql, params) - 포지션 정보가 있는 타자만"""
+    placeholders = ', '.join(['%s'] * len(HITTER_POSITION_KR))
+    sql = f"""
+        SELECT
+            h.`player_id`,
+            d.`POS` AS `포지션`,
+            h.`순위`, h.`선수명`, h.`팀명`, h.`AVG`, h.`G`, h.`PA`, h.`AB`, h.`H`,
+            h.`2B`, h.`3B`, h.`HR`, h.`TB`, h.`RBI`, h.`SAC`, h.`SF`,
+            COALESCE(h.`R`, 0) AS `R`,
+            d.`FPCT` AS `수비율`
+        FROM `kbo_hitters_top150` h
+        INNER JOIN `kbo_defense_positions` d
+            ON h.`선수명` = d.`선수명`
+            AND h.`팀명` = d.`팀명`
+        WHERE d.`POS` IN ({placeholders})
+    """
+    return sql, list(HITTER_POSITION_KR.values())
+
+
+def materialized_rows(cursor):
+    """JOIN 결과 → 구체화 테이블 행 목록 (타입 변환, 같은 (player_id, 포지션)은 한 번만)"""
+    cursor.execute(*source_query())
+    names = [col[0] for col in cursor.description]
+    rows, seen = [], set()
+    for values in cursor.fetchall():
+        source = values if isinstance(values, dict) else dict(zip(names, values))
+        source = {**source, 'position': POSITION_KR_TO_FRONTEND[source['포지션']]}
+        row = [convert(source.get(name)) for name, _, convert in COLUMNS]
+        key = (row[0], row[1])
+        if row[0] is not None and key in seen:
+            continue
+        seen.add(key)
+        rows.append(row)
+    return rows
+
+
+def create_table_sql(table, vendor):
+    column_defs = ', '.join(f'`{name}` {sql_type}' for name, sql_type, _ in COLUMNS)
+    if vendor == 'mysql':
+        return (
+            f"CREATE TABLE `{table}` ({column_defs}, "
+            f"UNIQUE KEY `uq_player_position` (`player_id`, `position`), "
+            f"KEY `idx_position_tb` (`position`, `TB`)"
+            f") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+        )
+    return f"CREATE TABLE `{table}` ({column_defs}, UNIQUE (`player_id`, `position`))"
+
+
+def create_statements(table, vendor):
+    statements = [create_table_sql(table, vendor)]
+    if vendor != 'mysql':
+        statements.append(f'CREATE INDEX `idx_{table}_position_tb` ON `{table}` (`position`, `TB`)')
+    return statements
+
+
+def rebuild_hitters_with_positions(cursor, vendor='mysql'):
+    """
+    크롤링 테이블에서 구체화 테이블을 다시 만든다
+
+    Args:
+        cursor: DB-API 커서 (Django connection.cursor() 또는 pymysql 커서)
+        vendor: 'mysql' 또는 'sqlite'
+
+    Returns:
+        저장한 행 수
+    """
+    rows = materialized_rows(cursor)
+    replace_table(
+        cursor, MATERIALIZED_TABLE, lambda table: create_statements(table, vendor), COLUMN_NAMES, rows, vendor,
+    )
+    return len(rows)
@@ -0,0 +1,164 @@
+"""
+선수 이미지 매니페스트 (player_id → 이미지 목록)
+
+photo_data 테이블의 이미지 컬럼(image_1 ~ 3, profile_img)을 선수별 이미지 목록으로 한 번 펼쳐 두고,
+/api/player-images/와 선수 프로필은 요청마다 DB를 조회하지 않고 dict에서 찾는다.
+
+- upload_to_s3.py가 업로드 후 전체 매니페스트를 MANIFEST_FILE(JSON)로 저장 (로컬 파일에서 읽은 이미지 크기 포함)
+- 서버는 데이터 버전마다 photo_data를 한 번 읽어 매니페스트를 만들고, MANIFEST_FILE이 있으면 이미지 크기를 채운다
+- 선수 키는 player_id (photo_data에 player_id가 없는 선수는 선수명)
+
+이 모듈은 Django 설정 없이도 import 가능해야 한다 (upload_to_s3.py에서 사용).
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:
+    # Pillow가 없으면 이미지 크기 없이 매니페스트 생성
+    Image = None
+
+# 매니페스트 파일 (backend/player_image_manifest.json)
+MANIFEST_FILE = Path(__file__).resolve().parent.parent / 'player_image_manifest.json'
+
+# 이미지 종류 → photo_data 컬럼 (응답 순서)
+IMAGE_COLUMNS = [
+    ('1', 'image_1'),
+    ('2', 'image_2'),
+    ('3', 'image_3'),
+    ('profile', 'profile_img'),
+]
+
+# 한 요청에서 조회할 수 있는 최대 선수 수
+MAX_IMAGE_BATCH = 1000
+
+
+def image_size(path):
+    """로컬 이미지 파일의 (가로, 세로), 알 수 없으면 (None, None)"""
+    if Image is None:
+        return None, None
+    try:
+        with Image.open(path) as image:
+            return image.size
+    except OSError:
+        return None, None
+
+
+def build_manifest(rows, sizes=None):
+    """
+    photo_data 행 → 매니페스트 dict
+
+    Args:
+        rows: [{"player_id", "player_name", "image_1", ..., "profile_img"}, ...]
+        sizes: {이미지 URL: (가로, 세로)}
+
+    Returns:
+    {
+      "generated_at": 1735689600.0,
+      "players": {
+        "76715": {"player_id": "76715", "playerName": "류현진", "images": [
+          {"id": "류현진_1", "playerName": "류현진", "playerId": "76715", "imageUrl": "https://...",
+           "fileName": "류현진_1.jpg", "imageType": "1", "width": 600, "height": 800}, ...
+        ]}
+      }
+    }
+    """
+    sizes = sizes or {}
+    players = {}
+    for row in rows:
+        player_name = row.get('player_name')
+        player_id = row.get('player_id')
+        key = str(player_id) if player_id else player_name
+        entry = players.setdefault(key, {'player_id': player_id, 'playerName': player_name, 'images': []})
+        for image_type, column in IMAGE_COLUMNS:
+            image_url = row.get(column)
+            if not image_url:
+                continue
+            width, height = sizes.get(image_url, (None, None))
+            entry['images'].append({
+                'id': f"{player_name}_{image_type}",
+                'playerName': player_name,
+                'playerId': player_id,
+                'imageUrl': image_url,
+                'fileName': f"{player_name}_{image_type}.jpg",
+                'imageType': image_type,
+                'width': width,
+                'height': height,
+            })
+    return {'generated_at': time.time(), 'players': players}
+
+
+def write_manifest(manifest, path=MANIFEST_FILE):
+    """매니페스트 파일 저장 (임시 파일에 쓴 뒤 교체, 서버는 항상 완성된 파일을 읽음)"""
+    path = Path(path)
+    temp_path = path.with_suffix('.tmp')
+    temp_path.write_text(json.dumps(manifest, ensure_ascii=False), encoding='utf-8')
+    os.replace(temp_path, path)
+
+
+def load_sizes(path=MANIFEST_FILE):
+    """매니페스트 파일의 {이미지 URL: (가로, 세로)} (파일이 없으면 빈 dict)"""
+    try:
+        manifest = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return {
+        image['imageUrl']: (image.get('width'), image.get('height'))
+        for player in manifest.get('players', {}).values()
+        for image in player['images']
+    }
+
+
+class ImageManifest:
+    """
+    매니페스트 조회 (player_id / 선수명 → 이미지 목록)
+    """
+
+    def __init__(self, manifest):
+        self.players = manifest['players']
+        self.by_name = {}
+        for player in self.players.values():
+            self.by_name.setdefault(player['playerName'], []).extend(player['images'])
+
+    def __len__(self):
+        return len(self.players)
+
+    def images_for_id(self, player_id):
+        player = self.players.get(str(player_id))
+        return player['images'] if player else []
+
+    def images_for_name(self, player_name):
+        """선수명의 이미지 목록 (동명이인이면 모두)"""
+        return self.by_name.get(player_name, [])
+
+    def lookup(self, player_ids=(), player_names=()):
+        """요청 순서대로 이미지 목록 (player_id 먼저, 중복 선수 제외)"""
+        images = []
+        for player_id in dict.fromkeys(str(player_id) for player_id in player_ids):
+            images.extend(self.images_for_id(player_id))
+        for player_name in dict.fromkeys(player_names):
+            images.extend(self.images_for_name(player_name))
+        return images
+
+
+def parse_image_params(params):
+    """
+    이미지 조회 파라미터 → (player_id 목록, 선수명 목록), 잘못된 요청이면 ValueError
+    params는 QueryDict(getlist) 또는 JSON 본문 dict
+    """
+    if hasattr(params, 'getlist'):
+        player_ids, player_names = params.getlist('player_ids'), params.getlist('names')
+    elif isinstance(params, dict):
+        player_ids, player_names = params.get('player_ids') or [], params.get('names') or []
+        if not isinstance(player_ids, list) or not isinstance(player_names, list):
+            raise ValueError('player_ids와 names는 목록이어야 합니다.')
+    else:
+        raise ValueError('요청 본문은 {"player_ids": [...], "names": [...]} 형식이어야 합니다.')
+
+    if len(player_ids) + len(player_names) > MAX_IMAGE_BATCH:
+        raise ValueError(f'한 번에 최대 {MAX_IMAGE_BATCH}명까지 조회할 수 있습니다.')
+    return [str(player_id) for player_id in player_ids], [str(name) for name in player_names]
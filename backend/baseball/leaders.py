@@ -0,0 +1,152 @@
+"""
+기록 순위표 (리더보드)
+
+인메모리 기록 저장소(stat_store)의 테이블마다 모든 숫자 기록의 순위를
+데이터가 로드될 때 한 번 계산해 두고, 요청은 앞에서 limit명만 잘라 응답한다.
+(VARCHAR 컬럼에 대한 SQL ORDER BY 없음, 상위 N명 조회는 O(N))
+
+- 규정 타석 / 규정 이닝: 팀 경기 수(같은 시즌 타자 테이블의 최대 G) × 3.1 타석 / × 1.0 이닝
+- 비율 기록(타율, 평균자책점 등)은 기본으로 규정 충족 선수만
+- 낮을수록 좋은 기록(평균자책점, 삼진 등)은 오름차순
+- 순위는 동률이면 같은 순위 (1, 2, 2, 4, ...)
+"""
+
+import math
+
+DEFAULT_LEADERS_LIMIT = 10
+MAX_LEADERS_LIMIT = 100
+
+# (선수 유형, 기록 출처) → 저장소 테이블
+LEADER_TABLES = {
+    ('hitter', '2025'): '2025_score_hitters',
+    ('pitcher', '2025'): '2025_score_pitchers',
+    ('hitter', 'top150'): 'kbo_hitters_top150',
+    ('pitcher', 'top150'): 'kbo_pitchers_top150',
+}
+
+# 순위를 매기지 않는 숫자 컬럼
+EXCLUDED_STATS = {'순위'}
+
+# 낮을수록 좋은 기록 (오름차순)
+LOWER_IS_BETTER = {
+    'hitter': {'SO', 'CS', 'GDP'},
+    'pitcher': {
+        'ERA', 'L', 'H', '2B', '3B', 'HR', 'BB', 'IBB', 'HBP', 'R', 'ER',
+        'WP', 'BK', 'BSV', 'WHIP', 'AVG',
+    },
+}
+
+# 규정 충족 선수만 기본으로 보여주는 비율 기록
+RATE_STATS = {
+    'hitter': {'AVG', 'OBP', 'SLG', 'OPS'},
+    'pitcher': {'ERA', 'WHIP', 'WPCT', 'AVG'},
+}
+
+# 규정 기준: 선수 유형 → (컬럼, 팀 경기당 기준값)
+QUALIFYING = {
+    'hitter': ('PA', 3.1),
+    'pitcher': ('IP', 1.0),
+}
+
+
+def team_games(table):
+    """팀 경기 수 추정 (타자 테이블의 최대 출장 경기 수, 없으면 None)"""
+    values = [value for value in table.numeric.get('G', ()) if not math.isnan(value)]
+    return max(values) if values else None
+
+
+def parse_leaders_params(params):
+    """
+    순위표 조회 파라미터 → (선수 유형, 기록 출처, 기록, 규정 충족 여부 또는 None, limit)
+    잘못된 요청이면 ValueError
+    """
+    kind = params.get('type') or 'hitter'
+    source = params.get('source') or '2025'
+    if (kind, source) not in LEADER_TABLES:
+        raise ValueError("type은 'hitter' 또는 'pitcher', source는 '2025' 또는 'top150'이어야 합니다.")
+
+    stat = params.get('stat')
+    if not stat:
+        raise ValueError('stat 파라미터가 필요합니다.')
+
+    qualified = params.get('qualified')
+    if qualified in (None, ''):
+        qualified = None
+    elif qualified.lower() in ('1', 'true'):
+        qualified = True
+    elif qualified.lower() in ('0', 'false'):
+        qualified = False
+    else:
+        raise ValueError("qualified는 'true' 또는 'false'여야 합니다.")
+
+    try:
+        limit = int(params.get('limit') or DEFAULT_LEADERS_LIMIT)
+    except ValueError:
+        raise ValueError('limit은 숫자여야 합니다.')
+    if not 1 <= limit <= MAX_LEADERS_LIMIT:
+        raise ValueError(f'limit은 1 ~ {MAX_LEADERS_LIMIT} 사이여야 합니다.')
+
+    return kind, source, stat, qualified, limit
+
+
+class Leaderboard:
+    """
+    한 테이블의 기록별 순위 (기록 → 전체 / 규정 충족 순위 목록)
+    """
+
+    def __init__(self, table, kind, games=None, teams=None):
+        self.kind = kind
+        teams = teams or {}
+
+        column, per_game = QUALIFYING[kind]
+        self.min_qualifying = None
+        filters = []
+        if games and column in table.numeric:
+            self.min_qualifying = {'column': column, 'value': round(games * per_game, 1)}
+            filters = [(column, '>=', games * per_game)]
+
+        self.stats = [stat for stat in table.numeric if stat not in EXCLUDED_STATS]
+        self._entries = {}
+        for stat in self.stats:
+            descending = stat not in LOWER_IS_BETTER[kind]
+            self._entries[(stat, False)] = _ranked(table.top(stat, descending=descending), stat, teams)
+            self._entries[(stat, True)] = (
+                _ranked(table.top(stat, descending=descending, filters=filters), stat, teams)
+                if filters else self._entries[(stat, False)]
+            )
+
+    def leaders(self, stat, qualified=None, limit=DEFAULT_LEADERS_LIMIT):
+        """
+        stat 상위 limit명
+        qualified가 None이면 비율 기록만 규정 충족 선수로 제한
+        """
+        if stat not in self.stats:
+            raise ValueError(f'순위를 제공하지 않는 기록입니다: {stat}')
+        if qualified is None:
+            qualified = stat in RATE_STATS[self.kind]
+        return {
+            'stat': stat,
+            'qualified': qualified,
+            'min_qualifying': self.min_qualifying if qualified else None,
+            'order': 'asc' if stat in LOWER_IS_BETTER[self.kind] else 'desc',
+            'results': self._entries[(stat, qualified)][:limit],
+        }
+
+
+def _ranked(rows, stat, teams):
+    """정렬된 행 → 순위 항목 목록 (동률은 같은 순위)"""
+    entries = []
+    rank, previous = 0, None
+    for position, row in enumerate(rows, start=1):
+        value = row[stat]
+        if value != previous:
+            rank, previous = position, value
+        player_id = row.get('player_id')
+        entries.append({
+            'rank': rank,
+            'player_id': player_id,
+            '선수명': row.get('선수명'),
+            '팀명': row.get('팀명') or teams.get(str(player_id)),
+            'value': value,
+        })
+    return entries
@@ -0,0 +1,287 @@
+"""
+리그 백분위 능력치 테이블 (player_ratings)
+
+선수 오각형 능력치를 데이터를 올릴 때(sql_script/upload.py, build_materialized 명령) 한 번 계산해 두고,
+API는 /api/mysql-players/ 선수마다 그대로 붙여 응답한다 (프로필 / 비교 화면에서 다시 계산하지 않음).
+
+축마다 고정 상한 공식(baseball/ratings.py)과 같은 원본 기록을 쓰되, 임의의 상한(타율 0.400, 탈삼진 200 등) 대신
+같은 유형 선수 전체에서의 백분위(0-100)로 정규화한다.
+
+- 타자 (kbo_hitters_top150): 파워 (TB-H)/AB, 정확도 AVG, 득점력 R, 수비 FPCT(kbo_defense_positions 평균), 체력 AB
+- 투수 (kbo_pitchers_top150): 제구 9이닝당 볼넷, 탈삼진 SO, 피안타 억제력 9이닝당 피안타, 위기관리 ERA + WHIP, 체력 IP
+  (볼넷 / 피안타 / ERA + WHIP는 낮을수록 높은 백분위)
+- 백분위 = (평균 순위 - 1) / (선수 수 - 1) × 100 (동률은 같은 값, 기록이 없으면 0)
+- 수비율이 없는 타자(지명타자)의 수비는 정확도 60% + 파워 40%
+- 축마다 전체 선수 배열을 한 번에 계산 (NumPy, 없으면 파이썬 목록)
+
+이 모듈은 Django 설정 없이도 import 가능해야 한다 (업로드 스크립트에서 pymysql 커서로 사용).
+"""
+
+import math
+
+from .hitter_positions import POSITION_KR_TO_FRONTEND, to_float, to_int
+from .materialize import replace_table
+from .ratings import HITTER_AXES, PITCHER_AXES, js_round
+from .stat_store import parse_ip
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy가 없으면 파이썬 목록으로 계산 (결과는 같음)
+    np = None
+
+RATINGS_TABLE = 'player_ratings'
+
+# 능력치 컬럼 (타자 축 + 투수 축, 체력은 공용)
+AXIS_KEYS = list(dict.fromkeys(key for key, _ in HITTER_AXES + PITCHER_AXES))
+
+COLUMNS = [
+    ('player_id', 'INT'),
+    ('type', 'VARCHAR(10)'),
+    ('선수명', 'VARCHAR(50)'),
+    ('팀명', 'VARCHAR(20)'),
+] + [(key, 'INT') for key in AXIS_KEYS]
+COLUMN_NAMES = [name for name, _ in COLUMNS]
+
+
+def _vector(values):
+    """숫자 목록 → 배열 (None은 NaN)"""
+    floats = [math.nan if value is None else float(value) for value in values]
+    return np.array(floats, dtype=np.float64) if np is not None else floats
+
+
+def _divide(numerator, denominator, scale=1.0):
+    """numerator × scale / denominator (분모가 0 이하이거나 값이 없으면 NaN)"""
+    if np is not None:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(denominator > 0, numerator * scale / denominator, np.nan)
+    return [a * scale / b if b > 0 else math.nan for a, b in zip(numerator, denominator)]
+
+
+def _subtract(a, b):
+    if np is not None:
+        return a - b
+    return [x - y for x, y in zip(a, b)]
+
+
+def _add(a, b):
+    if np is not None:
+        return a + b
+    return [x + y for x, y in zip(a, b)]
+
+
+def percentiles(values, higher_is_better=True):
+    """
+    값 배열 → 리그 백분위 배열 (0.0-100.0)
+    동률은 평균 순위로 같은 백분위, 값이 없으면(NaN) 0
+    """
+    if np is not None:
+        values = np.asarray(values, dtype=np.float64)
+        result = np.zeros(len(values))
+        valid = ~np.isnan(values)
+        scores = values[valid] if higher_is_better else -values[valid]
+        if len(scores) == 1:
+            result[valid] = 100.0
+        elif len(scores) > 1:
+            _, inverse, counts = np.unique(scores, return_inverse=True, return_counts=True)
+            # 값이 작은 쪽부터 1위, 동률은 평균 순위
+            average_rank = np.cumsum(counts) - (counts - 1) / 2
+            result[valid] = (average_rank[inverse] - 1) / (len(scores) - 1) * 100
+        return result
+
+    scores = sorted(value if higher_is_better else -value for value in values if not math.isnan(value))
+    average_rank = {}
+    index = 0
+    while index < len(scores):
+        end = index
+        while end + 1 < len(scores) and scores[end + 1] == scores[index]:
+            end += 1
+        average_rank[scores[index]] = (index + end) / 2 + 1
+        index = end + 1
+    result = []
+    for value in values:
+        if math.isnan(value):
+            result.append(0.0)
+        elif len(scores) == 1:
+            result.append(100.0)
+        else:
+            score = value if higher_is_better else -value
+            result.append((average_rank[score] - 1) / (len(scores) - 1) * 100)
+    return result
+
+
+def _rounded(values):
+    return [js_round(float(value)) for value in values]
+
+
+def _fetch(cursor, sql):
+    cursor.execute(sql)
+    names = [col[0] for col in cursor.description]
+    return [row if isinstance(row, dict) else dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+def hitter_rating_rows(hitters, defense):
+    """
+    타자 능력치 {player_id, 선수명, 팀명, power, accuracy, scoring, defense, stamina} 목록
+
+    Args:
+        hitters: kbo_hitters_top150 행 (player_id, 선수명, 팀명, AVG, R, TB, H, AB)
+        defense: kbo_defense_positions 행 (선수명, 팀명, POS, FPCT)
+    """
+    fielding = {}
+    for record in defense:
+        fpct = to_float(record.get('FPCT'))
+        if record.get('POS') in POSITION_KR_TO_FRONTEND and fpct is not None:
+            fielding.setdefault((record['선수명'], record['팀명']), []).append(fpct)
+
+    at_bats = _vector(to_int(row.get('AB')) or 0 for row in hitters)
+    extra_bases = _subtract(
+        _vector(to_int(row.get('TB')) or 0 for row in hitters),
+        _vector(to_int(row.get('H')) or 0 for row in hitters),
+    )
+    fpct = _vector(
+        sum(values) / len(values) if values else None
+        for values in (fielding.get((row['선수명'], row['팀명'])) for row in hitters)
+    )
+
+    power = percentiles(_divide(extra_bases, at_bats))
+    accuracy = percentiles(_vector(to_float(row.get('AVG')) for row in hitters))
+    scoring = percentiles(_vector(to_int(row.get('R')) for row in hitters))
+    stamina = percentiles(at_bats)
+    fielding_rank = percentiles(fpct)
+    estimated = _add(
+        [value * 0.6 for value in accuracy] if np is None else accuracy * 0.6,
+        [value * 0.4 for value in power] if np is None else power * 0.4,
+    )
+    if np is not None:
+        defense_values = np.where(np.isnan(fpct), estimated, fielding_rank)
+    else:
+        defense_values = [e if math.isnan(f) else r for f, e, r in zip(fpct, estimated, fielding_rank)]
+
+    axes = {
+        'power': _rounded(power),
+        'accuracy': _rounded(accuracy),
+        'scoring': _rounded(scoring),
+        'defense': _rounded(defense_values),
+        'stamina': _rounded(stamina),
+    }
+    return [
+        {
+            'player_id': to_int(row.get('player_id')),
+            '선수명': row['선수명'],
+            '팀명': row['팀명'],
+            **{key: values[index] for key, values in axes.items()},
+        }
+        for index, row in enumerate(hitters)
+    ]
+
+
+def pitcher_rating_rows(pitchers):
+    """
+    투수 능력치 {player_id, 선수명, 팀명, control, strikeouts, hit_suppression, clutch, stamina} 목록
+
+    Args:
+        pitchers: kbo_pitchers_top150 행 (player_id, 선수명, 팀명, ERA, WHIP, IP, BB, SO, H)
+    """
+    innings = _vector(parse_ip(row.get('IP')) for row in pitchers)
+    walks_per_9 = _divide(_vector(to_int(row.get('BB')) for row in pitchers), innings, 9)
+    hits_per_9 = _divide(_vector(to_int(row.get('H')) for row in pitchers), innings, 9)
+    era_whip = _add(
+        _vector(to_float(row.get('ERA')) for row in pitchers),
+        _vector(to_float(row.get('WHIP')) for row in pitchers),
+    )
+
+    axes = {
+        'control': _rounded(percentiles(walks_per_9, higher_is_better=False)),
+        'strikeouts': _rounded(percentiles(_vector(to_int(row.get('SO')) for row in pitchers))),
+        'hit_suppression': _rounded(percentiles(hits_per_9, higher_is_better=False)),
+        'clutch': _rounded(percentiles(era_whip, higher_is_better=False)),
+        'stamina': _rounded(percentiles(innings)),
+    }
+    return [
+        {
+            'player_id': to_int(row.get('player_id')),
+            '선수명': row['선수명'],
+            '팀명': row['팀명'],
+            **{key: values[index] for key, values in axes.items()},
+        }
+        for index, row in enumerate(pitchers)
+    ]
+
+
+def rating_rows(cursor):
+    """크롤링 테이블 → 능력치 테이블 행 목록 (COLUMN_NAMES 순서)"""
+    hitters = _fetch(cursor, "SELECT `player_id`, `선수명`, `팀명`, `AVG`, `R`, `TB`, `H`, `AB` FROM `kbo_hitters_top150`")
+    defense = _fetch(cursor, "SELECT `선수명`, `팀명`, `POS`, `FPCT` FROM `kbo_defense_positions`")
+    pitchers = _fetch(
+        cursor,
+        "SELECT `player_id`, `선수명`, `팀명`, `ERA`, `WHIP`, `IP`, `BB`, `SO`, `H` FROM `kbo_pitchers_top150`",
+    )
+    rows = []
+    for player_type, records in (('hitter', hitter_rating_rows(hitters, defense)), ('pitcher', pitcher_rating_rows(pitchers))):
+        for record in records:
+            record = {**record, 'type': player_type}
+            rows.append([record.get(name) for name in COLUMN_NAMES])
+    return rows
+
+
+def create_statements(table, vendor):
+    column_defs = ', '.join(f'`{name}` {sql_type}' for name, sql_type in COLUMNS)
+    if vendor == 'mysql':
+        return [
+            f"CREATE TABLE `{table}` ({column_defs}, "
+            f"UNIQUE KEY `uq_type_player` (`type`, `player_id`), "
+            f"KEY `idx_type_name` (`type`, `선수명`, `팀명`)"
+            f") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+        ]
+    return [f"CREATE TABLE `{table}` ({column_defs}, UNIQUE (`type`, `player_id`))"]
+
+
+def rebuild_player_ratings(cursor, vendor='mysql'):
+    """
+    크롤링 테이블에서 능력치 테이블을 다시 만든다
+
+    Args:
+        cursor: DB-API 커서 (Django connection.cursor() 또는 pymysql 커서)
+        vendor: 'mysql' 또는 'sqlite'
+
+    Returns:
+        저장한 행 수
+    """
+    rows = rating_rows(cursor)
+    replace_table(cursor, RATINGS_TABLE, lambda table: create_statements(table, vendor), COLUMN_NAMES, rows, vendor)
+    return len(rows)
+
+
+class PlayerRatings:
+    """
+    능력치 조회 (유형 + player_id, player_id가 없는 선수는 유형 + 선수명 + 팀명)
+    """
+
+    def __init__(self, rows):
+        self.by_id = {}
+        self.by_name = {}
+        self.count = 0
+        for row in rows:
+            self.count += 1
+            axes = PITCHER_AXES if row['type'] == 'pitcher' else HITTER_AXES
+            values = {key: row[key] for key, _ in axes}
+            if row['player_id'] is not None:
+                self.by_id[(row['type'], str(row['player_id']))] = values
+            self.by_name.setdefault((row['type'], row['선수명'], row['팀명']), values)
+
+    def __len__(self):
+        return self.count
+
+    def get(self, player_type, player_id, name, team):
+        """{축: 0-100} 또는 None"""
+        if player_id:
+            values = self.by_id.get((player_type, str(player_id)))
+            if values is not None:
+                return values
+        return self.by_name.get((player_type, name, team))
+
+
+def load_ratings(cursor):
+    """능력치 테이블 → PlayerRatings"""
+    return PlayerRatings(_fetch(cursor, f"SELECT {', '.join(f'`{name}`' for name in COLUMN_NAMES)} FROM `{RATINGS_TABLE}`"))
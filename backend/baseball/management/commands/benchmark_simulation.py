@@ -0,0 +1,207 @@
+import json
+import os
+import platform
+import random
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.test import APIRequestFactory
+
+from baseball.views import SIMULATION_COUNT, _run_monte_carlo, _simulate_single_at_bat, simulate_at_bat
+
+BENCHMARK_DIR = Path(__file__).resolve().parent.parent.parent / 'benchmarks'
+FIXTURE_FILE = BENCHMARK_DIR / 'fixture_players.json'
+BASELINE_FILE = BENCHMARK_DIR / 'simulation_baseline.json'
+
+# 보정 작업 1회 측정당 반복 횟수
+CALIBRATION_ITERATIONS = 200000
+
+# 측정 항목별 1회 측정당 반복 횟수
+ITERATIONS = {
+    'at_bats_per_sec': 20000,
+    'monte_carlo_per_sec': 10,
+    'lineup_evaluations_per_sec': 2,
+    'simulate_at_bat_requests_per_sec': 10,
+}
+
+
+
+
+def environment():
+    """측정 환경 (기준값 파일에 함께 저장)"""
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor() or None,
+        'cpu_count': os.cpu_count(),
+        'python': f'{platform.python_implementation()} {platform.python_version()}',
+        'numpy': numpy_version,
+    }
+
+
+def run_calibration(n):
+    """
+    기계 속도 보정용 작업 (시뮬레이션 코드와 무관한 난수 + 비교 + 덧셈 루프)
+
+    측정 항목마다 바로 앞에서 잰 이 작업의 처리량으로 나눈 상대 처리량을 비교하므로
+    기준값을 만든 기계와 다른 기계에서도 비교할 수 있다.
+    """
+    total = 0
+    for _ in range(n):
+        if random.random() < 0.3:
+            total += 1
+    return total
+
+
+class Command(BaseCommand):
+    help = (
+        '시뮬레이션 엔진 처리량을 측정하고 JSON 기준값과 비교합니다 (성능 회귀 시 실패). '
+        '처리량은 같은 실행의 보정 작업 대비 상대값으로 비교합니다'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--update-baseline',
+            action='store_true',
+            help='측정 결과를 기준값 파일에 저장합니다',
+        )
+        parser.add_argument(
+            '--baseline',
+            default=str(BASELINE_FILE),
+            help='기준값 JSON 파일 경로',
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=0.25,
+            help='허용 상대 처리량 감소 비율 (기본 0.25 = 기준값 대비 25%% 이상 느려지면 실패)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='항목별 측정 횟수 (가장 좋은 결과 사용)',
+        )
+
+    def handle(self, *args, **options):
+        with open(FIXTURE_FILE, 'r', encoding='utf-8') as f:
+            fixture = json.load(f)
+
+        batter = fixture['lineup'][0]
+        pitcher = fixture['pitcher']
+        lineup = fixture['lineup']
+        factory = APIRequestFactory()
+
+        def run_at_bats(n):
+            for _ in range(n):
+                _simulate_single_at_bat(batter, pitcher)
+
+        def run_monte_carlo(n):
+            for _ in range(n):
+                _run_monte_carlo(batter, pitcher)
+
+        def run_lineup_evaluations(n):
+            # 라인업 평가 = 타순 9명 각각 vs 선발 투수 몬테카를로 시뮬레이션
+            for _ in range(n):
+                for lineup_batter in lineup:
+                    _run_monte_carlo(lineup_batter, pitcher)
+
+        def run_requests(n):
+            for _ in range(n):
+                request = factory.post(
+                    '/api/simulate-at-bat/',
+                    {'batter': batter, 'pitcher': pitcher},
+                    format='json',
+                )
+                response = simulate_at_bat(request)
+                if response.status_code != 200:
+                    raise CommandError(f'simulate_at_bat 응답 오류: {response.status_code}')
+
+        benchmarks = {
+            'at_bats_per_sec': run_at_bats,
+            'monte_carlo_per_sec': run_monte_carlo,
+            'lineup_evaluations_per_sec': run_lineup_evaluations,
+            'simulate_at_bat_requests_per_sec': run_requests,
+        }
+
+        def throughput(func, iterations):
+            start = time.perf_counter()
+            func(iterations)
+            return iterations / (time.perf_counter() - start)
+
+        random.seed(0)
+        calibration = 0.0
+        results, relative = {}, {}
+        for name, func in benchmarks.items():
+            best, best_relative = 0.0, 0.0
+            for _ in range(max(1, options['repeat'])):
+                # 같은 실행 안에서 보정 작업 → 측정 항목 순서로 재서 상대 처리량 계산
+                calibration_rate = throughput(run_calibration, CALIBRATION_ITERATIONS)
+                rate = throughput(func, ITERATIONS[name])
+                calibration = max(calibration, calibration_rate)
+                best = max(best, rate)
+                best_relative = max(best_relative, rate / calibration_rate)
+            results[name] = round(best, 2)
+            relative[name] = float(f'{best_relative:.6g}')
+            self.stdout.write(f'{name}: {results[name]:,.2f} (보정 작업 대비 {relative[name]:.6g})')
+        calibration = round(calibration, 2)
+
+        baseline_path = Path(options['baseline'])
+
+        if options['update_baseline']:
+            payload = {
+                'simulation_count': SIMULATION_COUNT,
+                'lineup_size': len(lineup),
+                'environment': environment(),
+                # 참고용 절대값 (이 환경에서만 의미 있음, 비교에는 relative 사용)
+                'calibration_per_sec': calibration,
+                'results': results,
+                'relative': relative,
+            }
+            with open(baseline_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+                f.write('\n')
+            self.stdout.write(self.style.SUCCESS(f'기준값 저장 완료: {baseline_path}'))
+            return
+
+        if not baseline_path.exists():
+            raise CommandError(f'기준값 파일이 없습니다: {baseline_path} (--update-baseline으로 생성하세요)')
+
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline_payload = json.load(f)
+        if 'relative' not in baseline_payload:
+            raise CommandError(f'상대 처리량이 없는 기준값 파일입니다: {baseline_path} (--update-baseline으로 다시 생성하세요)')
+        baseline = baseline_payload['relative']
+
+        baseline_environment = baseline_payload.get('environment') or {}
+        current_environment = environment()
+        for key in ('python', 'numpy'):
+            if baseline_environment.get(key) != current_environment[key]:
+                self.stdout.write(self.style.WARNING(
+                    f'⚠️ {key} 버전이 기준값과 다릅니다: {baseline_environment.get(key)} → {current_environment[key]}'
+                ))
+
+        threshold = options['threshold']
+        regressions = []
+        for name, value in relative.items():
+            expected = baseline.get(name)
+            if not expected:
+                continue
+            ratio = value / expected
+            line = f'{name}: 상대 {value:.6g} / 기준 {expected:.6g} ({ratio:.0%})'
+            if ratio < 1 - threshold:
+                regressions.append(name)
+                self.stdout.write(self.style.ERROR(f'✗ {line}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'✓ {line}'))
+
+        if regressions:
+            raise CommandError(f'처리량 회귀 감지: {", ".join(regressions)}')
+
+        self.stdout.write(self.style.SUCCESS('처리량 기준 통과'))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from baseball.materialized_tables import MATERIALIZED_TABLE_NAMES, rebuild_materialized
+from baseball.snapshots import mark_data_changed
+
+
+class Command(BaseCommand):
+    help = (
+        '크롤링 테이블에서 구체화 테이블을 다시 만듭니다 '
+        f"({', '.join(MATERIALIZED_TABLE_NAMES)})"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--table',
+            action='append',
+            dest='tables',
+            choices=MATERIALIZED_TABLE_NAMES,
+            help='다시 만들 테이블 (기본: 전체), 여러 번 지정',
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic(), connection.cursor() as cursor:
+            for table, count in rebuild_materialized(cursor, connection.vendor, options['tables']):
+                self.stdout.write(self.style.SUCCESS(f'✅ {table}: {count}행'))
+
+        # 실행 중인 API 서버의 인메모리 스냅샷 갱신
+        mark_data_changed()
@@ -0,0 +1,301 @@
+import http.client
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import Resolver404, resolve
+
+SIMULATION_BODY = {
+    'batter': {'name': '양의지', 'AVG': 0.337, 'H': 153, '2B': 27, '3B': 1, 'HR': 20,
+               'BB': 50, 'SO': 63, 'PA': 517, 'AB': 454},
+    'pitcher': {'name': '류현진', 'TBF': 574, 'BB': 25, 'SO': 122, 'AVG': 0.267, 'H': 144, 'HR': 12},
+}
+
+# 트래픽 구성: 이름 → [(엔드포인트 이름, 가중치, 메서드, 접두사 뒤 경로, 요청 본문), ...]
+# 경로의 선수 ID / 이름은 seed_loadtest_data 고정 데이터에 있는 선수
+MIXES = {
+    # 목록 / 순위표 / 검색 (메모리 스냅샷에서 응답)
+    'read': [
+        ('mysql-players', 3, 'GET', 'mysql-players/', None),
+        ('hitters-2025', 2, 'GET', 'hitters-2025/', None),
+        ('pitchers-2025', 2, 'GET', 'pitchers-2025/', None),
+        ('hitters-2025?sort', 2, 'GET', 'hitters-2025/?sort=-HR&limit=20&fields=player_id,선수명,HR', None),
+        ('leaders', 2, 'GET', 'leaders/?type=pitcher&stat=ERA', None),
+        ('players/search', 2, 'GET', 'players/search/?q=ㅇㅇㅈ', None),
+        ('team-summary', 2, 'GET', 'team-summary/?catcher=76232&third=52605&pitchers=76715', None),
+        ('hot-players', 2, 'GET', 'hot-players/?type=hitter&games=5', None),
+    ],
+    # 선수 상세 (프로필 / 최근 경기 / 이미지, 선수별 캐시)
+    'profile': [
+        ('players/profile', 4, 'GET', 'players/76715/profile/', None),
+        ('players/profile', 4, 'GET', 'players/76232/profile/', None),
+        ('recent-games', 2, 'GET', 'recent-games/?player_ids=76232&player_ids=76715', None),
+        ('player-images', 2, 'GET', 'player-images/?names=양의지&names=류현진', None),
+    ],
+    # 시뮬레이션 (CPU 사용)
+    'simulation': [
+        ('simulate-at-bat', 1, 'POST', 'simulate-at-bat/', SIMULATION_BODY),
+    ],
+}
+# 실제 사용 비율에 가까운 혼합 (목록 > 선수 상세 > 시뮬레이션)
+MIXES['mixed'] = (
+    [(label, weight * 4, method, path, body) for label, weight, method, path, body in MIXES['read']]
+    + [(label, weight * 2, method, path, body) for label, weight, method, path, body in MIXES['profile']]
+    + [(label, weight * 4, method, path, body) for label, weight, method, path, body in MIXES['simulation']]
+)
+
+# 비동기 읽기 API 접두사 (baseball/async_urls.py)
+ASYNC_PREFIX = '/api/async/'
+
+GUNICORN = ['gunicorn', 'config.wsgi:application', '-b', '127.0.0.1:{port}', '-w', '{workers}', '--threads', '8']
+UVICORN = ['uvicorn', 'config.asgi:application', '--host', '127.0.0.1', '--port', '{port}',
+           '--workers', '{workers}', '--log-level', 'warning']
+
+# --serve로 띄우는 서버: 이름 → (서버 명령, 측정할 API 접두사) (포트는 빈 포트를 찾아 채움)
+SERVERS = {
+    'wsgi': (GUNICORN, '/api/'),
+    'asgi': (UVICORN, ASYNC_PREFIX),  # 비동기 뷰 (/api/async/)
+    'asgi-sync': (UVICORN, '/api/'),  # 동기 뷰를 uvicorn에서 (별도 비교 대상, 비동기 뷰가 아님)
+}
+SERVER_START_TIMEOUT = 60
+
+
+def async_requests(requests):
+    """/api/async/에 라우트가 있는 요청만 (비동기 API에 없는 검색 / 팀 요약 / 최근 폼 / 시뮬레이션은 제외)"""
+    kept = []
+    for request in requests:
+        try:
+            resolve(ASYNC_PREFIX + request[3].split('?')[0])
+        except Resolver404:
+            continue
+        kept.append(request)
+    return kept
+
+
+class Command(BaseCommand):
+    help = (
+        '동시 요청으로 API 처리량과 엔드포인트별 p50/p95/p99 지연 시간을 측정합니다 '
+        '(실행 중인 서버 또는 --serve로 로컬 DB에 띄운 서버). '
+        'asgi는 uvicorn의 비동기 뷰(/api/async/), asgi-sync는 uvicorn의 동기 뷰(/api/)를 측정하는 별도 경우이며, '
+        '비동기 API를 측정하면 모든 대상에 /api/async/에 있는 요청만 보내 같은 요청으로 비교합니다'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target',
+            action='append',
+            help='이름=기본 URL (예: wsgi=http://127.0.0.1:8000/api/ asgi=http://127.0.0.1:8001/api/async/), 여러 번 지정',
+        )
+        parser.add_argument(
+            '--serve',
+            action='append',
+            choices=sorted(SERVERS),
+            help=(
+                '현재 설정(--settings)으로 서버를 띄워 측정 후 종료, 여러 번 지정 '
+                '(wsgi: gunicorn /api/, asgi: uvicorn /api/async/, asgi-sync: uvicorn /api/)'
+            ),
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='--serve 서버의 워커 프로세스 수',
+        )
+        parser.add_argument(
+            '--mix',
+            choices=sorted(MIXES),
+            default='read',
+            help='트래픽 구성 (read: 목록/순위표/검색, profile: 선수 상세, simulation: 시뮬레이션, mixed: 혼합)',
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=2000,
+            help='대상별 총 요청 수',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=50,
+            help='동시 요청 수 (연결 수)',
+        )
+        parser.add_argument(
+            '--path',
+            action='append',
+            dest='paths',
+            help='GET 요청 경로 (지정하면 --mix 대신 사용), 여러 번 지정',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='요청 순서 난수 시드 (같은 값이면 같은 순서)',
+        )
+
+    def handle(self, *args, **options):
+        if options['paths']:
+            requests = [(path.split('?')[0], 1, 'GET', path, None) for path in options['paths']]
+        else:
+            requests = MIXES[options['mix']]
+
+        targets = []
+        for target in options['target'] or []:
+            name, sep, base_url = target.partition('=')
+            if not sep or not base_url.startswith('http://'):
+                raise CommandError(f'--target 형식이 올바르지 않습니다: {target} (이름=http://호스트:포트/접두사/)')
+            targets.append((name, base_url if base_url.endswith('/') else base_url + '/', None))
+        for server in options['serve'] or []:
+            targets.append((server, None, server))
+        if not targets:
+            raise CommandError('--target 또는 --serve를 하나 이상 지정하세요.')
+
+        # 비동기 API를 측정하면 모든 대상에 /api/async/에 있는 요청만 보낸다 (같은 요청으로 비교)
+        if any(urlsplit(base_url).path.endswith(ASYNC_PREFIX) if base_url else SERVERS[server][1] == ASYNC_PREFIX
+               for _, base_url, server in targets):
+            kept = async_requests(requests)
+            skipped = sorted({label for label, *_ in requests} - {label for label, *_ in kept})
+            if not kept:
+                raise CommandError(f'{ASYNC_PREFIX}에 있는 요청이 없습니다 (--mix read 또는 profile 사용).')
+            if skipped:
+                self.stdout.write(f'⚠️ {ASYNC_PREFIX}에 없는 요청 제외 (모든 대상): {", ".join(skipped)}')
+            requests = kept
+
+        schedule = random.Random(options['seed']).choices(
+            requests, weights=[weight for _, weight, *_ in requests], k=options['requests'],
+        )
+
+        results = []
+        for name, base_url, server in targets:
+            process = None
+            if server:
+                process, base_url = self.start_server(server, options['workers'])
+            try:
+                self.stdout.write(
+                    f'🚀 {name}: {base_url} ({options["mix"] if not options["paths"] else "--path"}, '
+                    f'{options["requests"]}건, 동시 {options["concurrency"]})'
+                )
+                results.append((name, run_load(base_url, schedule, options['concurrency'])))
+            finally:
+                if process:
+                    process.terminate()
+                    process.wait(timeout=10)
+
+        header = f'{"":<2}{"엔드포인트":<24} {"요청":>6} {"요청/초":>9} {"p50(ms)":>9} {"p95(ms)":>9} {"p99(ms)":>9} {"오류":>5}'
+        for name, result in results:
+            self.stdout.write('')
+            self.stdout.write(f'📊 {name}')
+            self.stdout.write(header)
+            for label, stats in [*sorted(result['endpoints'].items()), ('전체', result['total'])]:
+                self.stdout.write(
+                    f'  {label:<24} {stats["requests"]:>6} {stats["requests_per_sec"]:>9.1f} '
+                    f'{stats["p50_ms"]:>9.1f} {stats["p95_ms"]:>9.1f} {stats["p99_ms"]:>9.1f} {stats["errors"]:>5}'
+                )
+
+    def start_server(self, server, workers):
+        """서버 프로세스를 띄우고 응답할 때까지 대기 → (프로세스, 기본 URL)"""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+
+        command_template, prefix = SERVERS[server]
+        command = [part.format(port=port, workers=workers) for part in command_template]
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings')}
+        self.stdout.write(f'⏳ {" ".join(command)} ({env["DJANGO_SETTINGS_MODULE"]}, DB: {settings.DATABASES["default"]["NAME"]})')
+        try:
+            process = subprocess.Popen(command, cwd=settings.BASE_DIR, env=env, stdout=subprocess.DEVNULL)
+        except FileNotFoundError:
+            raise CommandError(f'{command[0]}이(가) 설치되어 있지 않습니다 (pip install {command[0]}).')
+
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise CommandError(f'{server} 서버가 시작하지 못했습니다 (종료 코드 {process.returncode}).')
+            try:
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+                conn.request('GET', '/metrics')
+                conn.getresponse().read()
+                conn.close()
+                return process, f'http://127.0.0.1:{port}{prefix}'
+            except OSError:
+                time.sleep(0.2)
+        process.terminate()
+        raise CommandError(f'{server} 서버가 {SERVER_START_TIMEOUT}초 안에 응답하지 않았습니다.')
+
+
+def summarize(samples, elapsed):
+    """[(지연 ms, 오류 여부), ...] → {"requests", "requests_per_sec", "p50_ms", "p95_ms", "p99_ms", "errors"}"""
+    latencies = sorted(latency for latency, _ in samples)
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        'requests': len(latencies),
+        'requests_per_sec': len(latencies) / elapsed,
+        'p50_ms': quantiles[49],
+        'p95_ms': quantiles[94],
+        'p99_ms': quantiles[98],
+        'errors': sum(1 for _, error in samples if error),
+    }
+
+
+def run_load(base_url, schedule, concurrency):
+    """
+    concurrency개의 연결(keep-alive)로 schedule의 요청을 나눠 보내고 처리량/지연 시간 측정
+
+    Args:
+        schedule: [(엔드포인트 이름, 가중치, 메서드, 접두사 뒤 경로, 요청 본문), ...]
+
+    Returns:
+        {"total": 전체 통계, "endpoints": {엔드포인트 이름: 통계}}
+    """
+    parts = urlsplit(base_url)
+    if not schedule:
+        raise CommandError('요청 결과가 없습니다.')
+
+    def connect():
+        return http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+
+    def worker(index):
+        samples = []
+        conn = connect()
+        for label, _, method, path, body in schedule[index::concurrency]:
+            # 한글 쿼리 값은 퍼센트 인코딩
+            url = quote(parts.path + path, safe='/?&=,-')
+            headers = {'Accept-Encoding': 'gzip'}
+            payload = None
+            if body is not None:
+                payload = json.dumps(body).encode()
+                headers['Content-Type'] = 'application/json'
+            started = time.perf_counter()
+            error = False
+            try:
+                conn.request(method, url, body=payload, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                error = response.status >= 400
+            except (OSError, http.client.HTTPException):
+                error = True
+                conn.close()
+                conn = connect()
+            samples.append((label, (time.perf_counter() - started) * 1000, error))
+        conn.close()
+        return samples
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        samples = [sample for worker_samples in executor.map(worker, range(concurrency)) for sample in worker_samples]
+    elapsed = time.perf_counter() - started
+
+    endpoints = {}
+    for label, latency, error in samples:
+        endpoints.setdefault(label, []).append((latency, error))
+    return {
+        'total': summarize([(latency, error) for _, latency, error in samples], elapsed),
+        'endpoints': {label: summarize(endpoint_samples, elapsed) for label, endpoint_samples in endpoints.items()},
+    }
@@ -0,0 +1,119 @@
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection
+
+from baseball.crawled_schema import CRAWLED_TABLES, DEFAULT_SEASON, apply_plan, explain, plan_table
+from baseball.hitter_positions import source_query
+from baseball.snapshots import mark_data_changed
+from baseball.stat_store import STORE_TABLES, table_query
+from baseball.views import PITCHERS_QUERY, recent_games_query
+
+# EXPLAIN에 쓰는 최근 경기 조회 선수 수
+SAMPLE_KEYS = 3
+
+
+class Command(BaseCommand):
+    help = (
+        '크롤링 테이블의 기록 컬럼을 INT / DOUBLE / DATE로 바꾸고 API 쿼리용 인덱스를 추가합니다 '
+        '(MySQL, 변경 전후 EXPLAIN 출력)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--season',
+            type=int,
+            default=DEFAULT_SEASON,
+            help="일자('09.04')에 붙일 시즌 연도",
+        )
+        parser.add_argument(
+            '--table',
+            action='append',
+            dest='tables',
+            choices=CRAWLED_TABLES,
+            help='정리할 테이블 (기본: 전체), 여러 번 지정',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='변경 계획과 현재 EXPLAIN만 출력',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'mysql':
+            self.stdout.write(f'MySQL이 아니므로 건너뜁니다 ({connection.vendor})')
+            return
+
+        changed = False
+        with connection.cursor() as cursor:
+            queries = explain_queries(cursor)
+            self.stdout.write('🔎 변경 전 실행 계획')
+            self.print_plans(cursor, queries)
+
+            self.stdout.write('')
+            for table in options['tables'] or CRAWLED_TABLES:
+                plan = plan_table(cursor, table)
+                if plan is None:
+                    self.stdout.write(f'⏭️  {table}: 테이블 없음')
+                    continue
+                for column, _, sql_type in plan['changes']:
+                    self.stdout.write(f'🔧 {table}.{column} → {sql_type}')
+                for name, columns in plan['indexes']:
+                    self.stdout.write(f'➕ {table}: {name} ({", ".join(columns)})')
+                for name, reason in plan['skipped']:
+                    self.stdout.write(self.style.WARNING(f'⚠️  {table}.{name}: 건너뜀 ({reason})'))
+                if not plan['changes'] and not plan['indexes']:
+                    self.stdout.write(f'✅ {table}: 변경 없음')
+                    continue
+                if not options['dry_run']:
+                    apply_plan(cursor, table, plan, options['season'])
+                    changed = True
+
+            if options['dry_run']:
+                self.stdout.write('')
+                self.stdout.write('--dry-run: 변경하지 않았습니다')
+                return
+
+            self.stdout.write('')
+            self.stdout.write('🔎 변경 후 실행 계획')
+            self.print_plans(cursor, queries)
+
+        if changed:
+            # 컬럼 타입이 바뀌었으므로 실행 중인 API 서버의 인메모리 스냅샷 갱신
+            mark_data_changed()
+            self.stdout.write(self.style.SUCCESS('✅ 크롤링 테이블 정리 완료'))
+
+    def print_plans(self, cursor, queries):
+        for label, sql, params in queries:
+            try:
+                plans = explain(cursor, sql, params)
+            except DatabaseError as e:
+                self.stdout.write(f'  {label}: ⚠️ {e}')
+                continue
+            for plan in plans:
+                self.stdout.write(
+                    f'  {label:<36} {plan.get("table")} type={plan.get("type")} key={plan.get("key")} '
+                    f'rows={plan.get("rows")} {plan.get("Extra") or ""}'
+                )
+
+
+def sample_keys(cursor, table, key_field):
+    """EXPLAIN용 선수 키 (테이블에 있는 값, 없으면 임의 값)"""
+    try:
+        cursor.execute(f"SELECT DISTINCT `{key_field}` FROM `{table}` LIMIT {SAMPLE_KEYS}")
+        keys = [row[0] for row in cursor.fetchall()]
+    except DatabaseError:
+        keys = []
+    return keys or ['0']
+
+
+def explain_queries(cursor):
+    """API가 실행하는 쿼리 [(이름, sql, params), ...]"""
+    queries = [('선수 목록 투수 (ORDER BY G DESC)', PITCHERS_QUERY, None)]
+    sql, params = source_query()
+    queries.append(('타자 + 포지션 JOIN', sql, params))
+    for kind, table in (('hitter', 'hitter_recent_games_log'), ('pitcher', 'pitcher_recent_games_log')):
+        for key_field in ('player_id', '선수명'):
+            sql, params = recent_games_query(kind, key_field, sample_keys(cursor, table, key_field))
+            queries.append((f'최근 경기 {kind} ({key_field})', sql, params))
+    for table in STORE_TABLES:
+        queries.append((f'기록 저장소 {table}', table_query(table), None))
+    return queries
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from baseball.snapshots import get_data_version, mark_data_changed
+
+
+class Command(BaseCommand):
+    help = '데이터 갱신을 표시하여 실행 중인 서버의 인메모리 스냅샷을 다시 만들게 합니다'
+
+    def handle(self, *args, **options):
+        mark_data_changed()
+        self.stdout.write(self.style.SUCCESS(f'데이터 버전 갱신 완료: {get_data_version()}'))
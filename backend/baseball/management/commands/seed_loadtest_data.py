@@ -0,0 +1,238 @@
+import random
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from baseball.materialized_tables import rebuild_materialized
+from baseball.models import Player
+from baseball.snapshots import mark_data_changed
+from baseball.stat_store import STORE_TABLES
+
+TEAMS = ['KIA', '삼성', 'LG', '두산', 'KT', 'SSG', '롯데', '한화', 'NC', '키움']
+DEFENSE_POSITIONS = ['포수', '1루수', '2루수', '3루수', '유격수', '좌익수', '중견수', '우익수', '지명타자']
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍양전고문손배백허남심노하곽성차주우구민진나'
+GIVEN_SYLLABLES = '민서준도영지현우성진호수재윤하은태원석동희경상혁규철용찬종훈기승연주인환정대빈'
+
+# 실제 선수 몇 명 (부하 테스트 경로에서 이름 / ID로 사용)
+ANCHOR_HITTERS = [
+    ('양의지', '두산', '포수', '76232'),
+    ('김도영', 'KIA', '3루수', '52605'),
+    ('오스틴', 'LG', '1루수', '69102'),
+    ('박해민', 'LG', '중견수', '62415'),
+    ('최형우', 'KIA', '지명타자', '71432'),
+]
+ANCHOR_PITCHERS = [
+    ('류현진', '한화', '76715'),
+    ('원태인', '삼성', '69446'),
+]
+
+PHOTO_COLUMNS = ['player_id', 'player_name', 'image_1', 'image_2', 'image_3', 'profile_img']
+
+
+class Command(BaseCommand):
+    help = (
+        '부하 테스트용 고정 데이터를 현재 DB에 만듭니다 '
+        '(크롤링 테이블 + 2025 기록 + 최근 경기 + 이미지 + players, 로컬 SQLite / MySQL 전용)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hitters', type=int, default=150, help='타자 수 (kbo_hitters_top150)')
+        parser.add_argument('--pitchers', type=int, default=150, help='투수 수 (kbo_pitchers_top150)')
+        parser.add_argument('--games', type=int, default=10, help='선수별 최근 경기 수')
+        parser.add_argument('--seed', type=int, default=2025, help='난수 시드 (같은 값이면 같은 데이터)')
+
+    def handle(self, *args, **options):
+        host = connection.settings_dict.get('HOST') or ''
+        if 'rds.amazonaws.com' in host:
+            # 테이블을 삭제하고 다시 만들므로 운영 DB에서는 실행하지 않음
+            raise CommandError(f'운영 DB({host})에는 실행할 수 없습니다. --settings=config.settings_loadtest 로 실행하세요.')
+
+        rng = random.Random(options['seed'])
+        hitters = make_hitters(rng, options['hitters'])
+        pitchers = make_pitchers(rng, options['pitchers'])
+
+        tables = {
+            'kbo_hitters_top150': [hitter_row(rng, h) for h in hitters],
+            'kbo_pitchers_top150': [pitcher_row(rng, p) for p in pitchers],
+            'kbo_defense_positions': [
+                {'선수명': h['name'], '팀명': h['team'], 'POS': h['pos'], 'FPCT': f'{rng.uniform(0.95, 1.0):.3f}'}
+                for h in hitters
+            ],
+            '2025_score_hitters': [hitter_row(rng, h) for h in hitters],
+            '2025_score_pitchers': [pitcher_row(rng, p) for p in pitchers],
+            'hitter_recent_games_log': [game for h in hitters for game in hitter_games(rng, h, options['games'])],
+            'pitcher_recent_games_log': [game for p in pitchers for game in pitcher_games(rng, p, options['games'])],
+            'photo_data': [photo_row(player) for player in hitters + pitchers],
+        }
+        for table in ('kbo_hitters_top150', 'kbo_pitchers_top150'):
+            for rank, row in enumerate(tables[table], start=1):
+                row['순위'] = str(rank)
+
+        with connection.cursor() as cursor:
+            for table, rows in tables.items():
+                columns = STORE_TABLES[table][0] if table in STORE_TABLES else PHOTO_COLUMNS
+                create_table(cursor, table, columns)
+                cursor.executemany(
+                    f"INSERT INTO `{table}` ({', '.join(f'`{c}`' for c in columns)}) "
+                    f"VALUES ({', '.join(['%s'] * len(columns))})",
+                    [[row.get(c, '') for c in columns] for row in rows],
+                )
+                self.stdout.write(f'✅ {table}: {len(rows)}행')
+
+            # 업로드 후 만드는 구체화 테이블
+            for table, count in rebuild_materialized(cursor, connection.vendor):
+                self.stdout.write(f'✅ {table}: {count}행')
+
+        # 로컬 players 테이블 (PlayerViewSet / 시뮬레이션용, 투수 외 포지션은 타자 순서대로)
+        fielder_positions = [value for value, _ in Player.POSITION_CHOICES if value != 'pitcher']
+        Player.objects.all().delete()
+        Player.objects.bulk_create(
+            [Player(name=p['name'], team=p['team'], position='pitcher', back_number=i % 99 + 1)
+             for i, p in enumerate(pitchers)]
+            + [Player(name=h['name'], team=h['team'], position=fielder_positions[i % len(fielder_positions)],
+                      back_number=i % 99 + 1)
+               for i, h in enumerate(hitters)]
+        )
+        self.stdout.write(f'✅ players: {Player.objects.count()}행')
+
+        mark_data_changed()
+        self.stdout.write(self.style.SUCCESS('부하 테스트 데이터 생성 완료'))
+
+
+def create_table(cursor, table, columns):
+    """VARCHAR 컬럼 테이블 (크롤링 테이블과 같은 형식) + 선수 키 인덱스"""
+    cursor.execute(f'DROP TABLE IF EXISTS `{table}`')
+    column_defs = ', '.join(f'`{column}` VARCHAR(200)' for column in columns)
+    cursor.execute(f'CREATE TABLE `{table}` ({column_defs})')
+    for column in ('player_id', '선수명', 'player_name'):
+        if column in columns:
+            cursor.execute(f'CREATE INDEX `idx_{table}_{column}` ON `{table}` (`{column}`)')
+
+
+def make_names(rng, count, taken):
+    names = []
+    while len(names) < count:
+        name = rng.choice(SURNAMES) + rng.choice(GIVEN_SYLLABLES) + rng.choice(GIVEN_SYLLABLES)
+        # 동명이인도 가끔 생기도록 중복 허용 (실제 데이터와 같이)
+        if name not in taken or rng.random() < 0.02:
+            taken.add(name)
+            names.append(name)
+    return names
+
+
+def make_hitters(rng, count):
+    taken = {name for name, *_ in ANCHOR_HITTERS}
+    hitters = [
+        {'name': name, 'team': team, 'pos': pos, 'player_id': pid}
+        for name, team, pos, pid in ANCHOR_HITTERS[:count]
+    ]
+    for i, name in enumerate(make_names(rng, count - len(hitters), taken)):
+        hitters.append({
+            'name': name,
+            'team': TEAMS[i % len(TEAMS)],
+            'pos': DEFENSE_POSITIONS[i % len(DEFENSE_POSITIONS)],
+            'player_id': str(50000 + i),
+        })
+    return hitters
+
+
+def make_pitchers(rng, count):
+    taken = {name for name, *_ in ANCHOR_PITCHERS}
+    pitchers = [{'name': name, 'team': team, 'player_id': pid} for name, team, pid in ANCHOR_PITCHERS[:count]]
+    for i, name in enumerate(make_names(rng, count - len(pitchers), taken)):
+        pitchers.append({'name': name, 'team': TEAMS[i % len(TEAMS)], 'player_id': str(60000 + i)})
+    return pitchers
+
+
+def format_ip(outs):
+    whole, rest = divmod(outs, 3)
+    return f'{whole} {rest}/3' if rest else str(whole)
+
+
+def hitter_row(rng, hitter):
+    """타자 시즌 기록 (kbo_hitters_top150 / 2025_score_hitters 공용, 없는 컬럼은 무시됨)"""
+    games = rng.randint(60, 144)
+    pa = int(games * rng.uniform(3.0, 4.6))
+    bb, hbp, sac, sf = int(pa * rng.uniform(0.05, 0.14)), rng.randint(0, 12), rng.randint(0, 10), rng.randint(0, 8)
+    ab = pa - bb - hbp - sac - sf
+    avg = rng.uniform(0.210, 0.350)
+    hits = int(ab * avg)
+    doubles, triples, hr = int(hits * rng.uniform(0.12, 0.22)), rng.randint(0, 6), int(hits * rng.uniform(0.0, 0.22))
+    singles = max(hits - doubles - triples - hr, 0)
+    tb = singles + 2 * doubles + 3 * triples + 4 * hr
+    obp = (hits + bb + hbp) / max(ab + bb + hbp + sf, 1)
+    slg = tb / max(ab, 1)
+    return {
+        '순위': '', 'player_id': hitter['player_id'], '선수명': hitter['name'], '팀명': hitter['team'],
+        'AVG': f'{hits / max(ab, 1):.3f}', 'G': str(games), 'PA': str(pa), 'AB': str(ab),
+        'R': str(int(hits * rng.uniform(0.4, 0.7))), 'H': str(hits), '2B': str(doubles), '3B': str(triples),
+        'HR': str(hr), 'TB': str(tb), 'RBI': str(int(hr * 2.5 + hits * rng.uniform(0.15, 0.3))),
+        'SAC': str(sac), 'SF': str(sf), 'SB': str(rng.randint(0, 40)), 'CS': str(rng.randint(0, 10)),
+        'BB': str(bb), 'IBB': str(rng.randint(0, 8)), 'HBP': str(hbp), 'SO': str(int(pa * rng.uniform(0.1, 0.28))),
+        'GDP': str(rng.randint(0, 20)), 'SLG': f'{slg:.3f}', 'OBP': f'{obp:.3f}', 'OPS': f'{obp + slg:.3f}',
+    }
+
+
+def pitcher_row(rng, pitcher):
+    """투수 시즌 기록 (kbo_pitchers_top150 / 2025_score_pitchers 공용)"""
+    starter = rng.random() < 0.4
+    games = rng.randint(20, 32) if starter else rng.randint(20, 75)
+    outs = int(games * (rng.uniform(14, 19) if starter else rng.uniform(2.5, 4)))
+    innings = outs / 3
+    era = rng.uniform(2.2, 6.5)
+    er = int(era * innings / 9)
+    hits, bb, hbp = int(innings * rng.uniform(0.75, 1.2)), int(innings * rng.uniform(0.25, 0.5)), rng.randint(0, 10)
+    wins, losses = (rng.randint(3, 16), rng.randint(2, 12)) if starter else (rng.randint(0, 6), rng.randint(0, 6))
+    tbf = outs + hits + bb + hbp
+    return {
+        '순위': '', 'player_id': pitcher['player_id'], '선수명': pitcher['name'], '팀명': pitcher['team'],
+        'ERA': f'{er * 9 / max(innings, 1):.2f}', 'G': str(games), 'CG': str(rng.randint(0, 2) if starter else 0),
+        'SHO': '0', 'W': str(wins), 'L': str(losses),
+        'SV': str(0 if starter else rng.randint(0, 35)), 'HLD': str(0 if starter else rng.randint(0, 25)),
+        'WPCT': f'{wins / max(wins + losses, 1):.3f}', 'TBF': str(tbf), 'NP': str(int(tbf * 3.9)),
+        'IP': format_ip(outs), 'H': str(hits), '2B': str(int(hits * 0.18)), '3B': str(int(hits * 0.02)),
+        'HR': str(int(innings * rng.uniform(0.05, 0.15))), 'SAC': str(rng.randint(0, 6)), 'SF': str(rng.randint(0, 6)),
+        'BB': str(bb), 'IBB': str(rng.randint(0, 4)), 'HBP': str(hbp), 'SO': str(int(innings * rng.uniform(0.6, 1.2))),
+        'WP': str(rng.randint(0, 8)), 'BK': '0', 'R': str(er + rng.randint(0, 8)), 'ER': str(er),
+        'BSV': str(0 if starter else rng.randint(0, 6)), 'WHIP': f'{(hits + bb) / max(innings, 1):.2f}',
+        'AVG': f'{hits / max(tbf - bb - hbp, 1):.3f}', 'QS': str(rng.randint(0, games) if starter else 0),
+    }
+
+
+def hitter_games(rng, hitter, count):
+    games = []
+    for day in range(count):
+        ab = rng.randint(2, 5)
+        hits = rng.randint(0, min(ab, 3))
+        games.append({
+            'player_id': hitter['player_id'], '선수명': hitter['name'], '일자': f'09.{day + 1:02d}',
+            '상대': rng.choice(TEAMS), 'AVG': f'{hits / ab:.3f}', 'PA': str(ab + 1), 'AB': str(ab),
+            'R': str(rng.randint(0, 2)), 'H': str(hits), '2B': str(int(hits > 1)), '3B': '0',
+            'HR': str(int(rng.random() < 0.1)), 'RBI': str(rng.randint(0, 3)), 'SB': '0', 'CS': '0',
+            'BB': str(rng.randint(0, 1)), 'HBP': '0', 'SO': str(rng.randint(0, 2)), 'GDP': '0',
+        })
+    return games
+
+
+def pitcher_games(rng, pitcher, count):
+    games = []
+    for day in range(count):
+        outs = rng.randint(3, 21)
+        er = rng.randint(0, 5)
+        games.append({
+            'player_id': pitcher['player_id'], '선수명': pitcher['name'], '일자': f'09.{day + 1:02d}',
+            '상대': rng.choice(TEAMS), '결과': rng.choice(['승', '패', '-', '홀드']),
+            'ERA': f'{er * 27 / outs:.2f}', 'TBF': str(outs + rng.randint(2, 8)), 'IP': format_ip(outs),
+            'H': str(rng.randint(0, 8)), 'HR': str(rng.randint(0, 2)), 'BB': str(rng.randint(0, 4)),
+            'HBP': '0', 'SO': str(rng.randint(0, 10)), 'R': str(er + rng.randint(0, 1)), 'ER': str(er),
+            'AVG': f'{rng.uniform(0.15, 0.35):.3f}',
+        })
+    return games
+
+
+def photo_row(player):
+    base = f"https://loadtest.invalid/players/{player['name']}"
+    return {
+        'player_id': player['player_id'], 'player_name': player['name'],
+        'image_1': f'{base}_1.jpg', 'image_2': f'{base}_2.jpg', 'image_3': '', 'profile_img': f'{base}_profile.jpg',
+    }
@@ -0,0 +1,46 @@
+"""
+구체화 테이블 교체 (데이터를 올릴 때 크롤링 테이블에서 계산해 두는 테이블 공용)
+
+- MySQL은 새 테이블을 채운 뒤 RENAME TABLE로 한 번에 교체 (읽는 쪽은 항상 완성된 테이블을 봄)
+- SQLite(로컬 / 테스트)는 DDL도 트랜잭션 안에서 실행되므로 바로 다시 만든다
+
+이 모듈은 Django 설정 없이도 import 가능해야 한다 (업로드 스크립트에서 pymysql 커서로 사용).
+"""
+
+
+def replace_table(cursor, table, create_statements, column_names, rows, vendor='mysql'):
+    """
+    table을 rows로 채운 새 테이블로 교체한다
+
+    Args:
+        cursor: DB-API 커서 (Django connection.cursor() 또는 pymysql 커서)
+        create_statements: 테이블명 → [CREATE TABLE ..., CREATE INDEX ...] (vendor에 맞는 SQL)
+        column_names: rows 값 순서의 컬럼명
+        rows: 값 목록의 목록
+        vendor: 'mysql' 또는 'sqlite'
+    """
+    insert_sql = (
+        "INSERT INTO `{table}` (" + ', '.join(f'`{name}`' for name in column_names) + ") "
+        "VALUES (" + ', '.join(['%s'] * len(column_names)) + ")"
+    )
+
+    if vendor == 'mysql':
+        # DDL은 자동 커밋되므로 RENAME TABLE로 원자적 교체
+        new_table, old_table = f'{table}_new', f'{table}_old'
+        cursor.execute(f'DROP TABLE IF EXISTS `{new_table}`')
+        for statement in create_statements(new_table):
+            cursor.execute(statement)
+        if rows:
+            cursor.executemany(insert_sql.format(table=new_table), rows)
+        cursor.execute('SHOW TABLES LIKE %s', [table])
+        if cursor.fetchone() is not None:
+            cursor.execute(f'RENAME TABLE `{table}` TO `{old_table}`, `{new_table}` TO `{table}`')
+            cursor.execute(f'DROP TABLE `{old_table}`')
+        else:
+            cursor.execute(f'RENAME TABLE `{new_table}` TO `{table}`')
+    else:
+        cursor.execute(f'DROP TABLE IF EXISTS `{table}`')
+        for statement in create_statements(table):
+            cursor.execute(statement)
+        if rows:
+            cursor.executemany(insert_sql.format(table=table), rows)
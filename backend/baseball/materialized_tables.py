@@ -0,0 +1,38 @@
+"""
+업로드 후 크롤링 테이블에서 다시 만드는 구체화 테이블 목록
+
+sql_script/upload.py, build_materialized 명령, 부하 테스트 데이터 / 테스트 고정 데이터가 같은 목록을 순서대로 다시 만든다.
+새 구체화 테이블은 여기에만 추가하면 된다.
+
+이 모듈은 Django 설정 없이도 import 가능해야 한다 (업로드 스크립트에서 pymysql 커서로 사용).
+"""
+
+from .hitter_positions import MATERIALIZED_TABLE, rebuild_hitters_with_positions
+from .league_ratings import RATINGS_TABLE, rebuild_player_ratings
+from .recent_form import FORM_TABLE, rebuild_recent_form
+
+# (테이블, 다시 만드는 함수 (cursor, vendor) → 행 수)
+MATERIALIZED_TABLES = [
+    (MATERIALIZED_TABLE, rebuild_hitters_with_positions),  # 타자 + 포지션 (API가 JOIN 없이 읽음)
+    (RATINGS_TABLE, rebuild_player_ratings),  # 선수별 리그 백분위 능력치
+    (FORM_TABLE, rebuild_recent_form),  # 선수별 최근 3 / 5 / 10경기 기록
+]
+
+MATERIALIZED_TABLE_NAMES = [table for table, _ in MATERIALIZED_TABLES]
+
+
+def rebuild_materialized(cursor, vendor='mysql', tables=None):
+    """
+    구체화 테이블을 순서대로 다시 만든다
+
+    Args:
+        cursor: DB-API 커서 (Django connection.cursor() 또는 pymysql 커서)
+        vendor: 'mysql' 또는 'sqlite'
+        tables: 다시 만들 테이블명 목록 (None이면 전체)
+
+    Yields:
+        (테이블명, 저장한 행 수)
+    """
+    for table, rebuild in MATERIALIZED_TABLES:
+        if tables is None or table in tables:
+            yield table, rebuild(cursor, vendor)
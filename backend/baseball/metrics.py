@@ -0,0 +1,285 @@
+"""
+API 엔드포인트별 지표 (Prometheus 텍스트 형식, GET /metrics)
+
+MetricsMiddleware가 요청마다 다음 값을 모아 엔드포인트(URL 패턴)별로 누적한다.
+- 응답 시간 히스토그램
+- DB 쿼리 수 / 시간 (Django 연결 execute_wrapper + 비동기 aiomysql 조회)
+- 캐시 적중 / 미스 (인메모리 스냅샷 + 선수별 Django 캐시)
+- 응답 크기 히스토그램
+
+요청 중 수집 값은 contextvars로 전달되므로 스레드(sync_to_async)로 넘어간 DB 조회도 같은 요청에 집계된다.
+지표는 프로세스별로 보관된다 (gunicorn 워커가 여러 개면 워커마다 따로 집계).
+
+이 모듈은 Django 설정 없이도 import 가능해야 한다 (snapshots.py에서 사용).
+"""
+
+import contextvars
+import hmac
+import threading
+import time
+
+# 응답 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# 응답 크기 히스토그램 구간 (바이트)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 현재 요청의 수집 값 (요청 밖에서는 None)
+_current = contextvars.ContextVar('request_metrics', default=None)
+
+
+class RequestStats:
+    """요청 하나의 DB / 캐시 수집 값"""
+    __slots__ = ('queries', 'query_seconds', 'cache_hits', 'cache_misses')
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+def record_query(seconds):
+    """DB 쿼리 한 번 (요청 밖이면 무시)"""
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += seconds
+
+
+def record_cache(hits=0, misses=0):
+    """캐시 조회 결과 (요청 밖이면 무시)"""
+    stats = _current.get()
+    if stats is not None:
+        stats.cache_hits += hits
+        stats.cache_misses += misses
+
+
+def query_timer(execute, sql, params, many, context):
+    """Django 연결 execute_wrapper: 쿼리 수 / 시간 기록"""
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        record_query(time.perf_counter() - started)
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """connection_created 시그널 → 새 DB 연결마다 쿼리 타이머 설치"""
+    if query_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_timer)
+
+
+class Histogram:
+    __slots__ = ('buckets', 'counts', 'total', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.total += value
+        self.count += 1
+
+    def lines(self, name, labels):
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield f'{name}_bucket{_labels(labels, le=_number(bound))} {cumulative}'
+        yield f'{name}_bucket{_labels(labels, le="+Inf")} {self.count}'
+        yield f'{name}_sum{_labels(labels)} {_number(self.total)}'
+        yield f'{name}_count{_labels(labels)} {self.count}'
+
+
+class EndpointMetrics:
+    """엔드포인트 하나의 누적 지표"""
+
+    def __init__(self):
+        self.requests = {}  # (method, status) → 요청 수
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def observe(self, endpoint, method, status, seconds, size, stats):
+        with self._lock:
+            metrics = self._endpoints.get(endpoint)
+            if metrics is None:
+                metrics = self._endpoints[endpoint] = EndpointMetrics()
+            key = (method, str(status))
+            metrics.requests[key] = metrics.requests.get(key, 0) + 1
+            metrics.latency.observe(seconds)
+            if size is not None:
+                metrics.response_bytes.observe(size)
+            metrics.queries += stats.queries
+            metrics.query_seconds += stats.query_seconds
+            metrics.cache_hits += stats.cache_hits
+            metrics.cache_misses += stats.cache_misses
+
+    def clear(self):
+        with self._lock:
+            self._endpoints = {}
+
+    def render(self):
+        """Prometheus 텍스트 형식"""
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            lines = [
+                '# HELP nineup_http_requests_total API 요청 수',
+                '# TYPE nineup_http_requests_total counter',
+            ]
+            for endpoint, metrics in endpoints:
+                for (method, status), count in sorted(metrics.requests.items()):
+                    lines.append(
+                        f'nineup_http_requests_total{_labels({"endpoint": endpoint, "method": method, "status": status})} {count}'
+                    )
+
+            lines += [
+                '# HELP nineup_http_request_duration_seconds API 응답 시간',
+                '# TYPE nineup_http_request_duration_seconds histogram',
+            ]
+            for endpoint, metrics in endpoints:
+                lines += metrics.latency.lines('nineup_http_request_duration_seconds', {'endpoint': endpoint})
+
+            lines += [
+                '# HELP nineup_http_response_size_bytes API 응답 본문 크기 (압축 후)',
+                '# TYPE nineup_http_response_size_bytes histogram',
+            ]
+            for endpoint, metrics in endpoints:
+                lines += metrics.response_bytes.lines('nineup_http_response_size_bytes', {'endpoint': endpoint})
+
+            lines += [
+                '# HELP nineup_db_queries_total 요청 처리 중 실행한 DB 쿼리 수',
+                '# TYPE nineup_db_queries_total counter',
+            ]
+            lines += [
+                f'nineup_db_queries_total{_labels({"endpoint": endpoint})} {metrics.queries}'
+                for endpoint, metrics in endpoints
+            ]
+            lines += [
+                '# HELP nineup_db_query_seconds_total 요청 처리 중 DB 쿼리 시간 합계',
+                '# TYPE nineup_db_query_seconds_total counter',
+            ]
+            lines += [
+                f'nineup_db_query_seconds_total{_labels({"endpoint": endpoint})} {_number(metrics.query_seconds)}'
+                for endpoint, metrics in endpoints
+            ]
+            lines += [
+                '# HELP nineup_cache_requests_total 캐시 조회 수 (스냅샷 + 선수별 캐시, result=hit|miss)',
+                '# TYPE nineup_cache_requests_total counter',
+            ]
+            for endpoint, metrics in endpoints:
+                lines.append(f'nineup_cache_requests_total{_labels({"endpoint": endpoint, "result": "hit"})} {metrics.cache_hits}')
+                lines.append(f'nineup_cache_requests_total{_labels({"endpoint": endpoint, "result": "miss"})} {metrics.cache_misses}')
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _labels(labels, **extra):
+    items = {**labels, **extra}
+    escaped = (
+        f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for key, value in items.items()
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+def endpoint_label(request):
+    """엔드포인트 이름 = URL 패턴 (예: api/players/<int:player_id>/profile/), 없으면 'unmatched'"""
+    match = getattr(request, 'resolver_match', None)
+    if match is None or match.route is None:
+        return 'unmatched'
+    return '/' + match.route
+
+
+def response_size(response):
+    if getattr(response, 'streaming', False):
+        return None
+    return len(response.content)
+
+
+class MetricsMiddleware:
+    """
+    요청별 지표 수집 (동기 / 비동기 모두 지원 - ASGI에서도 스레드 전환 없음)
+    settings.MIDDLEWARE 맨 앞에 두어 다른 미들웨어 시간까지 포함한다
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._observe(request, response, time.perf_counter() - started, stats)
+        return response
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._observe(request, response, time.perf_counter() - started, stats)
+        return response
+
+    def _observe(self, request, response, seconds, stats):
+        REGISTRY.observe(
+            endpoint_label(request), request.method, response.status_code,
+            seconds, response_size(response), stats,
+        )
+
+
+def metrics_allowed(request):
+    """허용 주소(METRICS_ALLOWED_IPS)에서 온 요청 또는 토큰(METRICS_TOKEN)이 맞는 요청인지"""
+    from django.conf import settings
+
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    if token and hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return True
+    return request.META.get('REMOTE_ADDR') in getattr(settings, 'METRICS_ALLOWED_IPS', ())
+
+
+def metrics_view(request):
+    """GET /metrics - Prometheus 텍스트 형식 (허용되지 않은 요청은 404)"""
+    from django.http import HttpResponse, HttpResponseNotFound
+
+    if not metrics_allowed(request):
+        return HttpResponseNotFound()
+    return HttpResponse(REGISTRY.render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,237 @@
+"""
+선수명 자동완성 검색 인덱스 (한글 자모 / 초성 / 오타 허용)
+
+선수명을 자모 단위로 분해해 인덱스를 만든다.
+- 접두사: 자모열의 모든 접두사 → 선수 (입력 중인 글자도 일치, '김도여' → 김도영)
+- 초성: 초성열의 모든 접두사 → 선수 ('ㅇㅇㅈ' → 양의지)
+- 포함 / 오타: 자모 2-gram → 선수, 후보만 골라 포함 여부 / 편집 거리(자모 기준) 확인
+
+인덱스는 불변 객체로 교체된다. 데이터가 갱신되면 updated()가 바뀐 선수만 빼고 넣은
+새 인덱스를 만들고(바뀌지 않은 목록은 이전 인덱스와 공유), 요청은 항상 완성된 인덱스를 본다.
+"""
+
+DEFAULT_SEARCH_LIMIT = 10
+MAX_SEARCH_LIMIT = 50
+
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+             'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+# 겹모음 / 겹받침 → 입력 순서대로의 낱자 (입력 중인 '달'이 '닭'의 접두사가 되도록)
+COMPOUND_JAMO = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+}
+
+# 일치 종류 (순서 = 정렬 우선순위)
+MATCH_KINDS = ('exact', 'prefix', 'initials', 'contains', 'typo')
+
+
+def normalize(text):
+    """공백 제거 + 소문자"""
+    return ''.join(str(text or '').split()).lower()
+
+
+def to_jamo(text):
+    """'양의지' → 'ㅇㅑㅇㅇㅡㅣㅈㅣ' (한글이 아닌 글자는 그대로)"""
+    jamo = []
+    for char in normalize(text):
+        code = ord(char)
+        if _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+            offset = code - _SYLLABLE_BASE
+            jamo.append(CHOSEONG[offset // 588])
+            jamo.append(JUNGSEONG[offset % 588 // 28])
+            jamo.append(JONGSEONG[offset % 28])
+        else:
+            jamo.append(char)
+    return ''.join(COMPOUND_JAMO.get(char, char) for char in ''.join(jamo))
+
+
+def to_initials(text):
+    """'양의지' → 'ㅇㅇㅈ' (한글이 아닌 글자는 그대로)"""
+    initials = []
+    for char in normalize(text):
+        code = ord(char)
+        if _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+            initials.append(CHOSEONG[(code - _SYLLABLE_BASE) // 588])
+        else:
+            initials.append(char)
+    return ''.join(initials)
+
+
+def is_initials(text):
+    """초성(자음)만으로 된 검색어인지"""
+    text = normalize(text)
+    return bool(text) and all(char in CHOSEONG for char in text)
+
+
+def bigrams(text):
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def max_typos(query_jamo):
+    """허용 오타 수 (자모 5개 미만(한 글자 남짓)은 오타 검색 안 함)"""
+    if len(query_jamo) < 5:
+        return 0
+    return 1 if len(query_jamo) < 9 else 2
+
+
+def edit_distance(a, b, limit):
+    """레벤슈타인 거리 (limit를 넘으면 limit + 1)"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def _keys(name):
+    """선수명 → (자모열, 초성열, 인덱스 토큰 목록)"""
+    jamo = to_jamo(name)
+    initials = to_initials(name)
+    tokens = (
+        [('prefix', jamo[:i]) for i in range(1, len(jamo) + 1)]
+        + [('initials', initials[:i]) for i in range(1, len(initials) + 1)]
+        + [('gram', gram) for gram in bigrams(jamo)]
+    )
+    return jamo, initials, tokens
+
+
+class PlayerSearchIndex:
+    """
+    선수 검색 인덱스
+
+    entries: 선수 키 → 선수 dict (name 필드로 검색)
+    postings: (종류, 토큰) → 선수 키 frozenset
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.keys = {}
+        self.postings = {}
+
+    @classmethod
+    def build(cls, players, key='id'):
+        return cls().updated(players, key)
+
+    def updated(self, players, key='id'):
+        """
+        players 목록을 반영한 새 인덱스 (이 인덱스는 바꾸지 않음)
+        추가 / 삭제 / 변경된 선수만 토큰 목록에서 빼고 넣는다
+        """
+        players = {player[key]: player for player in players}
+        index = PlayerSearchIndex()
+        index.entries = players
+        index.keys = dict(self.keys)
+        index.postings = dict(self.postings)
+
+        for player_key, player in self.entries.items():
+            if players.get(player_key) != player:
+                index._remove(player_key, player)
+        for player_key, player in players.items():
+            if self.entries.get(player_key) != player:
+                index._add(player_key, player)
+        return index
+
+    def _add(self, player_key, player):
+        jamo, initials, tokens = _keys(player['name'])
+        self.keys[player_key] = (normalize(player['name']), jamo, initials)
+        for token in tokens:
+            self.postings[token] = self.postings.get(token, frozenset()) | {player_key}
+
+    def _remove(self, player_key, player):
+        _, _, tokens = _keys(player['name'])
+        self.keys.pop(player_key, None)
+        for token in tokens:
+            remaining = self.postings.get(token, frozenset()) - {player_key}
+            if remaining:
+                self.postings[token] = remaining
+            else:
+                self.postings.pop(token, None)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def search(self, query, limit=DEFAULT_SEARCH_LIMIT):
+        """
+        검색어와 일치하는 선수 목록 (일치 종류 순 → 이름 길이 → 이름 순)
+
+        Returns:
+            [{...선수 dict, "match": "exact" | "prefix" | "initials" | "contains" | "typo"}, ...]
+        """
+        text = normalize(query)
+        if not text:
+            return []
+        query_jamo = to_jamo(text)
+
+        ranked = {}
+
+        def rank(player_keys, kind, distance=0):
+            order = (MATCH_KINDS.index(kind), distance)
+            for player_key in player_keys:
+                if player_key not in ranked or order < ranked[player_key][0]:
+                    ranked[player_key] = (order, kind)
+
+        prefix_keys = self.postings.get(('prefix', query_jamo), frozenset())
+        rank((k for k in prefix_keys if self.keys[k][0] == text), 'exact')
+        rank(prefix_keys, 'prefix')
+        if is_initials(text):
+            rank(self.postings.get(('initials', text), frozenset()), 'initials')
+
+        # 2-gram이 충분히 겹치는 선수만 후보 (오타 하나는 2-gram을 최대 2개 바꿈)
+        grams = bigrams(query_jamo)
+        limit_typos = max_typos(query_jamo)
+        hits = {}
+        for gram in grams:
+            for player_key in self.postings.get(('gram', gram), ()):
+                hits[player_key] = hits.get(player_key, 0) + 1
+        min_hits = max(1, len(grams) - 2 * limit_typos)
+        candidates = {player_key for player_key, count in hits.items() if count >= min_hits}
+        for player_key in candidates - ranked.keys():
+            _, jamo, _ = self.keys[player_key]
+            if query_jamo in jamo:
+                rank([player_key], 'contains')
+                continue
+            if limit_typos:
+                # 전체 이름 또는 같은 길이의 앞부분과 비교 (입력 중인 이름의 오타)
+                distance = min(
+                    edit_distance(query_jamo, jamo, limit_typos),
+                    edit_distance(query_jamo, jamo[:len(query_jamo)], limit_typos),
+                )
+                if distance <= limit_typos:
+                    rank([player_key], 'typo', distance)
+
+        ordered = sorted(
+            ranked.items(),
+            key=lambda item: (item[1][0], len(self.keys[item[0]][0]), self.keys[item[0]][0], str(item[0])),
+        )
+        return [{**self.entries[player_key], 'match': kind} for player_key, (_, kind) in ordered[:limit]]
+
+
+def parse_search_params(params):
+    """검색 파라미터 → (검색어, limit), 잘못된 요청이면 ValueError"""
+    query = (params.get('q') or '').strip()
+    if not query:
+        raise ValueError('q 파라미터가 필요합니다.')
+    try:
+        limit = int(params.get('limit') or DEFAULT_SEARCH_LIMIT)
+    except ValueError:
+        raise ValueError('limit은 숫자여야 합니다.')
+    if not 1 <= limit <= MAX_SEARCH_LIMIT:
+        raise ValueError(f'limit은 1 ~ {MAX_SEARCH_LIMIT} 사이여야 합니다.')
+    return query, limit
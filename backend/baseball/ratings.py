@@ -0,0 +1,134 @@
+"""
+선수 오각형 능력치 계산 (0-100 스케일)
+
+components/profile.tsx가 클라이언트에서 계산하던 playerAbilities와 같은 공식을 사용한다
+(player_ratings 테이블이 없을 때 /api/mysql-players/ 가 대신 사용, 프로필 화면은 서버 값을 그대로 표시).
+- 타자: 파워, 정확도, 득점력, 수비, 체력
+- 투수: 제구, 탈삼진 능력, 피안타 억제력, 위기관리, 체력
+
+입력은 /api/mysql-players/ 응답의 선수 dict 형식이다.
+"""
+
+import math
+
+HITTER_AXES = [
+    ('power', '파워'),
+    ('accuracy', '정확도'),
+    ('scoring', '득점력'),
+    ('defense', '수비'),
+    ('stamina', '체력'),
+]
+
+PITCHER_AXES = [
+    ('control', '제구'),
+    ('strikeouts', '탈삼진 능력'),
+    ('hit_suppression', '피안타 억제력'),
+    ('clutch', '위기관리'),
+    ('stamina', '체력'),
+]
+
+# 능력치 척도 (한 응답의 선수는 모두 같은 척도)
+LEAGUE_PERCENTILE_SCALE = 'league_percentile'  # 같은 유형 선수 전체에서의 백분위 (player_ratings 테이블)
+FIXED_SCALE = 'fixed'  # 고정 상한 공식 (이 모듈)
+
+
+def js_round(value):
+    """JavaScript Math.round와 같은 반올림 (0.5는 올림)"""
+    return int(math.floor(value + 0.5))
+
+
+def clamp(value, low=0.0, high=100.0):
+    return max(low, min(high, value))
+
+
+def _inverse_normalize(value, low, high):
+    """낮을수록 좋은 값을 0-100으로 변환 (low 이하 100, high 이상 0)"""
+    if value <= low:
+        return 100.0
+    if value >= high:
+        return 0.0
+    return (high - value) / (high - low) * 100
+
+
+def hitter_ratings(player):
+    """타자 능력치 {power, accuracy, scoring, defense, stamina}"""
+    at_bats = player.get('at_bats') or 0
+    tb_minus_h = (player.get('total_bases') or 0) - (player.get('hits') or 0)
+
+    # 파워: (TB-H)/AB 0-0.350 → 0-100 (타수가 없으면 홈런 기준)
+    if at_bats > 0:
+        power = min(100, (tb_minus_h / at_bats) / 0.350 * 100)
+    else:
+        power = min(100, (player.get('home_runs') or 0) / 50 * 100)
+
+    # 정확도: 타율 0-0.400 → 0-100
+    accuracy = min(100, (player.get('batting_average') or 0) / 0.400 * 100)
+
+    # 득점력: 득점 0-100 (stolen_bases 필드에 득점이 들어 있음)
+    scoring = min(100, (player.get('stolen_bases') or 0) / 100 * 100)
+
+    # 수비: 수비율 0.850-1.000 → 0-100 (수비율이 없으면 정확도/파워로 추정)
+    fielding_percentage = player.get('fielding_percentage')
+    if fielding_percentage:
+        defense = clamp((fielding_percentage - 0.850) / 0.150 * 100)
+    else:
+        defense = accuracy * 0.6 + power * 0.4
+
+    # 체력: 타수 0-600 → 0-100
+    stamina = min(100, at_bats / 600 * 100)
+
+    return {
+        'power': js_round(power),
+        'accuracy': js_round(accuracy),
+        'scoring': js_round(scoring),
+        'defense': js_round(defense),
+        'stamina': js_round(stamina),
+    }
+
+
+def pitcher_ratings(player):
+    """투수 능력치 {control, strikeouts, hit_suppression, clutch, stamina}"""
+    innings = player.get('innings_pitched') or 0
+    walks = player.get('walks')
+
+    # 제구: 9이닝당 볼넷 0-12 → 100-0 (완만한 곡선)
+    bb_per_9 = walks * 9 / innings if innings > 0 and walks is not None else 3.0
+    normalized = clamp((12.0 - bb_per_9) / 12.0, 0.0, 1.0)
+    control = clamp(normalized ** 0.7 * 100)
+
+    # 탈삼진 능력: 탈삼진 0-200 → 0-100
+    strikeouts = min(100, (player.get('strikeouts') or 0) / 200 * 100)
+
+    # 피안타 억제력: 제구 60% + 탈삼진 40%
+    hit_suppression = control * 0.6 + strikeouts * 0.4
+
+    # 위기관리: WHIP + ERA 0.5-10 → 100-0
+    clutch = _inverse_normalize((player.get('whip') or 0) + (player.get('era') or 0), 0.5, 10)
+
+    # 체력: 이닝 0-150 → 0-100
+    stamina = min(100, innings / 150 * 100)
+
+    return {
+        'control': js_round(control),
+        'strikeouts': js_round(strikeouts),
+        'hit_suppression': js_round(hit_suppression),
+        'clutch': js_round(clutch),
+        'stamina': js_round(stamina),
+    }
+
+
+def rating_axes(player_type, values, scale=FIXED_SCALE):
+    """능력치 값 dict → 응답 형식 {type, scale, axes: [{key, label, value}, ...]}"""
+    axes = PITCHER_AXES if player_type == 'pitcher' else HITTER_AXES
+    return {
+        'type': player_type,
+        'scale': scale,
+        'axes': [{'key': key, 'label': label, 'value': values[key]} for key, label in axes],
+    }
+
+
+def player_ratings(player):
+    """선수 포지션에 맞는 고정 상한 능력치 {type, scale, axes: [{key, label, value}, ...]}"""
+    if player.get('position') == 'pitcher':
+        return rating_axes('pitcher', pitcher_ratings(player))
+    return rating_axes('hitter', hitter_ratings(player))
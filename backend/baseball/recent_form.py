@@ -0,0 +1,290 @@
+"""
+최근 폼 테이블 (player_recent_form)
+
+경기 로그(hitter_recent_games_log / pitcher_recent_games_log)에서 선수별 최근 3 / 5 / 10경기 기록을
+데이터를 올릴 때(sql_script/upload.py, build_materialized 명령) 한 번 계산해 둔다.
+/api/hot-players/는 이 테이블을 (유형, 경기 수, 기록) 인덱스 순서로 한 번만 읽는다.
+
+- 타자: AVG = H/AB, OPS = (H+BB+HBP)/(AB+BB+HBP) + (H+2B+2×3B+3×HR)/AB (경기 로그에 SF 없음)
+- 투수: ERA = ER×9/IP, WHIP = (H+BB)/IP
+- 선수 + 경기 수마다 한 행 (해당 경기 수만큼 뛰지 않은 선수는 행 없음)
+- 상위 선수는 표본 하한(경기당 타수 / 이닝 × 경기 수) 이상인 선수만 (대타 / 원포인트 등판으로 순위가 튀지 않도록)
+- 선수별 최근 경기 순서 / 합계는 전체 로그 배열에 한 번에 계산 (NumPy 정렬 + bincount, 없으면 파이썬)
+
+이 모듈은 Django 설정 없이도 import 가능해야 한다 (업로드 스크립트에서 pymysql 커서로 사용).
+"""
+
+import math
+
+from .hitter_positions import to_int
+from .materialize import replace_table
+from .stat_store import parse_ip
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy가 없으면 파이썬 목록으로 계산 (결과는 같음)
+    np = None
+
+FORM_TABLE = 'player_recent_form'
+
+# 최근 경기 수
+FORM_WINDOWS = (3, 5, 10)
+
+# 유형별 경기 로그 테이블, 합계를 내는 컬럼
+FORM_LOG_TABLES = {
+    'hitter': ('hitter_recent_games_log', ['AB', 'H', '2B', '3B', 'HR', 'BB', 'HBP']),
+    'pitcher': ('pitcher_recent_games_log', ['IP', 'H', 'BB', 'ER']),
+}
+
+# 최근 폼 상위 선수 정렬: 유형 → [(기록, 내림차순 여부), 동률 기준, ...]
+HOT_ORDER = {
+    'hitter': [('OPS', True), ('AVG', True)],
+    'pitcher': [('ERA', False), ('WHIP', False)],
+}
+
+# 응답 기록 컬럼
+RESULT_COLUMNS = {
+    'hitter': ['AB', 'AVG', 'OPS'],
+    'pitcher': ['IP', 'ERA', 'WHIP'],
+}
+
+# 최근 폼 상위 선수 표본 하한: 유형 → (기록, 경기당 최소값) - 최근 경기 수를 곱해 비교
+HOT_MIN_PER_GAME = {
+    'hitter': ('AB', 2),
+    'pitcher': ('IP', 1),
+}
+
+DEFAULT_HOT_LIMIT = 10
+MAX_HOT_LIMIT = 50
+
+COLUMNS = [
+    ('player_id', 'INT'),
+    ('type', 'VARCHAR(10)'),
+    ('선수명', 'VARCHAR(50)'),
+    ('last_n', 'INT'),
+    ('AB', 'INT'),
+    ('IP', 'DOUBLE'),
+    ('AVG', 'DOUBLE'),
+    ('OPS', 'DOUBLE'),
+    ('ERA', 'DOUBLE'),
+    ('WHIP', 'DOUBLE'),
+]
+COLUMN_NAMES = [name for name, _ in COLUMNS]
+
+
+def _fetch(cursor, sql):
+    cursor.execute(sql)
+    names = [col[0] for col in cursor.description]
+    return [row if isinstance(row, dict) else dict(zip(names, row)) for row in cursor.fetchall()]
+
+
+def game_recency(groups, dates):
+    """
+    행별 최근 경기 순서 (선수마다 가장 최근 경기가 0, 같은 일자는 나중 행이 최근)
+
+    Args:
+        groups: 행별 선수 번호
+        dates: 행별 일자 (정렬 가능한 문자열, 'MM.DD' 또는 'YYYY-MM-DD')
+    """
+    if np is not None:
+        groups = np.asarray(groups, dtype=np.intp)
+        sequence = np.arange(len(groups))
+        _, date_codes = np.unique(np.asarray(dates, dtype=str), return_inverse=True)
+        # 선수 오름차순 → 일자 내림차순 → 행 순서 내림차순
+        order = np.lexsort((-sequence, -date_codes.reshape(-1), groups))
+        sorted_groups = groups[order]
+        recency = np.empty(len(groups), dtype=np.intp)
+        recency[order] = sequence - np.searchsorted(sorted_groups, sorted_groups)
+        return recency
+
+    recency = [0] * len(groups)
+    by_group = {}
+    for index, group in enumerate(groups):
+        by_group.setdefault(group, []).append(index)
+    for indexes in by_group.values():
+        indexes.sort(key=lambda index: (dates[index], index), reverse=True)
+        for position, index in enumerate(indexes):
+            recency[index] = position
+    return recency
+
+
+def window_sums(groups, recency, values, window, group_count):
+    """선수별 최근 window경기 합계 (values가 None이면 경기 수)"""
+    if np is not None:
+        selected = np.asarray(recency) < window
+        weights = None if values is None else np.asarray(values)[selected]
+        groups = np.asarray(groups, dtype=np.intp)[selected]
+        return np.bincount(groups, weights=weights, minlength=group_count).astype(np.float64)
+
+    sums = [0.0] * group_count
+    for index, group in enumerate(groups):
+        if recency[index] < window:
+            sums[group] += 1.0 if values is None else values[index]
+    return sums
+
+
+def _ratio(numerator, denominator, digits):
+    if denominator <= 0:
+        return None
+    return round(numerator / denominator, digits)
+
+
+def form_records(kind, games):
+    """
+    한 유형의 경기 로그 → 최근 폼 행 dict 목록 (COLUMN_NAMES 키)
+
+    Args:
+        kind: 'hitter' 또는 'pitcher'
+        games: 경기 로그 행 (player_id, 선수명, 일자, 합계 컬럼)
+    """
+    _, columns = FORM_LOG_TABLES[kind]
+    players, groups = {}, []
+    for game in games:
+        key = (str(game.get('player_id') or '').strip(), game['선수명'])
+        groups.append(players.setdefault(key, len(players)))
+    dates = [str(game.get('일자') or '') for game in games]
+
+    def number(game, column):
+        if column == 'IP':
+            return parse_ip(game.get('IP'))
+        return float(to_int(game.get(column)) or 0)
+
+    values = {column: [number(game, column) for game in games] for column in columns}
+    if np is not None:
+        values = {column: np.asarray(column_values, dtype=np.float64) for column, column_values in values.items()}
+
+    recency = game_recency(groups, dates)
+    records = []
+    for window in FORM_WINDOWS:
+        counts = window_sums(groups, recency, None, window, len(players))
+        totals = {column: window_sums(groups, recency, values[column], window, len(players)) for column in columns}
+        for (player_id, name), group in players.items():
+            if counts[group] < window:
+                continue
+            total = {column: float(totals[column][group]) for column in columns}
+            record = dict.fromkeys(COLUMN_NAMES)
+            record.update({'player_id': to_int(player_id), 'type': kind, '선수명': name, 'last_n': window})
+            if kind == 'hitter':
+                on_base = total['H'] + total['BB'] + total['HBP']
+                total_bases = total['H'] + total['2B'] + 2 * total['3B'] + 3 * total['HR']
+                obp = _ratio(on_base, total['AB'] + total['BB'] + total['HBP'], 6)
+                slg = _ratio(total_bases, total['AB'], 6)
+                record.update({
+                    'AB': int(total['AB']),
+                    'AVG': _ratio(total['H'], total['AB'], 3),
+                    'OPS': round(obp + slg, 3) if obp is not None and slg is not None else None,
+                })
+            else:
+                record.update({
+                    'IP': round(total['IP'], 3),
+                    'ERA': _ratio(total['ER'] * 9, total['IP'], 2),
+                    'WHIP': _ratio(total['H'] + total['BB'], total['IP'], 2),
+                })
+            records.append(record)
+    return records
+
+
+def form_rows(cursor):
+    """경기 로그 테이블 → 최근 폼 테이블 행 목록 (COLUMN_NAMES 순서)"""
+    rows = []
+    for kind, (table, columns) in FORM_LOG_TABLES.items():
+        select_columns = ', '.join(f'`{column}`' for column in ['player_id', '선수명', '일자'] + columns)
+        games = _fetch(cursor, f"SELECT {select_columns} FROM `{table}`")
+        rows.extend([record[name] for name in COLUMN_NAMES] for record in form_records(kind, games))
+    return rows
+
+
+def create_statements(table, vendor):
+    column_defs = ', '.join(f'`{name}` {sql_type}' for name, sql_type in COLUMNS)
+    if vendor == 'mysql':
+        return [
+            f"CREATE TABLE `{table}` ({column_defs}, "
+            f"UNIQUE KEY `uq_type_window_player` (`type`, `last_n`, `player_id`, `선수명`), "
+            f"KEY `idx_hot_hitters` (`type`, `last_n`, `OPS`, `AVG`), "
+            f"KEY `idx_hot_pitchers` (`type`, `last_n`, `ERA`, `WHIP`)"
+            f") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+        ]
+    return [
+        f"CREATE TABLE `{table}` ({column_defs}, UNIQUE (`type`, `last_n`, `player_id`, `선수명`))",
+        f'CREATE INDEX `idx_{table}_hot_hitters` ON `{table}` (`type`, `last_n`, `OPS`, `AVG`)',
+        f'CREATE INDEX `idx_{table}_hot_pitchers` ON `{table}` (`type`, `last_n`, `ERA`, `WHIP`)',
+    ]
+
+
+def rebuild_recent_form(cursor, vendor='mysql'):
+    """
+    경기 로그 테이블에서 최근 폼 테이블을 다시 만든다
+
+    Args:
+        cursor: DB-API 커서 (Django connection.cursor() 또는 pymysql 커서)
+        vendor: 'mysql' 또는 'sqlite'
+
+    Returns:
+        저장한 행 수
+    """
+    rows = form_rows(cursor)
+    replace_table(cursor, FORM_TABLE, lambda table: create_statements(table, vendor), COLUMN_NAMES, rows, vendor)
+    return len(rows)
+
+
+def parse_hot_params(params):
+    """
+    최근 폼 상위 선수 파라미터 → (선수 유형, 최근 경기 수, limit)
+    잘못된 요청이면 ValueError
+    """
+    kind = params.get('type') or 'hitter'
+    if kind not in HOT_ORDER:
+        raise ValueError("type은 'hitter' 또는 'pitcher'여야 합니다.")
+
+    try:
+        window = int(params.get('games') or FORM_WINDOWS[1])
+        limit = int(params.get('limit') or DEFAULT_HOT_LIMIT)
+    except ValueError:
+        raise ValueError('games와 limit은 숫자여야 합니다.')
+    if window not in FORM_WINDOWS:
+        raise ValueError(f"games는 {', '.join(map(str, FORM_WINDOWS))} 중 하나여야 합니다.")
+    if not 1 <= limit <= MAX_HOT_LIMIT:
+        raise ValueError(f'limit은 1 ~ {MAX_HOT_LIMIT} 사이여야 합니다.')
+
+    return kind, window, limit
+
+
+def hot_min_sample(kind, window):
+    """최근 폼 상위 선수 표본 하한 (기록, 최소값)"""
+    column, per_game = HOT_MIN_PER_GAME[kind]
+    return column, per_game * window
+
+
+def hot_players_query(kind, window, limit):
+    """최근 폼 상위 선수 쿼리 (sql, params) - (type, last_n, 기록) 인덱스 순서로 limit행만 읽음"""
+    order = HOT_ORDER[kind]
+    sample_column, minimum = hot_min_sample(kind, window)
+    select_columns = ', '.join(f'`{column}`' for column in ['player_id', '선수명'] + RESULT_COLUMNS[kind])
+    order_by = ', '.join(f"`{column}` {'DESC' if descending else 'ASC'}" for column, descending in order)
+    sql = f"""
+        SELECT {select_columns}
+        FROM `{FORM_TABLE}`
+        WHERE `type` = %s AND `last_n` = %s AND `{order[0][0]}` IS NOT NULL AND `{sample_column}` >= %s
+        ORDER BY {order_by}
+        LIMIT %s
+    """
+    return sql, [kind, window, minimum, limit]
+
+
+def hot_players_from_rows(rows, kind, window, limit):
+    """최근 폼 행 목록에서 상위 선수 (테이블이 없을 때 쓰는 hot_players_query와 같은 결과)"""
+    order = HOT_ORDER[kind]
+    sample_column, minimum = hot_min_sample(kind, window)
+    records = [dict(zip(COLUMN_NAMES, row)) for row in rows]
+    records = [
+        record for record in records
+        if record['type'] == kind and record['last_n'] == window and record[order[0][0]] is not None
+        and record[sample_column] is not None and record[sample_column] >= minimum
+    ]
+    for column, descending in reversed(order):
+        records.sort(key=lambda record: -math.inf if record[column] is None else record[column], reverse=descending)
+    return [
+        {column: record[column] for column in ['player_id', '선수명'] + RESULT_COLUMNS[kind]}
+        for record in records[:limit]
+    ]
@@ -0,0 +1,69 @@
+"""
+컬럼형(columns + rows) 응답 형식
+
+선수 목록처럼 같은 키가 반복되는 응답에서 키 이름을 한 번만 보내고 값은 배열로 보낸다.
+- ?format=columnar            → JSON  {"columns": [...], "rows": [[...], ...]}
+- ?format=msgpack 또는 Accept: application/x-msgpack → 같은 구조를 MessagePack으로
+
+msgpack 패키지가 없으면 MessagePack 형식은 제공하지 않는다.
+"""
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import msgpack
+except ImportError:
+    # msgpack 패키지가 없으면 컬럼형 JSON만 사용
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = 'application/x-msgpack'
+
+
+def to_columnar(value):
+    """
+    dict 리스트를 {"columns": [...], "rows": [[...], ...]}로 변환
+    - dict 안의 dict 리스트도 변환 ({"pitcher": [...]} → {"pitcher": {"columns", "rows"}})
+    - 페이지 응답은 results만 변환
+    """
+    if isinstance(value, list):
+        if not all(isinstance(row, dict) for row in value):
+            return value
+        columns = list(value[0].keys()) if value else []
+        return {
+            'columns': columns,
+            'rows': [[row.get(column) for column in columns] for row in value],
+        }
+    if isinstance(value, dict):
+        return {key: to_columnar(item) if isinstance(item, list) else item for key, item in value.items()}
+    return value
+
+
+def pack_msgpack(value):
+    return msgpack.packb(value, use_bin_type=True)
+
+
+class ColumnarJSONRenderer(JSONRenderer):
+    """?format=columnar - 컬럼형 JSON"""
+    format = 'columnar'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return super().render(to_columnar(data), accepted_media_type, renderer_context)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """?format=msgpack 또는 Accept: application/x-msgpack - 컬럼형 MessagePack"""
+    media_type = MSGPACK_MEDIA_TYPE
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return pack_msgpack(to_columnar(data))
+
+
+# 목록 API에서 사용할 렌더러 (기본 JSON + 컬럼형)
+LIST_RENDERER_CLASSES = [JSONRenderer, ColumnarJSONRenderer]
+if msgpack is not None:
+    LIST_RENDERER_CLASSES.append(MessagePackRenderer)
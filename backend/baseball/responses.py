@@ -0,0 +1,138 @@
+"""
+스냅샷 기반 JSON 응답 (미리 인코딩 + 압축 + ETag/304)
+
+스냅샷 값(baseball/snapshots.py)을 데이터 버전당 한 번만 JSON(또는 MessagePack) 바이트로 직렬화하고
+gzip/brotli 압축본도 함께 만들어 둔다. 요청은 Accept-Encoding에 맞는 바이트를 그대로 돌려주고,
+If-None-Match / If-Modified-Since가 현재 버전과 같으면 본문 없이 304를 반환한다.
+"""
+
+import gzip
+import hashlib
+import json
+
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework.utils.encoders import JSONEncoder
+
+from .renderers import MSGPACK_MEDIA_TYPE, pack_msgpack
+
+try:
+    import brotli
+except ImportError:
+    # brotli 패키지가 없으면 gzip만 사용
+    brotli = None
+
+# 이보다 작은 응답은 압축하지 않음 (압축 이득보다 헤더/CPU 비용이 큼)
+MIN_COMPRESS_SIZE = 1024
+
+
+def encode_json(value):
+    # DRF JSONRenderer와 같은 형식 (한글 그대로, 공백 없는 구분자)
+    return json.dumps(value, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+# 본문 형식 → (Content-Type, 인코딩 함수)
+BODY_FORMATS = {
+    'json': ('application/json', encode_json),
+    'msgpack': (MSGPACK_MEDIA_TYPE, pack_msgpack),
+}
+
+
+class EncodedPayload:
+    """인코딩된 본문(JSON/MessagePack)과 압축본, 캐시 검증 헤더 값"""
+
+    def __init__(self, value, built_at, body_format='json'):
+        self.content_type, encode = BODY_FORMATS[body_format]
+        self.body = encode(value)
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.last_modified = http_date(built_at)
+
+        # 인코딩별 본문과 ETag (강한 ETag는 표현(인코딩)마다 달라야 함)
+        self.variants = {None: (self.body, f'"{digest}"')}
+        if len(self.body) >= MIN_COMPRESS_SIZE:
+            if brotli is not None:
+                self.variants['br'] = (brotli.compress(self.body), f'"{digest}-br"')
+            self.variants['gzip'] = (gzip.compress(self.body, compresslevel=9, mtime=0), f'"{digest}-gzip"')
+
+        self.built_at = int(built_at)
+
+    def choose_encoding(self, accept_encoding):
+        """Accept-Encoding 헤더에 맞는 인코딩 선택 (br > gzip > 없음)"""
+        accepted = set()
+        for item in accept_encoding.split(','):
+            coding, _, params = item.partition(';')
+            params = params.strip()
+            quality = 1.0
+            if params.startswith('q='):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    pass
+            if quality > 0:
+                accepted.add(coding.strip().lower())
+
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and (encoding in accepted or '*' in accepted):
+                return encoding
+        return None
+
+    def is_not_modified(self, request, etag):
+        """
+        조건부 요청 헤더가 현재 버전과 일치하는지 확인
+
+        etag: 이번 요청에 보낼 인코딩의 ETag - 다른 인코딩의 ETag(예: gzip 본문을 캐시한 클라이언트가
+        br로 요청)는 클라이언트에 없는 표현이므로 일치로 보지 않는다.
+        """
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match is not None:
+            if if_none_match.strip() == '*':
+                return True
+            tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+            return etag in tags
+
+        if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+        return if_modified_since is not None and self.built_at <= if_modified_since
+
+
+# (스냅샷 이름, 본문 형식) → (SnapshotState, EncodedPayload)
+_encoded = {}
+
+
+def encode_snapshot(instance, state=None, body_format='json'):
+    """스냅샷의 현재 상태를 인코딩한 EncodedPayload 반환 (상태/형식당 한 번만 인코딩)"""
+    if state is None:
+        state = instance.get_state()
+    key = (instance.name, body_format)
+    cached = _encoded.get(key)
+    if cached is None or cached[0] is not state:
+        cached = (state, EncodedPayload(state.value, state.built_at, body_format))
+        _encoded[key] = cached
+    return cached[1]
+
+
+def snapshot_response(request, instance, state=None, body_format='json'):
+    """
+    스냅샷을 미리 인코딩된 본문으로 응답
+    - If-None-Match / If-Modified-Since 일치 시 304
+    - Accept-Encoding에 따라 br / gzip / 무압축 본문 선택
+    - state: 이미 조회한 SnapshotState (비동기 뷰에서 DB 조회 없이 응답할 때 사용)
+    - body_format: 'json' 또는 'msgpack'
+    """
+    payload = encode_snapshot(instance, state, body_format)
+    encoding = payload.choose_encoding(request.headers.get('Accept-Encoding', ''))
+    body, etag = payload.variants[encoding]
+
+    if payload.is_not_modified(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type=payload.content_type)
+        if encoding:
+            response['Content-Encoding'] = encoding
+
+    response['ETag'] = etag
+    response['Last-Modified'] = payload.last_modified
+    # 캐시는 하되 매번 ETag로 재검증
+    response['Cache-Control'] = 'no-cache'
+    # ?format= 외에 Accept 헤더로도 형식(MessagePack)을 고를 수 있음
+    response['Vary'] = 'Accept, Accept-Encoding'
+    return response
@@ -0,0 +1,137 @@
+"""
+인메모리 스냅샷 캐시
+
+크롤링 데이터는 크롤러/업로드 스크립트가 실행될 때만 바뀌므로,
+API 응답을 한 번 만들어 프로세스 메모리에 보관하고 데이터가 바뀌었을 때만 다시 만든다.
+
+- 데이터 버전: DATA_VERSION_FILE 의 수정 시각 (크롤러가 mark_data_changed()로 갱신)
+- 요청마다 os.stat 한 번으로 버전을 확인하고, 버전이 같으면 보관된 값을 그대로 반환
+- 재생성은 락 안에서 한 번만 실행되고, 완성된 상태를 한 번에 교체한다 (요청은 항상 완전한 스냅샷을 봄)
+
+이 모듈은 Django 설정 없이도 import 가능해야 한다 (크롤러 스크립트에서 사용).
+"""
+
+import os
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from .metrics import record_cache
+
+# 데이터 갱신 표시 파일 (backend/.data_version)
+DATA_VERSION_FILE = Path(__file__).resolve().parent.parent / '.data_version'
+
+SnapshotState = namedtuple('SnapshotState', ['version', 'built_at', 'value'])
+
+# 등록된 스냅샷 (이름 → Snapshot)
+SNAPSHOTS = {}
+
+
+def get_data_version():
+    """현재 데이터 버전 (갱신 표시 파일의 수정 시각, 파일이 없으면 0)"""
+    try:
+        return os.stat(DATA_VERSION_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+def mark_data_changed():
+    """
+    데이터가 갱신되었음을 표시 (크롤러/업로드 스크립트에서 DB 저장 후 호출)
+    모든 서버 프로세스의 스냅샷이 다음 요청에서 다시 만들어진다.
+    """
+    DATA_VERSION_FILE.touch()
+
+
+class Snapshot:
+    """
+    builder()의 결과를 데이터 버전별로 한 번만 만들어 보관하는 캐시
+    """
+
+    def __init__(self, name, builder):
+        self.name = name
+        self.builder = builder
+        self._state = None
+        self._lock = threading.Lock()
+
+    def get_state(self):
+        """현재 데이터 버전의 SnapshotState 반환 (필요하면 재생성)"""
+        version = get_data_version()
+        state = self._state
+        if state is not None and state.version == version:
+            record_cache(hits=1)
+            return state
+
+        record_cache(misses=1)
+        with self._lock:
+            # 락을 기다리는 동안 다른 스레드가 이미 만들었을 수 있음
+            state = self._state
+            if state is None or state.version != version:
+                started = time.perf_counter()
+                state = SnapshotState(version, time.time(), self.builder())
+                self._state = state
+                print(f"📦 스냅샷 생성: {self.name} ({(time.perf_counter() - started) * 1000:.1f}ms)")
+            return state
+
+    def current_state(self):
+        """재생성 없이 현재 데이터 버전의 SnapshotState 반환 (없거나 오래되었으면 None)"""
+        state = self._state
+        if state is not None and state.version == get_data_version():
+            record_cache(hits=1)
+            return state
+        return None
+
+    def is_current(self):
+        """현재 데이터 버전의 스냅샷이 있는지 (캐시 지표에 기록하지 않음, /readyz에서 사용)"""
+        state = self._state
+        return state is not None and state.version == get_data_version()
+
+    def last_value(self):
+        """데이터 버전과 관계없이 마지막으로 만든 값 (없으면 None, 빌더에서 증분 재생성에 사용)"""
+        state = self._state
+        return state.value if state is not None else None
+
+    def get(self):
+        """현재 데이터 버전의 스냅샷 값 반환"""
+        return self.get_state().value
+
+    def reload(self):
+        """데이터 버전과 관계없이 스냅샷을 다시 만들어 교체"""
+        with self._lock:
+            self._state = None
+        return self.get_state()
+
+    def clear(self):
+        """보관된 스냅샷 삭제 (다음 요청에서 다시 만들어짐)"""
+        with self._lock:
+            self._state = None
+
+
+def snapshot(name):
+    """
+    빌더 함수를 스냅샷으로 등록하는 데코레이터
+
+    @snapshot('mysql-players')
+    def players_by_position():
+        ...
+
+    players_by_position.get()  # 캐시된 값
+    """
+    def decorator(builder):
+        instance = Snapshot(name, builder)
+        SNAPSHOTS[name] = instance
+        return instance
+    return decorator
+
+
+def reload_all():
+    """등록된 모든 스냅샷을 다시 만든다"""
+    for instance in SNAPSHOTS.values():
+        instance.reload()
+
+
+def clear_all():
+    """등록된 모든 스냅샷 삭제"""
+    for instance in SNAPSHOTS.values():
+        instance.clear()
@@ -0,0 +1,280 @@
+"""
+2025 선수 목록 페이지 조회 (키셋 커서 페이지네이션 + 정렬 + 필드 선택 + 팀 필터)
+
+스냅샷에 보관된 행 목록 위에서 동작하며, 정렬 기준별 정렬 키 배열을 한 번만 만들어 둔다.
+다음 페이지는 커서(마지막 행의 정렬 값 + player_id) 다음 위치를 이진 탐색으로 찾으므로
+데이터가 갱신되어도 같은 커서로 이어서 조회할 수 있다.
+"""
+
+import base64
+import binascii
+import bisect
+import json
+import threading
+from datetime import date
+from decimal import Decimal
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# 숫자가 아닌 컬럼 (나머지 컬럼은 숫자로 정렬)
+TEXT_COLUMNS = {'player_id', '선수명'}
+
+# 숫자로 변환하지 않고 문자열 그대로 두는 컬럼 (이닝은 '158 1/3' 형식, 일자는 '09.04' 형식)
+# 일자는 DATE 컬럼(migrate_crawled_schema)이어도 응답에서는 '09.04' 형식
+KEEP_TEXT_COLUMNS = TEXT_COLUMNS | {'IP', '팀명', 'POS', '일자', '상대', '결과'}
+
+# 문자열로 정렬하는 컬럼 (이닝은 parse_ip로 숫자 정렬, '09.04' 형식 일자는 문자열 순서가 곧 날짜 순서)
+SORT_TEXT_COLUMNS = KEEP_TEXT_COLUMNS - {'IP'}
+
+
+# 목록 조회 파라미터 (하나라도 있으면 페이지 응답)
+LIST_QUERY_PARAMS = ('limit', 'cursor', 'sort', 'fields', 'team')
+
+
+class InvalidListQuery(ValueError):
+    """잘못된 목록 조회 파라미터"""
+
+
+def has_list_params(params):
+    """쿼리 파라미터(QueryDict)에 목록 조회 파라미터가 있는지"""
+    return any(params.get(name) for name in LIST_QUERY_PARAMS)
+
+
+def parse_list_params(params):
+    """쿼리 파라미터 → StatList.page() 인자"""
+    try:
+        limit = int(params.get('limit') or DEFAULT_PAGE_SIZE)
+    except ValueError:
+        raise InvalidListQuery('limit은 숫자여야 합니다.')
+    fields = [field.strip() for field in params.get('fields', '').split(',') if field.strip()]
+    return {
+        'sort': params.get('sort') or '선수명',
+        'cursor': params.get('cursor'),
+        'limit': limit,
+        'fields': fields or None,
+        'team': params.get('team') or None,
+    }
+
+
+def to_number(value):
+    """'0.337', '26', '-' 같은 문자열을 숫자로 변환 (변환 불가 시 None)"""
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_typed(value):
+    """
+    크롤링 문자열 값을 JSON 숫자로 변환
+    '26' → 26, '0.337' → 0.337, '' / '-' → None
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    if text in ('', '-'):
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return value
+
+
+def parse_ip(ip_str):
+    """'180 2/3' 형식의 IP(이닝)를 소수점으로 변환"""
+    if not ip_str:
+        return 0.0
+    try:
+        ip_str = str(ip_str).strip()
+        # 공백으로 분리
+        parts = ip_str.split()
+        if len(parts) == 1:
+            # "2/3" 같은 경우 (한 경기 기록)
+            if '/' in parts[0]:
+                num, den = map(int, parts[0].split('/'))
+                return num / den
+            # "80" 같은 경우
+            return float(parts[0])
+        elif len(parts) == 2:
+            # "47 2/3" 같은 경우
+            whole = float(parts[0])
+            fraction = parts[1]
+            if '/' in fraction:
+                num, den = map(int, fraction.split('/'))
+                return whole + (num / den)
+            return whole
+        else:
+            return float(ip_str)
+    except (ValueError, AttributeError):
+        return 0.0
+
+
+def date_text(value):
+    """DATE 컬럼 값 → '09.04' (크롤링 원본 형식, 문자열은 그대로)"""
+    return value.strftime('%m.%d') if isinstance(value, date) else value
+
+
+def typed_rows(rows):
+    """행 목록의 기록 컬럼을 숫자로 변환 (스냅샷 생성 시 한 번만 실행)"""
+    return [
+        {
+            column: date_text(value) if column == '일자'
+            else value if column in KEEP_TEXT_COLUMNS else to_typed(value)
+            for column, value in row.items()
+        }
+        for row in rows
+    ]
+
+
+class _Descending:
+    """정렬 키를 역순으로 비교하기 위한 래퍼 (문자열 내림차순 정렬용)"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def _sort_key(column, descending, value, player_id):
+    """
+    (값 없음 여부, 정렬 값, player_id) 정렬 키
+    - 값이 없는 행은 방향과 관계없이 마지막
+    - 같은 값이면 player_id 오름차순 (커서가 항상 한 행을 가리키도록)
+    """
+    if column == 'IP':
+        value = parse_ip(value) if value not in (None, '', '-') else None
+    elif column not in SORT_TEXT_COLUMNS:
+        value = to_number(value)
+    elif value == '':
+        value = None
+    if value is None:
+        return (1, 0, str(player_id))
+    if descending:
+        value = -value if column not in SORT_TEXT_COLUMNS else _Descending(value)
+    return (0, value, str(player_id))
+
+
+def encode_cursor(column, descending, value, player_id):
+    raw = json.dumps([column, descending, value, player_id], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        column, descending, value, player_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, TypeError, UnicodeDecodeError):
+        raise InvalidListQuery('cursor 값이 올바르지 않습니다.')
+    # 조작된 커서 (정렬 키 비교 중 TypeError가 나지 않도록 값 타입 확인)
+    valid_value = value is None or (
+        isinstance(value, str) if column in SORT_TEXT_COLUMNS
+        else isinstance(value, (int, float, str)) and not isinstance(value, bool)
+    )
+    if not (isinstance(column, str) and isinstance(descending, bool) and valid_value
+            and isinstance(player_id, (str, int)) and not isinstance(player_id, bool)):
+        raise InvalidListQuery('cursor 값이 올바르지 않습니다.')
+    return column, descending, value, player_id
+
+
+class StatList:
+    """
+    행 목록 + 정렬 기준별 정렬 키 캐시
+
+    rows: player_id, 선수명 컬럼을 포함한 dict 리스트
+    teams: player_id → 팀명
+    """
+
+    def __init__(self, rows, teams=None):
+        self.rows = rows
+        self.columns = list(rows[0].keys()) if rows else []
+        self.teams = teams or {}
+        self._orders = {}
+        self._lock = threading.Lock()
+
+    def _order(self, column, descending):
+        """정렬 기준별 (정렬 키 목록, 행 목록) - 처음 요청될 때 한 번만 만든다"""
+        order = self._orders.get((column, descending))
+        if order is None:
+            with self._lock:
+                order = self._orders.get((column, descending))
+                if order is None:
+                    keyed = sorted(
+                        (_sort_key(column, descending, row.get(column), row.get('player_id')), row)
+                        for row in self.rows
+                    ) if self.rows else []
+                    order = ([key for key, _ in keyed], [row for _, row in keyed])
+                    self._orders[(column, descending)] = order
+        return order
+
+    def page(self, sort='선수명', cursor=None, limit=DEFAULT_PAGE_SIZE, fields=None, team=None):
+        """
+        한 페이지 조회
+
+        Args:
+            sort: 정렬 컬럼 ('-HR'처럼 '-'를 붙이면 내림차순)
+            cursor: 이전 페이지의 next_cursor
+            limit: 페이지 크기
+            fields: 응답에 포함할 컬럼 목록 (None이면 전체)
+            team: 팀명 필터 (정확히 일치)
+
+        Returns:
+            {"count": 조건에 맞는 전체 수, "next_cursor": 다음 페이지 커서 또는 None, "results": [...]}
+        """
+        descending = sort.startswith('-')
+        column = sort.lstrip('-')
+        if self.rows and column not in self.columns:
+            raise InvalidListQuery(f'정렬할 수 없는 컬럼입니다: {column}')
+        if fields:
+            unknown = [field for field in fields if field not in self.columns]
+            if self.rows and unknown:
+                raise InvalidListQuery(f'알 수 없는 필드입니다: {", ".join(unknown)}')
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+        keys, rows = self._order(column, descending)
+
+        start = 0
+        if cursor:
+            cursor_column, cursor_descending, value, player_id = decode_cursor(cursor)
+            if (cursor_column, cursor_descending) != (column, descending):
+                raise InvalidListQuery('cursor와 sort 값이 일치하지 않습니다.')
+            start = bisect.bisect_right(keys, _sort_key(column, descending, value, player_id))
+
+        def matches(row):
+            return team is None or self.teams.get(str(row.get('player_id'))) == team
+
+        page_rows = []
+        position = start
+        while position < len(rows) and len(page_rows) < limit:
+            if matches(rows[position]):
+                page_rows.append(rows[position])
+            position += 1
+
+        next_cursor = None
+        if page_rows and any(matches(row) for row in rows[position:]):
+            last = page_rows[-1]
+            next_cursor = encode_cursor(column, descending, last.get(column), last.get('player_id'))
+
+        count = len(rows) if team is None else sum(1 for row in rows if matches(row))
+        if fields:
+            page_rows = [{field: row.get(field) for field in fields} for row in page_rows]
+
+        return {
+            'count': count,
+            'next_cursor': next_cursor,
+            'results': page_rows,
+        }
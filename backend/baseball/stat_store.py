@@ -0,0 +1,224 @@
+"""
+인메모리 컬럼형 기록 저장소
+
+크롤링 테이블(수천 행)을 서버 시작 시 한 번 읽어 컬럼별 숫자 배열로 보관하고,
+필터 / 정렬 / 상위 N명 조회를 SQL 없이 메모리에서 처리한다.
+
+- 테이블마다 하나의 스냅샷 (데이터 버전이 바뀌면 다시 읽음, mark_data_changed / reload_snapshots)
+- 숫자 컬럼: NumPy float64 배열 (값 없음은 NaN), NumPy가 없으면 array('d')
+- 문자열 컬럼(선수명, 팀명 등): 리스트 그대로
+- player_id / 선수명 인덱스: 값 → 행 번호 목록
+"""
+
+import math
+from array import array
+from collections import defaultdict
+
+from django.db import connection
+
+from .snapshots import SNAPSHOTS, Snapshot
+from .stat_lists import KEEP_TEXT_COLUMNS, parse_ip, typed_rows
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy가 없으면 표준 라이브러리 array / 정렬 사용 (결과는 같음)
+    np = None
+
+# 저장소에 올리는 테이블: 테이블명 → (컬럼 목록, 정렬 컬럼)
+STORE_TABLES = {
+    '2025_score_hitters': ([
+        'player_id', '선수명', 'AVG', 'G', 'PA', 'AB', 'R', 'H',
+        '2B', '3B', 'HR', 'TB', 'RBI', 'SAC', 'SF', 'SB', 'CS',
+        'BB', 'IBB', 'HBP', 'SO', 'GDP', 'SLG', 'OBP', 'OPS',
+    ], '선수명'),
+    '2025_score_pitchers': ([
+        'player_id', '선수명', 'ERA', 'G', 'CG', 'SHO', 'W', 'L',
+        'SV', 'HLD', 'WPCT', 'TBF', 'NP', 'IP', 'H', '2B', '3B', 'HR',
+        'SAC', 'SF', 'BB', 'IBB', 'SO', 'WP', 'BK', 'R', 'ER',
+        'BSV', 'WHIP', 'AVG', 'QS',
+    ], '선수명'),
+    'kbo_hitters_top150': ([
+        '순위', '선수명', '팀명', 'AVG', 'G', 'PA', 'AB', 'R', 'H',
+        '2B', '3B', 'HR', 'TB', 'RBI', 'SAC', 'SF', 'player_id',
+    ], '선수명'),
+    'kbo_pitchers_top150': ([
+        '순위', '선수명', '팀명', 'ERA', 'G', 'W', 'L', 'SV', 'HLD', 'WPCT',
+        'IP', 'H', 'HR', 'BB', 'HBP', 'SO', 'R', 'ER', 'WHIP', 'player_id',
+    ], '선수명'),
+    'kbo_defense_positions': (['선수명', '팀명', 'POS', 'FPCT'], '선수명'),
+    'hitter_recent_games_log': ([
+        'player_id', '선수명', '일자', '상대', 'AVG', 'PA', 'AB', 'R', 'H',
+        '2B', '3B', 'HR', 'RBI', 'SB', 'CS', 'BB', 'HBP', 'SO', 'GDP',
+    ], '일자'),
+    'pitcher_recent_games_log': ([
+        'player_id', '선수명', '일자', '상대', '결과', 'ERA', 'TBF', 'IP', 'H',
+        'HR', 'BB', 'HBP', 'SO', 'R', 'ER', 'AVG',
+    ], '일자'),
+}
+
+# 필터 연산자
+FILTER_OPERATORS = ('==', '>=', '<=', '>', '<')
+
+
+def _float_array(values):
+    """숫자 목록 → float 배열 (None은 NaN)"""
+    floats = [math.nan if value is None or isinstance(value, str) else float(value) for value in values]
+    return np.array(floats, dtype=np.float64) if np is not None else array('d', floats)
+
+
+class StatTable:
+    """
+    한 테이블의 컬럼형 데이터
+
+    rows: 행 dict 목록 (숫자 변환 완료, API 응답에 그대로 사용)
+    numeric: 숫자 컬럼 → float 배열
+    """
+
+    def __init__(self, name, rows):
+        self.name = name
+        self.rows = rows
+        self.columns = list(rows[0]) if rows else []
+        self.numeric = {
+            column: _float_array([row[column] for row in rows])
+            for column in self.columns if column not in KEEP_TEXT_COLUMNS
+        }
+        if 'IP' in self.columns:
+            # 이닝은 응답에서는 '158 1/3' 문자열 그대로, 정렬/필터는 소수 이닝으로
+            self.numeric['IP'] = _float_array([parse_ip(row['IP']) if row['IP'] else None for row in rows])
+        self.by_id = defaultdict(list)
+        self.by_name = defaultdict(list)
+        for index, row in enumerate(rows):
+            if row.get('player_id'):
+                self.by_id[str(row['player_id'])].append(index)
+            if row.get('선수명'):
+                self.by_name[row['선수명']].append(index)
+        self._orders = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def rows_for_id(self, player_id):
+        """player_id의 행 목록"""
+        return [self.rows[index] for index in self.by_id.get(str(player_id), [])]
+
+    def rows_for_name(self, name):
+        """선수명의 행 목록 (동명이인이면 여러 행)"""
+        return [self.rows[index] for index in self.by_name.get(name, [])]
+
+    def order(self, column, descending=True):
+        """
+        숫자 컬럼 정렬 순서 (행 번호 목록, 값이 없는 행은 마지막, 같은 값은 원래 순서)
+        정렬 기준별로 한 번만 계산해 보관한다
+        """
+        key = (column, descending)
+        order = self._orders.get(key)
+        if order is None:
+            values = self.numeric[column]
+            if np is not None:
+                # NaN은 argsort에서 항상 마지막
+                order = np.argsort(-values if descending else values, kind='stable')
+            else:
+                sign = -1 if descending else 1
+                order = sorted(
+                    range(len(values)),
+                    key=lambda i: (math.isnan(values[i]), sign * values[i] if not math.isnan(values[i]) else 0),
+                )
+            self._orders[key] = order
+        return order
+
+    def mask(self, filters):
+        """
+        조건에 맞는 행 (bool 배열 또는 리스트)
+
+        filters: [(컬럼, 연산자, 값), ...] - 예: [('PA', '>=', 446), ('팀명', '==', 'LG')]
+        숫자 컬럼은 FILTER_OPERATORS, 문자열 컬럼은 '=='만 사용 (값이 없는 행은 항상 제외)
+        """
+        selected = np.ones(len(self.rows), dtype=bool) if np is not None else [True] * len(self.rows)
+        for column, operator, value in filters or ():
+            if operator not in FILTER_OPERATORS:
+                raise ValueError(f'지원하지 않는 연산자입니다: {operator}')
+            if column in self.numeric:
+                matched = _compare(self.numeric[column], operator, float(value))
+            elif column in self.columns and operator == '==':
+                matched = [row[column] == value for row in self.rows]
+                matched = np.array(matched, dtype=bool) if np is not None else matched
+            else:
+                raise ValueError(f'필터로 사용할 수 없는 컬럼입니다: {column} {operator}')
+            if np is not None:
+                selected &= matched
+            else:
+                selected = [a and b for a, b in zip(selected, matched)]
+        return selected
+
+    def top(self, column, limit=None, descending=True, filters=None):
+        """
+        조건에 맞는 행을 숫자 컬럼 기준으로 정렬해 상위 limit개 반환 (값이 없는 행 제외)
+        """
+        order = self.order(column, descending)
+        selected = self.mask(filters)
+        values = self.numeric[column]
+        if np is not None:
+            indexes = order[selected[order] & ~np.isnan(values[order])]
+            if limit is not None:
+                indexes = indexes[:limit]
+            return [self.rows[index] for index in indexes.tolist()]
+
+        result = []
+        for index in order:
+            if selected[index] and not math.isnan(values[index]):
+                result.append(self.rows[index])
+                if limit is not None and len(result) >= limit:
+                    break
+        return result
+
+
+def _compare(values, operator, value):
+    """숫자 배열 비교 (NaN은 항상 False)"""
+    if np is not None:
+        with np.errstate(invalid='ignore'):
+            return {
+                '==': values == value,
+                '>=': values >= value,
+                '<=': values <= value,
+                '>': values > value,
+                '<': values < value,
+            }[operator]
+    compare = {
+        '==': lambda v: v == value,
+        '>=': lambda v: v >= value,
+        '<=': lambda v: v <= value,
+        '>': lambda v: v > value,
+        '<': lambda v: v < value,
+    }[operator]
+    return [compare(v) for v in values]
+
+
+def table_query(table):
+    """저장소 테이블 전체 조회 SQL"""
+    columns, order_by = STORE_TABLES[table]
+    select_columns = ', '.join(f'`{column}`' for column in columns)
+    return f"SELECT {select_columns} FROM `{table}` ORDER BY `{order_by}`"
+
+
+def _table_loader(table):
+    def load():
+        with connection.cursor() as cursor:
+            cursor.execute(table_query(table))
+            names = [col[0] for col in cursor.description]
+            rows = [dict(zip(names, row)) for row in cursor.fetchall()]
+        return StatTable(table, typed_rows(rows))
+
+    return load
+
+
+# 테이블별 스냅샷 (스냅샷 레지스트리에 등록되어 reload_snapshots / 데이터 버전 변경 시 함께 갱신)
+_TABLE_SNAPSHOTS = {}
+for _table in STORE_TABLES:
+    _TABLE_SNAPSHOTS[_table] = SNAPSHOTS[f'store:{_table}'] = Snapshot(f'store:{_table}', _table_loader(_table))
+
+
+def stat_table(table):
+    """현재 데이터 버전의 StatTable 반환 (처음 요청 시 DB에서 한 번 읽음)"""
+    return _TABLE_SNAPSHOTS[table].get()
+
@@ -0,0 +1,249 @@
+"""
+팀 요약 (선택한 라인업의 기록 합계 / 평균, 팀 능력치, 예상 승률)
+
+components/stats.tsx가 클라이언트에서 계산하던 teamStats / teamAbilities / expectedWinRate와 같은 공식을 사용한다
+(stats.tsx는 이 응답을 그대로 표시).
+선수 기록은 인메모리 기록 저장소(stat_store)의 숫자 배열에서 선택한 행만 한 번에 꺼내 계산한다.
+
+- 타자: kbo_hitters_top150 (수비율은 kbo_defense_positions의 선택한 포지션 기록)
+- 투수: kbo_pitchers_top150
+- 선수 키는 /api/mysql-players/ 응답의 id (KBO player_id, 없는 선수는 임시 ID → 선수명 + 팀명으로 행을 찾음)
+"""
+
+import hashlib
+import json
+import math
+
+from .hitter_positions import HITTER_POSITION_KR, POSITION_KR_TO_FRONTEND
+from .ratings import clamp, js_round
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy가 없으면 파이썬 합계 사용 (결과는 같음)
+    np = None
+
+TEAM_AXES = [
+    ('power', '파워'),
+    ('accuracy', '정확도'),
+    ('running', '주루'),
+    ('defense', '수비'),
+    ('pitching', '투수력'),
+]
+
+# 타자 기록: 응답 키 → (저장소 컬럼, 'mean' 선수 평균 / 'sum' 합계)
+HITTER_STATS = [
+    ('batting_avg', 'AVG', 'mean'),
+    ('rbis', 'RBI', 'mean'),
+    ('home_runs', 'HR', 'mean'),
+    ('runs', 'R', 'mean'),
+    ('total_bases', 'TB', 'sum'),
+    ('hits', 'H', 'sum'),
+    ('at_bats', 'AB', 'sum'),
+]
+
+# 투수 기록 (모두 선수 평균)
+PITCHER_STATS = [
+    ('era', 'ERA'),
+    ('wins', 'W'),
+    ('losses', 'L'),
+    ('saves', 'SV'),
+    ('holds', 'HLD'),
+    ('strikeouts', 'SO'),
+]
+
+# 한 라인업의 최대 투수 수 (선발 + 불펜)
+MAX_TEAM_PITCHERS = 20
+
+
+def parse_lineup_params(params):
+    """
+    라인업 파라미터 → ({포지션: player_id}, [투수 player_id, ...]), 잘못된 요청이면 ValueError
+    params는 QueryDict (?catcher=76232&pitchers=76715&pitchers=69446) 또는
+    JSON 본문 dict ({"catcher": 76232, "pitchers": [76715, 69446]})
+    """
+    if hasattr(params, 'getlist'):
+        pitchers = params.getlist('pitchers')
+    elif isinstance(params, dict):
+        pitchers = params.get('pitchers') or []
+        if not isinstance(pitchers, list):
+            raise ValueError('pitchers는 목록이어야 합니다.')
+    else:
+        raise ValueError('요청 본문은 {"catcher": 76232, ..., "pitchers": [...]} 형식이어야 합니다.')
+
+    def player_id(value, name):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f'{name}은(는) 선수 ID(숫자)여야 합니다: {value}')
+
+    batters = {
+        position: player_id(params.get(position), position)
+        for position in HITTER_POSITION_KR
+        if params.get(position) not in (None, '')
+    }
+    pitchers = [player_id(value, 'pitchers') for value in pitchers]
+    if len(pitchers) > MAX_TEAM_PITCHERS:
+        raise ValueError(f'투수는 최대 {MAX_TEAM_PITCHERS}명까지 선택할 수 있습니다.')
+    if not batters and not pitchers:
+        raise ValueError(f'선수를 한 명 이상 선택하세요 ({", ".join(HITTER_POSITION_KR)}, pitchers).')
+    return batters, pitchers
+
+
+def lineup_hash(batters, pitchers):
+    """라인업 키 (포지션 / 투수 순서와 관계없이 같은 라인업이면 같은 값)"""
+    canonical = json.dumps([sorted(batters.items()), sorted(pitchers)])
+    return hashlib.sha1(canonical.encode()).hexdigest()[:16]
+
+
+class TeamStatSource:
+    """
+    팀 요약에 쓰는 기록 저장소 테이블 + (타자 행 번호, 포지션) → 수비율
+    """
+
+    def __init__(self, hitters, pitchers, defense):
+        self.hitters = hitters
+        self.pitchers = pitchers
+        self.fielding = {}
+        for index, row in enumerate(hitters.rows):
+            for record in defense.rows_for_name(row['선수명']):
+                position = POSITION_KR_TO_FRONTEND.get(record['POS'])
+                if position and record['팀명'] == row['팀명']:
+                    self.fielding.setdefault((index, position), record['FPCT'])
+
+
+
+def _row_index(table, player_id, temporary_players):
+    """player_id → 행 번호 (임시 ID면 player_id가 없는 행 중 선수명 + 팀명이 같은 행, 없으면 None)"""
+    rows = table.by_id.get(str(player_id))
+    if rows:
+        return rows[0]
+    name, team = temporary_players.get(player_id, (None, None))
+    for index in table.by_name.get(name, []):
+        row = table.rows[index]
+        if row['팀명'] == team and not str(row.get('player_id') or '').strip().isdigit():
+            return index
+    return None
+
+
+def _row_indexes(table, player_ids, temporary_players):
+    """player_id 목록 → 행 번호 목록 (선수마다 하나, 저장소에 없는 선수는 None) + missing"""
+    indexes = [_row_index(table, player_id, temporary_players) for player_id in player_ids]
+    missing = [player_id for player_id, index in zip(player_ids, indexes) if index is None]
+    return indexes, missing
+
+
+def _totals(table, indexes, columns):
+    """선택한 행의 컬럼별 합계 (값 없음은 0 - 클라이언트의 `|| 0`과 같음)"""
+    if np is not None:
+        selected = np.asarray(indexes, dtype=np.intp)
+        return {column: float(np.nansum(table.numeric[column][selected])) for column in columns}
+    return {
+        column: float(sum(value for value in (table.numeric[column][i] for i in indexes) if not math.isnan(value)))
+        for column in columns
+    }
+
+
+def team_stats(source, batters, pitchers, temporary_players):
+    """
+    라인업 기록 (타자 / 투수 평균, 루타 / 안타 / 타수 합계)
+
+    temporary_players: 임시 ID → (선수명, 팀명)
+
+    Returns:
+        (기록 dict, 저장소에 없는 player_id 목록)
+    """
+    stats = {key: 0.0 for key, _, _ in HITTER_STATS}
+    stats['fielding_percentage'] = 0.0
+    stats.update({key: 0.0 for key, _ in PITCHER_STATS})
+
+    positions = list(batters)
+    row_indexes, missing_hitters = _row_indexes(
+        source.hitters, [batters[position] for position in positions], temporary_players,
+    )
+    hitter_indexes = [index for index in row_indexes if index is not None]
+    if hitter_indexes:
+        count = len(hitter_indexes)
+        totals = _totals(source.hitters, hitter_indexes, [column for _, column, _ in HITTER_STATS])
+        for key, column, aggregate in HITTER_STATS:
+            stats[key] = totals[column] / count if aggregate == 'mean' else totals[column]
+        fielding = [
+            source.fielding.get((index, position)) or 0.0
+            for position, index in zip(positions, row_indexes)
+            if index is not None
+        ]
+        stats['fielding_percentage'] = sum(fielding) / count
+
+    row_indexes, missing_pitchers = _row_indexes(source.pitchers, pitchers, temporary_players)
+    pitcher_indexes = [index for index in row_indexes if index is not None]
+    if pitcher_indexes:
+        count = len(pitcher_indexes)
+        totals = _totals(source.pitchers, pitcher_indexes, [column for _, column in PITCHER_STATS])
+        for key, column in PITCHER_STATS:
+            stats[key] = totals[column] / count
+
+    return stats, missing_hitters + missing_pitchers
+
+
+def team_abilities(stats):
+    """팀 능력치 {power, accuracy, running, defense, pitching} (0-100)"""
+    # 파워: (TB-H)/AB 0-0.350 → 0-100 (타수가 없으면 홈런 기준)
+    if stats['at_bats'] > 0:
+        power = min(100, (stats['total_bases'] - stats['hits']) / stats['at_bats'] / 0.350 * 100)
+    else:
+        power = min(100, stats['home_runs'] / 60 * 100)
+
+    # 정확도: 타율 0-0.400 → 0-100
+    accuracy = min(100, stats['batting_avg'] / 0.400 * 100)
+
+    # 주루(득점력): 득점 0-100 → 0-100
+    running = min(100, stats['runs'] / 100 * 100)
+
+    # 수비: 수비율 0.850-1.000 → 0-100 (수비율이 없으면 정확도/파워로 추정)
+    if stats['fielding_percentage'] > 0:
+        defense = clamp((stats['fielding_percentage'] - 0.850) / 0.150 * 100)
+    else:
+        defense = accuracy * 0.6 + power * 0.4
+
+    # 투수력: ERA 0-6.0 → 100-0 (ERA가 없으면 50)
+    pitching = clamp((6.0 - stats['era']) / 6.0 * 100) if stats['era'] > 0 else 50
+
+    return {
+        'power': js_round(power),
+        'accuracy': js_round(accuracy),
+        'running': js_round(running),
+        'defense': js_round(defense),
+        'pitching': js_round(pitching),
+    }
+
+
+def expected_win_rate(abilities):
+    """능력치 → 예상 승률 (공격 / 수비 평균을 0.35 ~ 0.65로, 0.25 ~ 0.75 범위)"""
+    offense = (abilities['power'] + abilities['accuracy'] + abilities['running']) / 3
+    defense = (abilities['defense'] + abilities['pitching']) / 2
+    total_ability = (offense * 0.5 + defense * 0.5) / 100
+    return max(0.25, min(0.75, 0.35 + total_ability * 0.30))
+
+
+def team_summary(source, batters, pitchers, temporary_players=None):
+    """
+    라인업 → 팀 요약 응답 dict
+
+    Args:
+        source: TeamStatSource
+        batters: {포지션: player_id}
+        pitchers: [player_id, ...]
+        temporary_players: player_id가 없는 선수의 임시 ID → (선수명, 팀명) (/api/mysql-players/ 선수 목록에서)
+    """
+    stats, missing = team_stats(source, batters, pitchers, temporary_players or {})
+    abilities = team_abilities(stats)
+    return {
+        'lineup_hash': lineup_hash(batters, pitchers),
+        'stats': {key: round(value, 3) for key, value in stats.items()},
+        'abilities': {
+            'type': 'team',
+            'axes': [{'key': key, 'label': label, 'value': abilities[key]} for key, label in TEAM_AXES],
+        },
+        'expected_win_rate': round(expected_win_rate(abilities), 3),
+        'missing': missing,
+    }
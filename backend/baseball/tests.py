@@ -1,3 +1,977 @@
+import tempfile
+import time
+from datetime import date
+from io import StringIO
+from pathlib import Path
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver
+from rest_framework.test import APIClient
+
+from . import urls as baseball_urls
+from .models import Player
+
+from .crawled_schema import alter_table_sql, column_changes, db_value
+from .hitter_positions import MATERIALIZED_TABLE, rebuild_hitters_with_positions
+from .league_ratings import RATINGS_TABLE, load_ratings, percentiles
+from .recent_form import FORM_TABLE, form_records, rebuild_recent_form
+from .management.commands.loadtest import ASYNC_PREFIX, MIXES as LOADTEST_MIXES, async_requests
+from .materialized_tables import rebuild_materialized
+from .image_manifest import MAX_IMAGE_BATCH, ImageManifest, build_manifest, load_sizes, write_manifest
+from .metrics import REGISTRY
+from .snapshots import clear_all
+from .stat_lists import encode_cursor
+from .stat_store import stat_table
+from .warmup import WARMED_UP, warm_up
+
+# 테스트용 크롤링 테이블 (실제 테이블은 Django 모델이 아니므로 직접 생성)
+FIXTURE_TABLES = {
+    'kbo_pitchers_top150': [
+        '순위', '선수명', '팀명', 'ERA', 'G', 'W', 'L', 'SV', 'HLD', 'WPCT', 'IP',
+        'H', 'HR', 'BB', 'HBP', 'SO', 'R', 'ER', 'WHIP', 'player_id',
+    ],
+    'kbo_hitters_top150': [
+        '순위', '선수명', '팀명', 'AVG', 'G', 'PA', 'AB', 'R', 'H', '2B', '3B', 'HR',
+        'TB', 'RBI', 'SAC', 'SF', 'player_id',
+    ],
+    'kbo_defense_positions': ['선수명', '팀명', 'POS', 'FPCT'],
+    '2025_score_hitters': [
+        'player_id', '선수명', 'AVG', 'G', 'PA', 'AB', 'R', 'H', '2B', '3B', 'HR', 'TB', 'RBI',
+        'SAC', 'SF', 'SB', 'CS', 'BB', 'IBB', 'HBP', 'SO', 'GDP', 'SLG', 'OBP', 'OPS',
+    ],
+    '2025_score_pitchers': [
+        'player_id', '선수명', 'ERA', 'G', 'CG', 'SHO', 'W', 'L', 'SV', 'HLD', 'WPCT', 'TBF', 'NP',
+        'IP', 'H', '2B', '3B', 'HR', 'SAC', 'SF', 'BB', 'IBB', 'SO', 'WP', 'BK', 'R', 'ER',
+        'BSV', 'WHIP', 'AVG', 'QS',
+    ],
+    'hitter_recent_games_log': [
+        'player_id', '선수명', '일자', '상대', 'AVG', 'PA', 'AB', 'R', 'H', '2B', '3B', 'HR',
+        'RBI', 'SB', 'CS', 'BB', 'HBP', 'SO', 'GDP',
+    ],
+    'pitcher_recent_games_log': [
+        'player_id', '선수명', '일자', '상대', '결과', 'ERA', 'TBF', 'IP', 'H', 'HR', 'BB', 'HBP',
+        'SO', 'R', 'ER', 'AVG',
+    ],
+    'photo_data': ['player_id', 'player_name', 'image_1', 'image_2', 'image_3', 'profile_img'],
+}
+
+# 최근 경기 (player_id, 선수명, 일자, 상대) - 99999는 양의지와 이름이 같은 다른 선수
+FIXTURE_HITTER_GAMES = [
+    ['76232', '양의지', '09.03', 'NC'],
+    ['76232', '양의지', '09.04', 'KT'],
+    ['99999', '양의지', '09.04', 'LG'],
+]
+
+FIXTURE_PITCHERS = [
+    ['1', '류현진', '한화', '3.87', '28', '10', '8', '0', '0', '0.556', '158 1/3',
+     '164', '12', '36', '5', '135', '76', '68', '1.26', '76715'],
+    ['2', '원태인', '삼성', '3.66', '28', '15', '6', '0', '0', '0.714', '159 2/3',
+     '150', '19', '48', '2', '119', '72', '65', '1.24', '69446'],
+]
+
+FIXTURE_HITTERS = [
+    # (선수 기록, 수비 포지션, 수비율)
+    (['1', '양의지', '두산', '0.314', '119', '454', '408', '57', '128', '20', '0',
+      '17', '199', '94', '0', '7', '76232'], '포수', '0.995'),
+    (['2', '김도영', 'KIA', '0.347', '141', '625', '544', '143', '189', '29', '10',
+      '38', '352', '109', '0', '5', '52605'], '3루수', '0.939'),
+    (['3', '오스틴', 'LG', '0.319', '140', '603', '527', '99', '168', '32', '1',
+      '32', '298', '132', '0', '10', '69102'], '1루수', '0.992'),
+    (['4', '박해민', 'LG', '0.263', '144', '560', '494', '72', '130', '19', '5',
+      '6', '177', '47', '9', '5', '62415'], '중견수', '0.996'),
+    (['5', '최형우', 'KIA', '0.280', '116', '493', '425', '67', '119', '26', '0',
+      '22', '211', '109', '0', '8', '71432'], '지명타자', ''),
+]
+
+# 선수 이미지 (player_id, player_name, image_1, image_2, image_3, profile_img) - 김광현은 player_id 없음
+FIXTURE_PHOTOS = [
+    ['76715', '류현진', 'https://img.example/류현진_1.jpg', '', '', 'https://img.example/류현진_profile.jpg'],
+    ['', '김광현', 'https://img.example/김광현_1.jpg', '', '', ''],
+]
+
+
+def create_fixture_tables():
+    """크롤링 테이블을 테스트 DB에 만들고 고정 데이터를 채운다"""
+    with connection.cursor() as cursor:
+        for table, columns in FIXTURE_TABLES.items():
+            column_defs = ', '.join(f'`{column}` VARCHAR(50)' for column in columns)
+            cursor.execute(f'CREATE TABLE IF NOT EXISTS `{table}` ({column_defs})')
+            cursor.execute(f'DELETE FROM `{table}`')
+
+        def insert(table, values):
+            columns = FIXTURE_TABLES[table]
+            cursor.execute(
+                f"INSERT INTO `{table}` ({', '.join(f'`{c}`' for c in columns)}) "
+                f"VALUES ({', '.join(['%s'] * len(columns))})",
+                values,
+            )
+
+        for pitcher in FIXTURE_PITCHERS:
+            insert('kbo_pitchers_top150', pitcher)
+        for hitter, position, fpct in FIXTURE_HITTERS:
+            insert('kbo_hitters_top150', hitter)
+            insert('kbo_defense_positions', [hitter[1], hitter[2], position, fpct])
+
+        # 2025 기록: player_id, 선수명, AVG, HR 외에는 빈 값
+        for hitter, _, _ in FIXTURE_HITTERS:
+            values = [''] * len(FIXTURE_TABLES['2025_score_hitters'])
+            values[:3] = [hitter[16], hitter[1], hitter[3]]
+            values[10] = hitter[11]
+            insert('2025_score_hitters', values)
+
+        for photo in FIXTURE_PHOTOS:
+            insert('photo_data', photo)
+
+        for game in FIXTURE_HITTER_GAMES:
+            insert('hitter_recent_games_log', game + [''] * (len(FIXTURE_TABLES['hitter_recent_games_log']) - 4))
+
+        # 업로드 후 만드는 구체화 테이블 (타자 + 포지션, 리그 백분위 능력치, 최근 폼)
+        list(rebuild_materialized(cursor, connection.vendor))
+
+
+class MysqlPlayersQueryCountTest(TestCase):
+    """/api/mysql-players/ 쿼리 수 고정 (능력치 1 + 투수 1 + 타자 1)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+        self.client = APIClient()
+
+    def test_cold_request_uses_three_queries(self):
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/mysql-players/')
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual([p['name'] for p in data['pitcher']], ['류현진', '원태인'])
+        self.assertEqual([p['name'] for p in data['catcher']], ['양의지'])
+        self.assertEqual([p['name'] for p in data['third']], ['김도영'])
+        self.assertEqual(data['shortstop'], [])
+        # 지명타자는 포지션 목록에 포함되지 않음
+        names = [p['name'] for players in data.values() for p in players]
+        self.assertNotIn('최형우', names)
+
+    def test_hitters_come_from_materialized_table_without_join(self):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.client.get('/api/mysql-players/').json()
+        self.assertTrue(any(MATERIALIZED_TABLE in q['sql'] for q in queries))
+        self.assertFalse(any('JOIN' in q['sql'] for q in queries))
+        self.assertEqual(data['catcher'][0]['id'], 76232)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT `TB`, `AVG` FROM `{MATERIALIZED_TABLE}` WHERE `player_id` = 52605")
+            self.assertEqual(cursor.fetchone(), (352, 0.347))
+
+    def test_falls_back_to_join_before_table_is_built(self):
+        expected = self.client.get('/api/mysql-players/').json()
+        clear_all()
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE `{MATERIALIZED_TABLE}`')
+        self.assertEqual(self.client.get('/api/mysql-players/').json(), expected)
+
+    def test_build_materialized_rebuilds_selected_table(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE `{MATERIALIZED_TABLE}`')
+        out = StringIO()
+        call_command('build_materialized', tables=[MATERIALIZED_TABLE], stdout=out)
+        self.assertEqual(out.getvalue().strip(), f'✅ {MATERIALIZED_TABLE}: 4행')
+
+    def test_warm_request_uses_no_queries(self):
+        self.client.get('/api/mysql-players/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/mysql-players/')
+        self.assertEqual(response.status_code, 200)
+
+    def test_conditional_request_returns_304(self):
+        response = self.client.get('/api/mysql-players/')
+        etag = response['ETag']
+
+        response = self.client.get('/api/mysql-players/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+        response = self.client.get('/api/mysql-players/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_conditional_request_matches_only_served_encoding(self):
+        gzip_etag = self.client.get('/api/mysql-players/', HTTP_ACCEPT_ENCODING='gzip')['ETag']
+
+        # gzip 본문의 ETag로 무압축 본문을 요청하면 304가 아니라 본문
+        response = self.client.get('/api/mysql-players/', HTTP_IF_NONE_MATCH=gzip_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Content-Encoding', response)
+        self.assertNotEqual(response['ETag'], gzip_etag)
+
+        response = self.client.get('/api/mysql-players/', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=gzip_etag)
+        self.assertEqual(response.status_code, 304)
+
+
+class LeagueRatingsTest(TestCase):
+    """리그 백분위 능력치 테이블 (데이터를 올릴 때 계산, /api/mysql-players/ 와 프로필은 그대로 사용)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+        self.client = APIClient()
+
+    def test_percentiles_average_ties_and_missing_values(self):
+        self.assertEqual(list(percentiles([1, 2, 2, float('nan'), 3])), [0, 50, 50, 0, 100])
+        self.assertEqual(list(percentiles([3.0, 1.0], higher_is_better=False)), [0, 100])
+        self.assertEqual(list(percentiles([0.3])), [100])
+
+    def test_ratings_are_league_percentiles(self):
+        with connection.cursor() as cursor:
+            ratings = load_ratings(cursor)
+        self.assertEqual(
+            ratings.get('hitter', 76232, '양의지', '두산'),
+            {'power': 25, 'accuracy': 50, 'scoring': 0, 'defense': 67, 'stamina': 0},
+        )
+        # 지명타자(수비율 없음)는 정확도 60% + 파워 40%
+        self.assertEqual(ratings.get('hitter', None, '최형우', 'KIA')['defense'], 35)
+        # 9이닝당 볼넷 / ERA + WHIP는 낮을수록 높음
+        ryu = ratings.get('pitcher', '76715', '류현진', '한화')
+        self.assertEqual((ryu['control'], ryu['strikeouts'], ryu['clutch']), (100, 100, 0))
+
+    def test_counts_each_rating_row_once(self):
+        with connection.cursor() as cursor:
+            self.assertEqual(len(load_ratings(cursor)), len(FIXTURE_HITTERS) + len(FIXTURE_PITCHERS))
+
+    def test_profile_serves_precomputed_ratings(self):
+        players = self.client.get('/api/mysql-players/').json()
+        self.assertEqual(players['catcher'][0]['ratings']['defense'], 67)
+        self.assertEqual(players['catcher'][0]['ratings_scale'], 'league_percentile')
+        profile = self.client.get('/api/players/76232/profile/').json()
+        self.assertEqual(profile['ratings']['scale'], 'league_percentile')
+        self.assertEqual(
+            {axis['key']: axis['value'] for axis in profile['ratings']['axes']},
+            players['catcher'][0]['ratings'],
+        )
+
+    def test_falls_back_to_fixed_scale_before_table_is_built(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE `{RATINGS_TABLE}`')
+        players = self.client.get('/api/mysql-players/').json()
+        # 수비율 0.995 → (0.995 - 0.850) / 0.150 × 100
+        self.assertEqual(players['catcher'][0]['ratings']['defense'], 97)
+        self.assertEqual({p['ratings_scale'] for ps in players.values() for p in ps}, {'fixed'})
+
+    def test_one_missing_player_switches_everyone_to_fixed_scale(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM `{RATINGS_TABLE}` WHERE `선수명` = '류현진'")
+        players = self.client.get('/api/mysql-players/').json()
+        self.assertEqual({p['ratings_scale'] for ps in players.values() for p in ps}, {'fixed'})
+        self.assertEqual(players['catcher'][0]['ratings']['defense'], 97)
+
+
+class RecentFormTest(TestCase):
+    """경기 로그 → 최근 3 / 5 / 10경기 기록 테이블, /api/hot-players/"""
+
+    # (player_id, 선수명, 일자, IP, H, BB, ER)
+    PITCHER_GAMES = [
+        ('76715', '류현진', '09.01', '6', 5, 1, 2),
+        ('76715', '류현진', '09.07', '7', 4, 0, 1),
+        ('76715', '류현진', '09.13', '5 2/3', 6, 2, 3),
+        ('69446', '원태인', '09.02', '7', 3, 1, 0),
+        ('69446', '원태인', '09.08', '6 1/3', 5, 2, 1),
+        ('69446', '원태인', '09.14', '2/3', 1, 0, 0),
+        # 3경기 1이닝 무실점 - 표본 하한(경기당 1이닝) 미만이라 상위 선수에서 빠짐
+        ('50001', '김불펜', '09.03', '1/3', 0, 0, 0),
+        ('50001', '김불펜', '09.09', '1/3', 0, 0, 0),
+        ('50001', '김불펜', '09.15', '1/3', 0, 0, 0),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+        columns = ['player_id', '선수명', '일자', 'IP', 'H', 'BB', 'ER']
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO `pitcher_recent_games_log` ({', '.join(f'`{c}`' for c in columns)}) "
+                f"VALUES ({', '.join(['%s'] * len(columns))})",
+                cls.PITCHER_GAMES,
+            )
+            rebuild_recent_form(cursor, connection.vendor)
+
+    def setUp(self):
+        clear_all()
+        cache.clear()
+        self.client = APIClient()
+
+    def test_rolling_windows_use_latest_games(self):
+        # (일자, AB, H, 2B, HR, BB) - 로그 순서와 관계없이 일자 기준
+        games = [
+            {'player_id': '76232', '선수명': '양의지', '일자': day, 'AB': ab, 'H': h, '2B': double, '3B': '',
+             'HR': hr, 'BB': bb, 'HBP': ''}
+            for day, ab, h, double, hr, bb in [
+                ('09.01', '4', '1', '0', '0', '0'),
+                ('09.05', '4', '2', '0', '1', '0'),
+                ('09.03', '3', '0', '0', '0', '1'),
+                ('09.04', '4', '3', '1', '0', '0'),
+                ('09.02', '5', '1', '0', '0', '0'),
+            ]
+        ] + [{'player_id': '52605', '선수명': '김도영', '일자': '09.05', 'AB': '4', 'H': '4'}]
+        records = {record['last_n']: record for record in form_records('hitter', games)}
+        # 3경기 미만 출장 선수 / 10경기는 행 없음
+        self.assertEqual(sorted(records), [3, 5])
+        self.assertEqual((records[3]['AB'], records[3]['AVG'], records[3]['OPS']), (11, 0.455, 1.318))
+        self.assertEqual((records[5]['AB'], records[5]['AVG'], records[5]['OPS']), (20, 0.35, 0.931))
+
+    def test_hot_players_is_one_indexed_read(self):
+        with self.assertNumQueries(1):
+            data = self.client.get('/api/hot-players/', {'type': 'pitcher', 'games': 3}).json()
+        self.assertEqual(
+            [(player['rank'], player['선수명'], player['IP'], player['ERA'], player['WHIP']) for player in data['results']],
+            [(1, '원태인', 14.0, 0.64, 0.86), (2, '류현진', 18.667, 2.89, 0.96)],
+        )
+        # 표본 하한 미만 선수도 최근 폼 테이블에는 있음
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT `ERA` FROM `{FORM_TABLE}` WHERE `선수명` = '김불펜' AND `last_n` = 3")
+            self.assertEqual(cursor.fetchone()[0], 0.0)
+        self.assertEqual(self.client.get('/api/hot-players/', {'games': 4}).status_code, 400)
+
+    def test_falls_back_to_game_logs_before_table_is_built(self):
+        expected = self.client.get('/api/hot-players/', {'type': 'pitcher', 'games': 3}).json()
+        clear_all()
+        cache.clear()
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE `{FORM_TABLE}`')
+        self.assertEqual(self.client.get('/api/hot-players/', {'type': 'pitcher', 'games': 3}).json(), expected)
+
+
+class Hitters2025PaginationTest(TestCase):
+    """/api/hitters-2025/ 키셋 페이지네이션, 정렬, 필드 선택, 팀 필터"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+        self.client = APIClient()
+
+    def test_without_params_returns_full_list(self):
+        response = self.client.get('/api/hitters-2025/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), len(FIXTURE_HITTERS))
+
+    def test_stats_are_typed_numbers(self):
+        hitters = {row['선수명']: row for row in self.client.get('/api/hitters-2025/').json()}
+        self.assertEqual(hitters['김도영']['AVG'], 0.347)
+        self.assertEqual(hitters['김도영']['HR'], 38)
+        self.assertEqual(hitters['김도영']['player_id'], '52605')
+        # 빈 값은 null
+        self.assertIsNone(hitters['김도영']['OPS'])
+
+    def test_columnar_format_matches_rows(self):
+        rows = self.client.get('/api/hitters-2025/').json()
+        columnar = self.client.get('/api/hitters-2025/', {'format': 'columnar'}).json()
+        self.assertEqual([dict(zip(columnar['columns'], row)) for row in columnar['rows']], rows)
+
+    def test_cursor_walks_sorted_pages(self):
+        names, cursor = [], None
+        while True:
+            params = {'sort': '-HR', 'limit': 2, 'fields': '선수명,HR'}
+            if cursor:
+                params['cursor'] = cursor
+            data = self.client.get('/api/hitters-2025/', params).json()
+            self.assertEqual(data['count'], len(FIXTURE_HITTERS))
+            self.assertTrue(all(set(row) == {'선수명', 'HR'} for row in data['results']))
+            names += [row['선수명'] for row in data['results']]
+            cursor = data['next_cursor']
+            if not cursor:
+                break
+        self.assertEqual(names, ['김도영', '오스틴', '최형우', '양의지', '박해민'])
+
+    def test_team_filter(self):
+        data = self.client.get('/api/hitters-2025/', {'team': 'KIA', 'sort': 'AVG'}).json()
+        self.assertEqual([row['선수명'] for row in data['results']], ['최형우', '김도영'])
+        # 팀명 앞부분만 일치하면 제외 (K → KIA, KT 아님)
+        self.assertEqual(self.client.get('/api/hitters-2025/', {'team': 'K'}).json()['count'], 0)
+
+    def test_pitchers_sort_by_innings(self):
+        columns = FIXTURE_TABLES['2025_score_pitchers']
+        with connection.cursor() as cursor:
+            for player_id, name, ip in [('1', '류현진', '158 1/3'), ('2', '원태인', '159 2/3'), ('3', '김불펜', '9 2/3'),
+                                        ('4', '이선발', '80'), ('5', '박신인', '')]:
+                values = [''] * len(columns)
+                values[:2] = [player_id, name]
+                values[columns.index('IP')] = ip
+                cursor.execute(
+                    f"INSERT INTO `2025_score_pitchers` ({', '.join(f'`{c}`' for c in columns)}) "
+                    f"VALUES ({', '.join(['%s'] * len(columns))})",
+                    values,
+                )
+
+        names, cursor = [], None
+        while True:
+            params = {'sort': '-IP', 'limit': 2, 'fields': '선수명,IP'}
+            if cursor:
+                params['cursor'] = cursor
+            data = self.client.get('/api/pitchers-2025/', params).json()
+            names += [row['선수명'] for row in data['results']]
+            cursor = data['next_cursor']
+            if not cursor:
+                break
+        # '158 1/3' 같은 이닝도 숫자로 정렬, 빈 값은 마지막
+        self.assertEqual(names, ['원태인', '류현진', '이선발', '김불펜', '박신인'])
+        data = self.client.get('/api/pitchers-2025/', {'sort': 'IP', 'fields': '선수명'}).json()
+        self.assertEqual([row['선수명'] for row in data['results']], ['김불펜', '이선발', '류현진', '원태인', '박신인'])
+
+    def test_invalid_params_return_400(self):
+        for params in ({'sort': 'bogus'}, {'fields': '선수명,bogus'}, {'cursor': '!!'}, {'limit': 'x'}):
+            response = self.client.get('/api/hitters-2025/', params)
+            self.assertEqual(response.status_code, 400, params)
+
+    def test_forged_cursor_returns_400(self):
+        for value in ([1.5, '76232'], [['x'], '76232'], ['양의지', ['76232']]):
+            cursor = encode_cursor('선수명', False, *value)
+            response = self.client.get('/api/hitters-2025/', {'sort': '선수명', 'cursor': cursor})
+            self.assertEqual(response.status_code, 400, value)
+
+
+class AsyncReadPathTest(TestCase):
+    """/api/async/ 읽기 API는 동기 API와 같은 응답"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+        self.client = APIClient()
+
+    def test_async_responses_match_sync(self):
+        for path in ('mysql-players/', 'hitters-2025/', 'hitters-2025/?sort=-HR&limit=2&team=KIA'):
+            sync_response = self.client.get(f'/api/{path}')
+            async_response = self.client.get(f'/api/async/{path}')
+            self.assertEqual(async_response.status_code, 200, path)
+            self.assertEqual(async_response.json(), sync_response.json(), path)
+
+    def test_async_recent_games_requires_names(self):
+        response = self.client.get('/api/async/recent-games/')
+        self.assertEqual(response.status_code, 400)
+
+
+class PlayerIdKeyTest(TestCase):
+    """선수 ID는 KBO player_id, 프로필 / 최근 경기는 ID로 조회"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+        self.client = APIClient()
+
+    def test_ids_are_kbo_player_ids(self):
+        data = self.client.get('/api/mysql-players/').json()
+        self.assertEqual([p['id'] for p in data['pitcher']], [76715, 69446])
+        self.assertEqual(data['catcher'][0]['id'], 76232)
+
+    def test_recent_games_by_player_id_skip_same_name(self):
+        by_id = self.client.get('/api/hitter-recent-games/', {'player_id': '76232'}).json()
+        by_name = self.client.get('/api/hitter-recent-games/', {'player_name': '양의지'}).json()
+        self.assertEqual([game['상대'] for game in by_id], ['NC', 'KT'])
+        self.assertEqual(len(by_name), 3)
+
+    def test_profile_uses_player_id(self):
+        data = self.client.get('/api/players/76232/profile/').json()
+        self.assertEqual(data['season_2025']['선수명'], '양의지')
+        self.assertEqual([game['상대'] for game in data['recent_games']], ['NC', 'KT'])
+
+    def test_multi_position_player_has_one_profile(self):
+        with connection.cursor() as cursor:
+            cursor.execute("INSERT INTO `kbo_defense_positions` VALUES ('오스틴', 'LG', '좌익수', '0.980')")
+            rebuild_hitters_with_positions(cursor, connection.vendor)
+        data = self.client.get('/api/mysql-players/').json()
+        self.assertEqual([p['id'] for p in data['first'] + data['left']], [69102, 69102])
+        profile = self.client.get('/api/players/69102/profile/').json()
+        self.assertEqual(profile['player']['positions'], ['first', 'left'])
+        results = self.client.get('/api/players/search/', {'q': '오스틴'}).json()
+        self.assertEqual([(p['id'], p['positions']) for p in results], [(69102, ['first', 'left'])])
+
+    def test_temporary_id_profile_uses_name(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO `kbo_hitters_top150` (`순위`, `선수명`, `팀명`, `AB`, `TB`, `player_id`) "
+                "VALUES ('6', '신인', 'NC', '10', '1', '')"
+            )
+            cursor.execute("INSERT INTO `kbo_defense_positions` VALUES ('신인', 'NC', '포수', '1.000')")
+            cursor.execute("INSERT INTO `hitter_recent_games_log` (`player_id`, `선수명`, `일자`, `상대`) "
+                           "VALUES ('', '신인', '09.05', 'SSG')")
+            rebuild_hitters_with_positions(cursor, connection.vendor)
+        data = self.client.get('/api/mysql-players/').json()
+        player_id = next(p['id'] for p in data['catcher'] if p['name'] == '신인')
+        self.assertLess(player_id, 10000)
+        for url in (f'/api/players/{player_id}/profile/', f'/api/async/players/{player_id}/profile/'):
+            profile = self.client.get(url).json()
+            self.assertEqual([game['상대'] for game in profile['recent_games']], ['SSG'])
+
+
+class StatStoreTest(TestCase):
+    """인메모리 기록 저장소 필터 / 정렬 / 상위 N명"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+
+    def test_top_with_filters(self):
+        table = stat_table('kbo_hitters_top150')
+        self.assertEqual([row['선수명'] for row in table.top('HR', 2)], ['김도영', '오스틴'])
+        self.assertEqual([row['선수명'] for row in table.top('AVG', filters=[('팀명', '==', 'LG')])], ['오스틴', '박해민'])
+        self.assertEqual([row['선수명'] for row in table.top('HR', filters=[('PA', '>=', 600)])], ['김도영', '오스틴'])
+
+    def test_lookup_by_id_and_name(self):
+        table = stat_table('kbo_hitters_top150')
+        self.assertEqual(table.rows_for_id('52605')[0]['선수명'], '김도영')
+        self.assertEqual(table.rows_for_name('양의지')[0]['HR'], 17)
+
+
+class TeamSummaryTest(TestCase):
+    """/api/team-summary/ 라인업 기록 / 팀 능력치 / 예상 승률 (기존 stats.tsx 클라이언트 계산과 같은 공식)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+        cache.clear()
+        self.client = APIClient()
+
+    def test_aggregates_abilities_and_win_rate(self):
+        data = self.client.get(
+            '/api/team-summary/', {'catcher': 76232, 'third': 52605, 'pitchers': [76715, 69446]}
+        ).json()
+        stats = data['stats']
+        self.assertEqual((stats['total_bases'], stats['hits'], stats['at_bats']), (551, 317, 952))
+        self.assertEqual((stats['era'], stats['fielding_percentage'], stats['runs']), (3.765, 0.967, 100.0))
+        self.assertEqual(
+            {axis['key']: axis['value'] for axis in data['abilities']['axes']},
+            {'power': 70, 'accuracy': 83, 'running': 100, 'defense': 78, 'pitching': 37},
+        )
+        self.assertEqual(data['expected_win_rate'], 0.563)
+        self.assertEqual(data['missing'], [])
+
+    def test_same_lineup_is_computed_once(self):
+        first = self.client.post(
+            '/api/team-summary/', {'third': 52605, 'catcher': 76232, 'pitchers': [69446, 76715, 1234]}, format='json'
+        ).json()
+        self.assertEqual(first['missing'], [1234])
+        with self.assertNumQueries(0):
+            second = self.client.get(
+                '/api/team-summary/', {'catcher': 76232, 'third': 52605, 'pitchers': [1234, 76715, 69446]}
+            ).json()
+        self.assertEqual(second, first)
+
+    def test_temporary_ids_use_name_and_team(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO `kbo_hitters_top150` (`순위`, `선수명`, `팀명`, `AVG`, `R`, `H`, `AB`, `TB`, `HR`, `RBI`, `player_id`) "
+                "VALUES ('6', '신인', 'NC', '0.300', '20', '30', '100', '40', '3', '15', '')"
+            )
+            cursor.execute("INSERT INTO `kbo_defense_positions` VALUES ('신인', 'NC', '포수', '1.000')")
+            cursor.execute(
+                "INSERT INTO `kbo_pitchers_top150` (`순위`, `선수명`, `팀명`, `ERA`, `W`, `SO`, `player_id`) "
+                "VALUES ('3', '김신인', 'NC', '2.50', '4', '50', '')"
+            )
+            rebuild_hitters_with_positions(cursor, connection.vendor)
+        players = self.client.get('/api/mysql-players/').json()
+        catcher = next(p['id'] for p in players['catcher'] if p['name'] == '신인')
+        pitcher = next(p['id'] for p in players['pitcher'] if p['name'] == '김신인')
+        self.assertLess(max(catcher, pitcher), 10000)
+
+        data = self.client.get('/api/team-summary/', {'catcher': catcher, 'pitchers': [pitcher, 76715]}).json()
+        self.assertEqual(data['missing'], [])
+        stats = data['stats']
+        self.assertEqual((stats['hits'], stats['at_bats'], stats['fielding_percentage']), (30, 100, 1.0))
+        self.assertEqual((stats['era'], stats['wins']), (3.185, 7.0))
+
+    def test_invalid_lineup_returns_400(self):
+        self.assertEqual(self.client.get('/api/team-summary/').status_code, 400)
+        self.assertEqual(self.client.get('/api/team-summary/', {'catcher': '양의지'}).status_code, 400)
+
+
+class CrawledSchemaTest(TestCase):
+    """크롤링 테이블 타입 정리 (migrate_crawled_schema) 계획과 정리 후 API 응답 형식"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+        self.client = APIClient()
+
+    def test_plans_only_columns_that_need_converting(self):
+        changes = column_changes({
+            'id': 'int', '선수명': 'text', '팀명': 'varchar', '일자': 'varchar',
+            'G': 'varchar', 'AVG': 'varchar', 'TB': 'bigint', 'IP': 'varchar',
+        })
+        self.assertEqual(changes, [
+            ('선수명', 'text', 'VARCHAR(50)'),
+            ('일자', 'date', 'DATE'),
+            ('G', 'int', 'INT'),
+            ('AVG', 'float', 'DOUBLE'),
+        ])
+        self.assertEqual(
+            alter_table_sql('kbo_pitchers_top150', [('G', 'int', 'INT')], [('idx_g', ('G',))]),
+            'ALTER TABLE `kbo_pitchers_top150` MODIFY `G` INT NULL, ADD INDEX `idx_g` (`G`)',
+        )
+        self.assertEqual([db_value(v) for v in [' 26 ', '-', '', '1,234', '158 1/3']], ['26', None, None, '1234', '158 1/3'])
+
+    def test_date_columns_keep_crawled_format(self):
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TABLE `hitter_recent_games_log`')
+            cursor.execute(
+                'CREATE TABLE `hitter_recent_games_log` '
+                '(`player_id` VARCHAR(20), `선수명` VARCHAR(50), `일자` DATE, `상대` VARCHAR(20), '
+                + ', '.join(f'`{column}` INT' for column in FIXTURE_TABLES['hitter_recent_games_log'][4:]) + ')'
+            )
+            cursor.executemany(
+                'INSERT INTO `hitter_recent_games_log` (`player_id`, `선수명`, `일자`, `상대`, `H`) VALUES (%s, %s, %s, %s, %s)',
+                [['76232', '양의지', date(2025, 9, 4), 'KT', 2], ['76232', '양의지', date(2025, 9, 3), 'NC', 1]],
+            )
+
+        games = self.client.get('/api/hitter-recent-games/', {'player_id': '76232'}).json()
+        self.assertEqual([(game['일자'], game['H']) for game in games], [('09.03', 1), ('09.04', 2)])
+        self.assertEqual(stat_table('hitter_recent_games_log').rows[0]['일자'], '09.03')
+
+    def test_command_is_mysql_only(self):
+        out = StringIO()
+        call_command('migrate_crawled_schema', dry_run=True, stdout=out)
+        self.assertIn('MySQL이 아니므로', out.getvalue())
+
+
+class LeadersTest(TestCase):
+    """기록 순위표 (미리 계산된 기록별 순위)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+        self.client = APIClient()
+
+    def test_rate_stat_defaults_to_qualified(self):
+        data = self.client.get('/api/leaders/', {'stat': 'AVG', 'source': 'top150', 'limit': 3}).json()
+        self.assertTrue(data['qualified'])
+        self.assertEqual(data['min_qualifying'], {'column': 'PA', 'value': 446.4})
+        self.assertEqual([(e['rank'], e['선수명'], e['value']) for e in data['results']],
+                         [(1, '김도영', 0.347), (2, '오스틴', 0.319), (3, '양의지', 0.314)])
+
+    def test_lower_is_better_stats_ascend(self):
+        data = self.client.get('/api/leaders/', {'stat': 'ERA', 'type': 'pitcher', 'source': 'top150'}).json()
+        self.assertEqual(data['order'], 'asc')
+        self.assertEqual([e['선수명'] for e in data['results']], ['원태인', '류현진'])
+
+    def test_2025_leaders_use_team_lookup(self):
+        data = self.client.get('/api/leaders/', {'stat': 'HR', 'limit': 2}).json()
+        self.assertEqual([(e['선수명'], e['팀명'], e['value']) for e in data['results']],
+                         [('김도영', 'KIA', 38), ('오스틴', 'LG', 32)])
+
+    def test_invalid_params_return_400(self):
+        self.assertEqual(self.client.get('/api/leaders/').status_code, 400)
+        self.assertEqual(self.client.get('/api/leaders/', {'stat': 'XX'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/leaders/', {'stat': 'HR', 'type': 'catcher'}).status_code, 400)
+
+
+class PlayerSearchTest(TestCase):
+    """선수 이름 자동완성 검색 (접두사 / 초성 / 오타)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+        self.client = APIClient()
+
+    def search(self, query):
+        response = self.client.get('/api/players/search/', {'q': query})
+        self.assertEqual(response.status_code, 200)
+        return [(player['name'], player['match']) for player in response.json()]
+
+    def test_prefix_initials_and_typo(self):
+        self.assertEqual(self.search('양의'), [('양의지', 'prefix')])
+        self.assertEqual(self.search('김도여'), [('김도영', 'prefix')])
+        self.assertEqual(self.search('ㅇㅇㅈ'), [('양의지', 'initials')])
+        self.assertEqual(self.search('오스튼'), [('오스틴', 'typo')])
+        self.assertEqual(self.search('류현진'), [('류현진', 'exact')])
+
+    def test_index_updates_only_changed_players(self):
+        from .player_search import PlayerSearchIndex
+        index = PlayerSearchIndex.build([{'id': 1, 'name': '양의지'}, {'id': 2, 'name': '김도영'}])
+        updated = index.updated([{'id': 1, 'name': '양의지'}, {'id': 3, 'name': '양현종'}])
+        self.assertEqual([p['name'] for p in updated.search('양')], ['양의지', '양현종'])
+        self.assertEqual(updated.search('김도영'), [])
+        self.assertEqual([p['name'] for p in index.search('양')], ['양의지'])
+
+    def test_missing_query_returns_400(self):
+        self.assertEqual(self.client.get('/api/players/search/').status_code, 400)
+
+
+class MetricsTest(TestCase):
+    """/metrics 엔드포인트별 지표"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+        REGISTRY.clear()
+        self.client = APIClient()
+
+    def test_records_latency_queries_and_cache(self):
+        self.client.get('/api/mysql-players/')
+        self.client.get('/api/mysql-players/')
+        body = self.client.get('/metrics').content.decode()
+        endpoint = 'endpoint="/api/mysql-players/"'
+        self.assertIn(f'nineup_http_requests_total{{{endpoint},method="GET",status="200"}} 2', body)
+        self.assertIn(f'nineup_http_request_duration_seconds_count{{{endpoint}}} 2', body)
+        # 첫 요청만 DB 조회 (투수 1 + 타자 JOIN 1), 두 번째는 스냅샷 적중
+        self.assertIn(f'nineup_db_queries_total{{{endpoint}}} 3', body)
+        self.assertIn(f'nineup_cache_requests_total{{{endpoint},result="hit"}}', body)
+        self.assertIn(f'nineup_cache_requests_total{{{endpoint},result="miss"}} 1', body)
+
+    def test_only_allowed_addresses_or_token(self):
+        self.assertEqual(self.client.get('/metrics', REMOTE_ADDR='203.0.113.7').status_code, 404)
+        with self.settings(METRICS_TOKEN='scrape-token'):
+            response = self.client.get('/metrics', REMOTE_ADDR='203.0.113.7', HTTP_AUTHORIZATION='Bearer wrong')
+            self.assertEqual(response.status_code, 404)
+            response = self.client.get('/metrics', REMOTE_ADDR='203.0.113.7', HTTP_AUTHORIZATION='Bearer scrape-token')
+            self.assertEqual(response.status_code, 200)
+
+
+class ImageManifestTest(TestCase):
+    """선수 이미지 매니페스트 (player_id / 선수명 → 이미지 목록)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+        self.client = APIClient()
+
+    def test_lookup_by_player_id_and_name(self):
+        images = self.client.get('/api/player-images/', {'player_ids': ['76715'], 'names': ['김광현']}).json()
+        self.assertEqual([(i['playerName'], i['imageType']) for i in images],
+                         [('류현진', '1'), ('류현진', 'profile'), ('김광현', '1')])
+        profile = self.client.get('/api/players/76715/profile/').json()
+        self.assertEqual([i['imageType'] for i in profile['images']], ['1', 'profile'])
+
+    def test_post_batch_uses_one_query_per_data_version(self):
+        body = {'player_ids': ['76715', '76232'], 'names': ['김광현']}
+        with CaptureQueriesContext(connection) as queries:
+            first = self.client.post('/api/player-images/', body, format='json')
+            second = self.client.post('/api/player-images/', body, format='json')
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(len(first.json()), 3)
+        self.assertEqual(first.json(), second.json())
+        too_many = {'player_ids': [str(i) for i in range(MAX_IMAGE_BATCH + 1)]}
+        self.assertEqual(self.client.post('/api/player-images/', too_many, format='json').status_code, 400)
+
+    def test_sizes_from_manifest_file(self):
+        rows = [dict(zip(FIXTURE_TABLES['photo_data'], photo)) for photo in FIXTURE_PHOTOS]
+        manifest = build_manifest(rows, {'https://img.example/류현진_1.jpg': (600, 800)})
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'manifest.json'
+            write_manifest(manifest, path)
+            sizes = load_sizes(path)
+        rebuilt = ImageManifest(build_manifest(rows, sizes))
+        first = rebuilt.images_for_id('76715')[0]
+        self.assertEqual((first['width'], first['height']), (600, 800))
+        self.assertEqual(rebuilt.images_for_name('김광현')[0]['width'], None)
+
+
+class ReadyzTest(TestCase):
+    """/readyz 준비 상태 (미리 채우기 완료 + DB)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+
+    def setUp(self):
+        clear_all()
+        WARMED_UP.clear()
+        self.client = APIClient()
+
+    def test_not_ready_until_warm_up_finishes(self):
+        # 미리 채우기 전에는 스냅샷을 만들지도, DB를 확인하지도 않고 바로 503
+        with self.assertNumQueries(0):
+            response = self.client.get('/readyz')
+        self.assertEqual(response.status_code, 503)
+        data = response.json()
+        self.assertEqual(data['status'], 'warming_up')
+        self.assertIn('mysql-players', data['snapshots']['missing'])
+        self.assertIsNone(data['database'])
+
+    def test_ready_once_snapshots_are_built(self):
+        self.assertEqual(warm_up(), {})
+        response = self.client.get('/readyz')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['status'], 'ready')
+        self.assertEqual(data['snapshots']['missing'], [])
+        self.assertTrue(data['database']['ok'])
+        # 미리 채웠으므로 첫 요청도 DB를 조회하지 않음
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/mysql-players/')
+        self.assertEqual(len(queries), 0)
+
+    def test_not_ready_while_a_snapshot_cannot_be_built(self):
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TABLE `kbo_pitchers_top150`')
+        self.assertIn('mysql-players', warm_up())
+        # 준비 확인 요청은 실패한 스냅샷을 다시 만들지 않음
+        with self.assertNumQueries(0):
+            response = self.client.get('/readyz')
+        self.assertEqual(response.status_code, 503)
+        data = response.json()
+        self.assertIn('mysql-players', data['snapshots']['missing'])
+        self.assertIn('mysql-players', data['snapshots']['errors'])
+
+
+class LoadtestSeedTest(TestCase):
+    """부하 테스트 고정 데이터 (seed_loadtest_data)로 주요 API 응답"""
+
+    def setUp(self):
+        clear_all()
+        self.client = APIClient()
+
+    def test_seeded_data_serves_read_paths(self):
+        call_command('seed_loadtest_data', hitters=30, pitchers=20, games=3, stdout=StringIO())
+
+        players = self.client.get('/api/mysql-players/').json()
+        self.assertEqual(len(players['pitcher']), 20)
+        self.assertIn('양의지', [p['name'] for p in players['catcher']])
+        self.assertEqual(Player.objects.count(), 50)
+
+        profile = self.client.get('/api/players/76715/profile/').json()
+        self.assertEqual(profile['player']['name'], '류현진')
+        self.assertEqual(len(profile['recent_games']), 3)
+        self.assertEqual(self.client.get('/api/leaders/', {'stat': 'HR'}).status_code, 200)
+
+    def test_async_target_only_requests_async_routes(self):
+        call_command('seed_loadtest_data', hitters=30, pitchers=20, games=3, stdout=StringIO())
+        requests = async_requests(LOADTEST_MIXES['mixed'])
+        labels = {label for label, *_ in requests}
+        self.assertIn('players/profile', labels)
+        self.assertFalse(labels & {'players/search', 'team-summary', 'hot-players', 'simulate-at-bat'})
+        for _, _, method, path, _ in requests:
+            self.assertEqual(self.client.get(ASYNC_PREFIX + path).status_code, 200, path)
+
+
+# 라우트별 요청과 예산: URL 이름 → (메서드, 경로, 요청 본문, 첫 요청 최대 쿼리 수, 캐시된 요청 최대 쿼리 수)
+# baseball/urls.py에 라우트를 추가하면 여기에도 추가해야 RouteBudgetTest가 통과한다
+SIMULATION_BODY = {
+    'batter': {'name': '양의지', 'batting_average': 0.314, 'home_runs': 17},
+    'pitcher': {'name': '류현진', 'era': 3.87, 'whip': 1.26},
+}
+ROUTE_BUDGETS = {
+    'api-root': ('get', '/api/', None, 0, 0),
+    'player-list': ('get', '/api/players/', None, 1, 1),
+    'player-detail': ('get', '/api/players/{player_pk}/', None, 1, 1),
+    'player-by-position': ('get', '/api/players/by_position/?position=pitcher', None, 1, 1),
+    # 포지션마다 쿼리하면(9번) 실패
+    'player-all-by-position': ('get', '/api/players/all_by_position/', None, 1, 1),
+    # 능력치 1 + 투수 1 + 타자 1 (포지션별 쿼리로 돌아가면 실패)
+    'mysql-players': ('get', '/api/mysql-players/', None, 3, 0),
+    'player-images': ('get', '/api/player-images/?names=양의지&names=류현진', None, 1, 0),
+    'hitter-recent-games': ('get', '/api/hitter-recent-games/?player_id=76232', None, 1, 0),
+    'pitcher-recent-games': ('get', '/api/pitcher-recent-games/?player_id=76715', None, 1, 0),
+    # 로그 테이블별 IN (...) 한 번 (선수별 쿼리로 돌아가면 실패)
+    'recent-games': ('get', '/api/recent-games/?player_ids=76232&player_ids=52605&player_ids=76715', None, 2, 0),
+    'hitters-2025': ('get', '/api/hitters-2025/', None, 1, 0),
+    'pitchers-2025': ('get', '/api/pitchers-2025/', None, 1, 0),
+    'leaders': ('get', '/api/leaders/?stat=HR&limit=3', None, 3, 0),
+    'player-search': ('get', '/api/players/search/?q=ㅇㅇㅈ', None, 3, 0),
+    'player-profile': ('get', '/api/players/76232/profile/', None, 7, 0),
+    # 저장소 테이블 3개 (타자 / 투수 / 수비), 같은 라인업은 캐시
+    'team-summary': ('get', '/api/team-summary/?catcher=76232&third=52605&pitchers=76715', None, 3, 0),
+    # 최근 폼 테이블 인덱스 순서로 한 번 (경기 로그에서 다시 계산하면 실패)
+    'hot-players': ('get', '/api/hot-players/?type=hitter&games=5', None, 1, 0),
+    'simulate-at-bat': ('post', '/api/simulate-at-bat/', SIMULATION_BODY, 0, 0),
+    'async-mysql-players': ('get', '/api/async/mysql-players/', None, 3, 0),
+    'async-player-images': ('get', '/api/async/player-images/?names=양의지&names=류현진', None, 1, 0),
+    'async-recent-games': ('get', '/api/async/recent-games/?player_ids=76232&player_ids=76715', None, 2, 0),
+    'async-hitters-2025': ('get', '/api/async/hitters-2025/', None, 1, 0),
+    'async-pitchers-2025': ('get', '/api/async/pitchers-2025/', None, 1, 0),
+    'async-leaders': ('get', '/api/async/leaders/?stat=HR&limit=3', None, 3, 0),
+    'async-player-profile': ('get', '/api/async/players/76232/profile/', None, 7, 0),
+}
+
+# 응답 시간 예산 (ms) - 고정 데이터 기준으로 넉넉하게, 반복 조회나 전체 재계산 같은 큰 회귀만 잡는다
+COLD_TIME_BUDGET_MS = 500
+WARM_TIME_BUDGET_MS = 100
+
+
+def route_names(patterns):
+    """urlpatterns의 모든 URL 이름 (include 포함)"""
+    names = set()
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            names |= route_names(pattern.url_patterns)
+        elif pattern.name:
+            names.add(pattern.name)
+    return names
+
+
+class RouteBudgetTest(TestCase):
+    """baseball/urls.py 모든 라우트의 쿼리 수 / 응답 시간 예산"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_fixture_tables()
+        players = [
+            Player.objects.create(name=f'선수{i}', team='LG', position=position, back_number=i)
+            for i, (position, _) in enumerate(Player.POSITION_CHOICES * 2)
+        ]
+        cls.player_pk = players[0].pk
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def request(self, method, path, body):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = getattr(self.client, method)(path, body, format='json') if body else getattr(self.client, method)(path)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        return response, len(queries), elapsed_ms
+
+    def test_every_route_has_a_budget(self):
+        missing = route_names(baseball_urls.urlpatterns) - set(ROUTE_BUDGETS)
+        self.assertFalse(missing, f'ROUTE_BUDGETS에 없는 라우트: {sorted(missing)}')
+
+    def test_routes_stay_within_budget(self):
+        for name, (method, path, body, cold_queries, warm_queries) in ROUTE_BUDGETS.items():
+            path = path.format(player_pk=self.player_pk)
+            with self.subTest(route=name):
+                clear_all()
+                cache.clear()
+                response, queries, elapsed_ms = self.request(method, path, body)
+                self.assertLess(response.status_code, 400, f'{name}: {response.content[:200]}')
+                self.assertLessEqual(queries, cold_queries, f'{name} 첫 요청 쿼리 수')
+                self.assertLessEqual(elapsed_ms, COLD_TIME_BUDGET_MS, f'{name} 첫 요청 시간')
 
-# Create your tests here.
+                response, queries, elapsed_ms = self.request(method, path, body)
+                self.assertLess(response.status_code, 400, name)
+                self.assertLessEqual(queries, warm_queries, f'{name} 캐시된 요청 쿼리 수')
+                self.assertLessEqual(elapsed_ms, WARM_TIME_BUDGET_MS, f'{name} 캐시된 요청 시간')
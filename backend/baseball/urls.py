@@ -1,6 +1,6 @@
-from django.urls import path
+from django.urls import include, path
 from rest_framework.routers import DefaultRouter
-from .views import PlayerViewSet, get_players_by_position_mysql, get_player_images, get_hitter_recent_games, get_pitcher_recent_games, get_2025_hitters, get_2025_pitchers, simulate_at_bat
+from .views import PlayerViewSet, get_players_by_position_mysql, get_player_images, get_hitter_recent_games, get_pitcher_recent_games, get_recent_games_batch, get_2025_hitters, get_2025_pitchers, get_leaders, get_player_profile, get_team_summary, get_hot_players, search_players, simulate_at_bat
 
 router = DefaultRouter()
 router.register(r'players', PlayerViewSet)
@@ -14,10 +14,24 @@ urlpatterns = [
     path('hitter-recent-games/', get_hitter_recent_games, name='hitter-recent-games'),
     # 투수 최근 경기 기록 API
     path('pitcher-recent-games/', get_pitcher_recent_games, name='pitcher-recent-games'),
+    # 여러 선수 최근 경기 기록 일괄 API
+    path('recent-games/', get_recent_games_batch, name='recent-games'),
     # 2025 타자 목록 API
     path('hitters-2025/', get_2025_hitters, name='hitters-2025'),
     # 2025 투수 목록 API
     path('pitchers-2025/', get_2025_pitchers, name='pitchers-2025'),
+    # 기록 순위표 API
+    path('leaders/', get_leaders, name='leaders'),
+    # 선수 이름 자동완성 검색 API
+    path('players/search/', search_players, name='player-search'),
+    # 선수 프로필 통합 API (기록 + 능력치 + 이미지 + 최근 경기)
+    path('players/<int:player_id>/profile/', get_player_profile, name='player-profile'),
+    # 라인업 팀 요약 API (기록 평균 / 합계 + 팀 능력치 + 예상 승률)
+    path('team-summary/', get_team_summary, name='team-summary'),
+    # 최근 폼 상위 선수 API (최근 3 / 5 / 10경기 OPS / ERA)
+    path('hot-players/', get_hot_players, name='hot-players'),
     # 타자 vs 투수 시뮬레이션 API
     path('simulate-at-bat/', simulate_at_bat, name='simulate-at-bat'),
+    # 비동기 읽기 API (ASGI 서버용, 응답은 위 API와 같음)
+    path('async/', include('baseball.async_urls')),
 ] + router.urls
@@ -1,10 +1,29 @@
 from rest_framework import viewsets, status
-from rest_framework.decorators import action, api_view
+from rest_framework.decorators import action, api_view, renderer_classes
 from rest_framework.response import Response
-from django.db import connection
-import pymysql
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from .hitter_positions import (
+    COLUMN_NAMES as HITTER_POSITION_COLUMNS,
+    HITTER_POSITION_KR,
+    MATERIALIZED_TABLE,
+    materialized_rows,
+)
+from .image_manifest import ImageManifest, build_manifest, load_sizes, parse_image_params
+from .leaders import LEADER_TABLES, Leaderboard, parse_leaders_params, team_games
+from .league_ratings import RATINGS_TABLE, PlayerRatings, load_ratings
+from .metrics import record_cache
 from .models import Player
+from .player_search import PlayerSearchIndex, parse_search_params
+from .ratings import FIXED_SCALE, LEAGUE_PERCENTILE_SCALE, hitter_ratings, pitcher_ratings, rating_axes
+from .recent_form import FORM_TABLE, form_rows, hot_players_from_rows, hot_players_query, parse_hot_params
+from .renderers import LIST_RENDERER_CLASSES, to_columnar
 from .serializers import PlayerSerializer
+from .responses import snapshot_response
+from .snapshots import get_data_version, snapshot
+from .stat_lists import InvalidListQuery, StatList, date_text, has_list_params, parse_list_params
+from .stat_store import parse_ip, stat_table
+from .team_summary import TeamStatSource, lineup_hash, parse_lineup_params, team_summary
 
 class PlayerViewSet(viewsets.ModelViewSet):
     """
@@ -37,12 +56,17 @@ class PlayerViewSet(viewsets.ModelViewSet):
         GET /api/players/all_by_position/
         """
         positions = [choice[0] for choice in Player.POSITION_CHOICES]
-        data = {}
+        players_by_position = {position: [] for position in positions}
         
-        for position in positions:
-            players = self.queryset.filter(position=position)
-            serializer = self.get_serializer(players, many=True)
-            data[position] = serializer.data
+        # 쿼리 한 번으로 가져와 포지션별로 나눈다 (포지션마다 쿼리하지 않음, 순서는 등번호 순 유지)
+        for player in self.queryset.all():
+            if player.position in players_by_position:
+                players_by_position[player.position].append(player)
+        
+        data = {
+            position: self.get_serializer(players, many=True).data
+            for position, players in players_by_position.items()
+        }
         
         return Response(data)
 
@@ -52,33 +76,9 @@ class PlayerViewSet(viewsets.ModelViewSet):
 # KBO 공식 사이트 크롤링 데이터 (2024 시즌)
 # ==========================================
 
-# 포지션 매핑: DB 포지션 → 프론트엔드 포지션 키
-POSITION_MAPPING = {
-    'P': 'pitcher',      # 투수
-    'C': 'catcher',      # 포수
-    '1B': 'first',       # 1루수
-    '2B': 'second',      # 2루수
-    '3B': 'third',       # 3루수
-    'SS': 'shortstop',   # 유격수
-    'LF': 'left',        # 좌익수
-    'CF': 'center',      # 중견수
-    'RF': 'right',       # 우익수
-}
-
-# 한글 포지션 → 영문 포지션 매핑 (수비 테이블용)
-POSITION_KR_TO_EN = {
-    '포수': 'C',
-    '1루수': '1B',
-    '2루수': '2B',
-    '3루수': '3B',
-    '유격수': 'SS',
-    '좌익수': 'LF',
-    '중견수': 'CF',
-    '우익수': 'RF',
-    '지명타자': 'DH',
-}
-
-# 포지션별 ID 시작 번호 (중복 방지)
+# player_id가 아직 없는 선수(get_kbo_profiles.py 실행 전)의 임시 ID 시작 번호 (KBO player_id는 5자리)
+# 임시 ID는 모두 TEMPORARY_ID_LIMIT보다 작다
+TEMPORARY_ID_LIMIT = 10000
 POSITION_ID_OFFSET = {
     'pitcher': 1000,
     'catcher': 2000,
@@ -105,11 +105,205 @@ POSITION_NAMES = {
 }
 
 
+def dictfetchall(cursor):
+    """커서 결과를 컬럼명 → 값 dict 리스트로 변환 (pymysql DictCursor와 같은 형식)"""
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def player_key(row, position, idx):
+    """
+    선수 ID = KBO player_id (정렬 순서나 데이터 갱신과 관계없이 같은 선수는 같은 ID)
+    player_id가 아직 채워지지 않은 선수만 포지션별 임시 ID (1001, 2001, ...)
+    """
+    player_id = str(row.get('player_id') or '').strip()
+    if player_id.isdigit():
+        return int(player_id)
+    return POSITION_ID_OFFSET[position] + idx + 1
+
+
+def profile_recent_games_key(player):
+    """프로필 최근 경기 조회 키: KBO player_id면 ('player_id', ID), 임시 ID면 ('선수명', 이름)"""
+    if player['id'] < TEMPORARY_ID_LIMIT:
+        return '선수명', player['name']
+    return 'player_id', str(player['id'])
+
+
+def unique_players(players_by_position):
+    """
+    포지션별 선수 목록 → 선수 ID별 한 명 (여러 포지션을 맡은 타자는 같은 ID로 여러 번 나옴)
+    처음 나온 포지션의 선수 dict에 맡은 포지션 목록 "positions"를 붙인다
+    """
+    players = {}
+    for position, position_players in players_by_position.items():
+        for player in position_players:
+            if player['id'] in players:
+                players[player['id']]['positions'].append(position)
+            else:
+                players[player['id']] = {**player, 'positions': [position]}
+    return list(players.values())
+
+
+def hitters_with_positions(cursor):
+    """
+    포지션 정보가 있는 타자 행 (TB 내림차순)
+    구체화 테이블이 아직 없으면(build_materialized 실행 전) 크롤링 테이블 JOIN으로 대신한다
+    """
+    select_columns = ', '.join(f'`{column}`' for column in HITTER_POSITION_COLUMNS)
+    try:
+        cursor.execute(f"SELECT {select_columns} FROM `{MATERIALIZED_TABLE}` ORDER BY `TB` DESC")
+        return dictfetchall(cursor)
+    except DatabaseError as e:
+        print(f"⚠️ {MATERIALIZED_TABLE} 조회 실패, JOIN으로 대신합니다 "
+              f"(python manage.py build_materialized): {e}")
+        rows = [dict(zip(HITTER_POSITION_COLUMNS, row)) for row in materialized_rows(cursor)]
+        return sorted(rows, key=lambda row: -(row['TB'] or 0))
+
+
+def league_ratings(cursor):
+    """
+    선수별 리그 백분위 능력치 (데이터를 올릴 때 만든 player_ratings 테이블)
+    테이블이 아직 없으면(build_materialized 실행 전) 빈 조회 결과를 돌려주고, 모든 선수를 고정 상한 공식으로 대신한다
+    """
+    try:
+        return load_ratings(cursor)
+    except DatabaseError as e:
+        print(f"⚠️ {RATINGS_TABLE} 조회 실패, 고정 상한 공식으로 대신합니다 "
+              f"(python manage.py build_materialized): {e}")
+        return PlayerRatings([])
+
+
+# 선수 목록 투수 쿼리 (출장 경기 수 내림차순)
+PITCHERS_QUERY = """
+    SELECT `순위`, `선수명`, `팀명`, `ERA`, `G`, `W`, `L`, `SV`, `HLD`, `WPCT`, `IP`, `H`, `HR`, `BB`, `HBP`, `SO`, `R`, `ER`, `WHIP`, `player_id`
+    FROM `kbo_pitchers_top150`
+    ORDER BY `G` DESC
+"""
+
+
+@snapshot('mysql-players')
+def players_by_position_snapshot():
+    """
+    /api/mysql-players/ 응답 전체를 만든다 (데이터 버전당 한 번만 실행)
+    """
+    result = {}
+    
+    # 0. 능력치 (데이터를 올릴 때 계산한 리그 백분위, 선수마다 그대로 붙임)
+    with connection.cursor() as cursor:
+        ratings = league_ratings(cursor)
+    
+    # 1. 투수 데이터 (kbo_pitchers_top150 테이블 - 크롤링 데이터)
+    with connection.cursor() as cursor:
+        cursor.execute(PITCHERS_QUERY)
+        pitchers = dictfetchall(cursor)
+        
+        # 프론트엔드 형식으로 변환
+        result['pitcher'] = [
+            {
+                'id': player_key(p, 'pitcher', idx),
+                'name': p['선수명'],
+                'team': p['팀명'],
+                'position': 'pitcher',
+                'back_number': int(p['순위']) if p['순위'] else idx + 1,  # 순위를 등번호로 사용
+                'era': float(p['ERA']) if p['ERA'] else 0,
+                'wins': int(p['W']) if p['W'] else 0,
+                'losses': int(p['L']) if p['L'] else 0,
+                'holds': int(p['HLD']) if p['HLD'] else 0,
+                'saves': int(p['SV']) if p['SV'] else 0,
+                'strikeouts': int(p['SO']) if p['SO'] else 0,
+                'whip': float(p['WHIP']) if p['WHIP'] else 0,
+                'innings_pitched': parse_ip(p.get('IP')),
+                'walks': int(p['BB']) if p.get('BB') is not None else 0,
+                'ratings': ratings.get('pitcher', p.get('player_id'), p['선수명'], p['팀명']),
+            }
+            for idx, p in enumerate(pitchers)
+        ]
+    
+    # 2. 타자 데이터 (구체화 테이블 kbo_hitters_with_positions, JOIN 없이 TB 내림차순으로 한 번에 읽음)
+    hitters_by_position = {position: [] for position in HITTER_POSITION_KR}
+    with connection.cursor() as cursor:
+        for p in hitters_with_positions(cursor):
+            hitters_by_position[p['position']].append(p)
+    
+    # 프론트엔드 형식으로 변환 (정렬 순서는 포지션 안에서도 TB 내림차순 유지)
+    for frontend_position, position_players in hitters_by_position.items():
+        result[frontend_position] = [
+            {
+                'id': player_key(p, frontend_position, idx),
+                'name': p['선수명'],
+                'team': p['팀명'],
+                'position': frontend_position,
+                'back_number': int(p['순위']) if p['순위'] else idx + 1,
+                'batting_average': float(p['AVG']) if p['AVG'] else 0,
+                'rbis': int(p['RBI']) if p['RBI'] else 0,
+                'home_runs': int(p['HR']) if p['HR'] else 0,
+                'stolen_bases': int(p['R']) if p['R'] is not None else 0,  # 도루 대신 득점(R) 사용
+                'fielding_percentage': float(p['수비율']) if p.get('수비율') is not None and p.get('수비율') != '' else None,
+                'at_bats': int(p['AB']) if p.get('AB') is not None else 0,
+                'total_bases': int(p['TB']) if p.get('TB') is not None else 0,
+                'hits': int(p['H']) if p.get('H') is not None else 0,
+                'ratings': ratings.get('hitter', p.get('player_id'), p['선수명'], p['팀명']),
+            }
+            for idx, p in enumerate(position_players)
+        ]
+    
+    # 3. 능력치 척도는 응답 전체에서 하나 (테이블에 없는 선수가 있으면 모든 선수를 고정 상한 공식으로 계산)
+    players = [player for position_players in result.values() for player in position_players]
+    missing = sum(1 for player in players if player['ratings'] is None)
+    scale = LEAGUE_PERCENTILE_SCALE
+    if missing:
+        print(f"⚠️ {RATINGS_TABLE}에 없는 선수 {missing}명, 모든 선수를 고정 상한 공식으로 계산합니다 "
+              f"(python manage.py build_materialized --table {RATINGS_TABLE})")
+        scale = FIXED_SCALE
+        for player in players:
+            player['ratings'] = (
+                pitcher_ratings(player) if player['position'] == 'pitcher' else hitter_ratings(player)
+            )
+    for player in players:
+        player['ratings_scale'] = scale
+    
+    return result
+
+
+@snapshot('mysql-players-columnar')
+def players_by_position_columnar_snapshot():
+    """/api/mysql-players/ 컬럼형 응답 (포지션별 columns + rows)"""
+    return to_columnar(players_by_position_snapshot.get())
+
+
+def formatted_snapshot_response(request, instance, columnar_instance):
+    """
+    요청 형식에 맞는 미리 인코딩된 스냅샷 응답
+    - json (기본): instance
+    - columnar / msgpack: columnar_instance를 JSON / MessagePack으로
+    """
+    renderer_format = request.accepted_renderer.format
+    if renderer_format == 'json':
+        return snapshot_response(request, instance)
+    body_format = 'msgpack' if renderer_format == 'msgpack' else 'json'
+    return snapshot_response(request, columnar_instance, body_format=body_format)
+
+
 @api_view(['GET'])
+@renderer_classes(LIST_RENDERER_CLASSES)
 def get_players_by_position_mysql(request):
     """
     MySQL에서 포지션별 선수 데이터 가져오기
     GET /api/mysql-players/
+    GET /api/mysql-players/?format=columnar  (또는 ?format=msgpack)
+    
+    응답은 인메모리 스냅샷으로 보관되며, 데이터가 갱신될 때만 다시 조회합니다.
+    JSON/압축본은 미리 인코딩되어 있고 ETag가 같으면 304를 반환합니다.
+    (baseball/snapshots.py, baseball/responses.py 참고)
+    
+    format=columnar이면 포지션별로 키 이름을 한 번만 보냅니다:
+    {"pitcher": {"columns": ["id", "name", ...], "rows": [[1001, "류현진", ...], ...]}, ...}
+    
+    선수마다 "ratings"에 리그 백분위 능력치(0-100)가 붙어 있습니다 (데이터를 올릴 때 계산, baseball/league_ratings.py):
+    투수 {"control", "strikeouts", "hit_suppression", "clutch", "stamina"},
+    타자 {"power", "accuracy", "scoring", "defense", "stamina"}
+    "ratings_scale"은 능력치 척도이며 응답 전체에서 같습니다: "league_percentile" 또는
+    능력치 테이블에 없는 선수가 있을 때 "fixed" (모든 선수를 고정 상한 공식으로 계산)
     
     Returns:
     {
@@ -120,134 +314,9 @@ def get_players_by_position_mysql(request):
     }
     """
     try:
-        result = {}
-        
-        # 1. 투수 데이터 (kbo_pitchers_top150 테이블 - 크롤링 데이터)
-        with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT `순위`, `선수명`, `팀명`, `ERA`, `G`, `W`, `L`, `SV`, `HLD`, `WPCT`, `IP`, `H`, `HR`, `BB`, `HBP`, `SO`, `R`, `ER`, `WHIP`
-                FROM `kbo_pitchers_top150`
-                ORDER BY `G` DESC
-            """)
-            columns = [col[0] for col in cursor.description]
-            pitchers = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            
-            # IP 문자열을 소수점으로 변환하는 함수
-            def parse_ip(ip_str):
-                """'180 2/3' 형식의 IP를 소수점으로 변환"""
-                if not ip_str:
-                    return 0.0
-                try:
-                    ip_str = str(ip_str).strip()
-                    # 공백으로 분리
-                    parts = ip_str.split()
-                    if len(parts) == 1:
-                        # "80" 같은 경우
-                        return float(parts[0])
-                    elif len(parts) == 2:
-                        # "47 2/3" 같은 경우
-                        whole = float(parts[0])
-                        fraction = parts[1]
-                        if '/' in fraction:
-                            num, den = map(int, fraction.split('/'))
-                            return whole + (num / den)
-                        return whole
-                    else:
-                        return float(ip_str)
-                except (ValueError, AttributeError):
-                    return 0.0
-            
-            # 프론트엔드 형식으로 변환
-            result['pitcher'] = [
-                {
-                    'id': POSITION_ID_OFFSET['pitcher'] + idx + 1,  # 1001, 1002, 1003...
-                    'name': p['선수명'],
-                    'team': p['팀명'],
-                    'position': 'pitcher',
-                    'back_number': int(p['순위']) if p['순위'] else idx + 1,  # 순위를 등번호로 사용
-                    'era': float(p['ERA']) if p['ERA'] else 0,
-                    'wins': int(p['W']) if p['W'] else 0,
-                    'losses': int(p['L']) if p['L'] else 0,
-                    'holds': int(p['HLD']) if p['HLD'] else 0,
-                    'saves': int(p['SV']) if p['SV'] else 0,
-                    'strikeouts': int(p['SO']) if p['SO'] else 0,
-                    'whip': float(p['WHIP']) if p['WHIP'] else 0,
-                    'innings_pitched': parse_ip(p.get('IP')),
-                    'walks': int(p['BB']) if p.get('BB') is not None else 0,
-                }
-                for idx, p in enumerate(pitchers)
-            ]
-        
-        # 2. 타자 데이터 (kbo_hitters_top150 + kbo_defense_positions INNER JOIN)
-        # SQL JOIN으로 포지션 정보와 merge - 포지션 정보가 있는 선수만 표시
-        for db_position, frontend_position in POSITION_MAPPING.items():
-            if db_position == 'P':
-                continue  # 투수는 이미 처리함
-            
-            # 영문 포지션을 한글 포지션으로 변환 (DB의 POS 컬럼이 한글일 수 있음)
-            # POSITION_KR_TO_EN의 역매핑 생성
-            position_en_to_kr = {v: k for k, v in POSITION_KR_TO_EN.items()}
-            position_kr = position_en_to_kr.get(db_position)
-            
-            if not position_kr:
-                continue  # 매핑되지 않은 포지션은 스킵
-            
-            with connection.cursor() as cursor:
-                # INNER JOIN 사용: 포지션 정보가 있는 선수만 가져오기
-                # d.POS는 한글 포지션(포수, 1루수 등)이므로 position_kr을 사용
-                # 도루 대신 득점(R) 사용
-                cursor.execute("""
-                    SELECT 
-                        h.`순위`, 
-                        h.`선수명`, 
-                        h.`팀명`, 
-                        d.`POS` AS `포지션_영문`,
-                        h.`AVG`, 
-                        h.`G`, 
-                        h.`PA`, 
-                        h.`AB`, 
-                        h.`R`, 
-                        h.`H`, 
-                        h.`2B`, 
-                        h.`3B`, 
-                        h.`HR`, 
-                        h.`TB`, 
-                        h.`RBI`, 
-                        h.`SAC`, 
-                        h.`SF`,
-                        COALESCE(h.`R`, 0) AS `R`,
-                        d.`FPCT` AS `수비율`
-                    FROM `kbo_hitters_top150` h
-                    INNER JOIN `kbo_defense_positions` d 
-                        ON h.`선수명` = d.`선수명` 
-                        AND h.`팀명` = d.`팀명`
-                    WHERE d.`POS` = %s
-                    ORDER BY h.`TB` DESC
-                """, [position_kr])
-                columns = [col[0] for col in cursor.description]
-                position_players = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            
-            # 프론트엔드 형식으로 변환
-            result[frontend_position] = [
-                {
-                    'id': POSITION_ID_OFFSET[frontend_position] + idx + 1,
-                    'name': p['선수명'],
-                    'team': p['팀명'],
-                    'position': frontend_position,
-                    'back_number': int(p['순위']) if p['순위'] else idx + 1,
-                    'batting_average': float(p['AVG']) if p['AVG'] else 0,
-                    'rbis': int(p['RBI']) if p['RBI'] else 0,
-                    'home_runs': int(p['HR']) if p['HR'] else 0,
-                    'stolen_bases': int(p['R']) if p['R'] is not None else 0,  # 도루 대신 득점(R) 사용
-                    'fielding_percentage': float(p['수비율']) if p.get('수비율') is not None and p.get('수비율') != '' else None,
-                    'at_bats': int(p['AB']) if p.get('AB') is not None else 0,
-                    'total_bases': int(p['TB']) if p.get('TB') is not None else 0,
-                    'hits': int(p['H']) if p.get('H') is not None else 0,
-                }
-                for idx, p in enumerate(position_players)
-            ]
-        
-        return Response(result, status=status.HTTP_200_OK)
+        return formatted_snapshot_response(
+            request, players_by_position_snapshot, players_by_position_columnar_snapshot
+        )
     
     except Exception as e:
         return Response(
@@ -256,14 +325,170 @@ def get_players_by_position_mysql(request):
         )
 
 
+@snapshot('player-search')
+def player_search_snapshot():
+    """
+    /api/mysql-players/ 선수 이름 검색 인덱스
+    이전 데이터 버전의 인덱스가 있으면 바뀐 선수만 다시 색인한다
+    """
+    players = unique_players(players_by_position_snapshot.get())
+    previous = player_search_snapshot.last_value()
+    return previous.updated(players) if previous is not None else PlayerSearchIndex.build(players)
+
+
+@api_view(['GET'])
+def search_players(request):
+    """
+    선수 이름 자동완성 검색
+    GET /api/players/search/?q=양의&limit=10
+    GET /api/players/search/?q=ㅇㅇㅈ
+    
+    Query Parameters:
+    - q: 검색어 (필수) - 이름 앞부분(입력 중인 글자 포함), 초성, 이름 일부, 오타 1~2자 허용
+    - limit: 최대 인원 수 (기본 10, 최대 50)
+    
+    일치 종류 순(exact → prefix → initials → contains → typo), 같은 종류 안에서는 이름 순으로 정렬합니다.
+    
+    여러 포지션을 맡은 선수는 한 번만 나오고, "positions"에 맡은 포지션 목록이 있습니다.
+    
+    Returns:
+    [
+      {"id": 76232, "name": "양의지", "team": "두산", "position": "catcher", "positions": ["catcher"], ..., "match": "prefix"},
+      ...
+    ]
+    """
+    try:
+        try:
+            query, limit = parse_search_params(request.query_params)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response(player_search_snapshot.get().search(query, limit), status=status.HTTP_200_OK)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return Response(
+            {'error': str(e), 'detail': '선수 검색 중 오류가 발생했습니다.'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+# 최근 경기 기록 테이블과 조회 컬럼
+RECENT_GAME_TABLES = {
+    'hitter': ('hitter_recent_games_log', [
+        '일자', '상대', 'AVG', 'PA', 'AB', 'R', 'H',
+        '2B', '3B', 'HR', 'RBI', 'SB', 'CS', 'BB', 'HBP', 'SO', 'GDP',
+    ]),
+    'pitcher': ('pitcher_recent_games_log', [
+        '일자', '상대', '결과', 'ERA', 'TBF', 'IP', 'H',
+        'HR', 'BB', 'HBP', 'SO', 'R', 'ER', 'AVG',
+    ]),
+}
+
+# 선수별 캐시 유지 시간 (초) - 데이터 버전이 바뀌면 키가 달라져 자동 무효화
+PLAYER_CACHE_TIMEOUT = 60 * 60
+
+# 일괄 조회 최대 선수 수
+MAX_BATCH_PLAYERS = 100
+
+
+def player_cache_keys(prefix, keys):
+    """{캐시 키: 선수 키} (현재 데이터 버전이 포함되어 데이터 갱신 시 자동 무효화)"""
+    version = get_data_version()
+    return {f'{prefix}:{version}:{key}': key for key in keys}
+
+
+def cached_by_key(prefix, keys, load_missing):
+    """
+    키별 캐시 조회 후, 캐시에 없는 키만 load_missing(keys)로 한 번에 불러와 저장
+    
+    Args:
+        prefix: 캐시 키 접두사
+        keys: 조회할 키 목록
+        load_missing: 키 목록 → {키: 값} (모든 키에 대한 값을 반환해야 함)
+    
+    Returns:
+        {키: 값}
+    """
+    cache_keys = player_cache_keys(prefix, keys)
+    
+    cached = cache.get_many(list(cache_keys))
+    result = {cache_keys[cache_key]: value for cache_key, value in cached.items()}
+    missing = [key for cache_key, key in cache_keys.items() if cache_key not in cached]
+    record_cache(hits=len(result), misses=len(missing))
+    
+    if missing:
+        loaded = load_missing(missing)
+        cache.set_many(
+            {cache_key: loaded[key] for cache_key, key in cache_keys.items() if key in loaded},
+            PLAYER_CACHE_TIMEOUT
+        )
+        result.update(loaded)
+    
+    return result
+
+
+def recent_games_query(kind, key_field, keys):
+    """최근 경기 기록 IN (...) 쿼리 (sql, params) - 동기/비동기 뷰 공용"""
+    table, columns = RECENT_GAME_TABLES[kind]
+    select_columns = ', '.join(f'`{column}`' for column in columns)
+    placeholders = ', '.join(['%s'] * len(keys))
+    sql = f"""
+        SELECT `{key_field}` AS `_key`, {select_columns}
+        FROM `{table}`
+        WHERE `{key_field}` IN ({placeholders})
+        ORDER BY `일자` ASC
+    """
+    return sql, list(keys)
+
+
+def group_recent_games(games, keys):
+    """쿼리 결과 → {선수 ID/이름: [경기 기록, ...]} (기록이 없는 선수는 빈 리스트)"""
+    grouped = {key: [] for key in keys}
+    for game in games:
+        game['일자'] = date_text(game['일자'])
+        grouped[str(game.pop('_key'))].append(game)
+    return grouped
+
+
+def fetch_recent_games(kind, key_field, keys):
+    """
+    여러 선수의 최근 경기 기록 조회 (선수별 캐시 + 캐시에 없는 선수만 IN (...) 쿼리 한 번)
+    
+    Args:
+        kind: 'hitter' 또는 'pitcher'
+        key_field: 'player_id' 또는 '선수명'
+        keys: 선수 ID 또는 이름 목록
+    
+    Returns:
+        {선수 ID/이름: [경기 기록, ...]} (기록이 없는 선수는 빈 리스트)
+    """
+    def load(missing):
+        with connection.cursor() as cursor:
+            cursor.execute(*recent_games_query(kind, key_field, missing))
+            return group_recent_games(dictfetchall(cursor), missing)
+    
+    return cached_by_key(f'recent-games:{kind}:{key_field}', keys, load)
+
+
+def recent_games_key(params):
+    """단일 선수 최근 경기 조회 키: player_id가 있으면 ('player_id', ID), 없으면 ('선수명', 이름)"""
+    player_id = (params.get('player_id') or '').strip()
+    if player_id:
+        return 'player_id', player_id
+    return '선수명', params.get('player_name')
+
+
 @api_view(['GET'])
 def get_hitter_recent_games(request):
     """
     타자 최근 경기 기록 가져오기
+    GET /api/hitter-recent-games/?player_id=76232
     GET /api/hitter-recent-games/?player_name=양의지
     
     Query Parameters:
-        player_name: 선수 이름
+        player_id: KBO 선수 ID (/api/mysql-players/ 응답의 id, 동명이인 구분)
+        player_name: 선수 이름 (player_id가 없을 때)
     
     Returns:
     [
@@ -279,37 +504,20 @@ def get_hitter_recent_games(request):
     ]
     """
     try:
-        from config.db_config import DB_CONFIG
+        key_field, key = recent_games_key(request.query_params)
         
-        player_name = request.query_params.get('player_name')
-        
-        if not player_name:
+        if not key:
             return Response(
-                {'error': 'player_name 파라미터가 필요합니다.'},
+                {'error': 'player_id 또는 player_name 파라미터가 필요합니다.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        print(f"🔍 요청된 선수: {player_name}")
+        print(f"🔍 요청된 선수: {key}")
         
-        conn = pymysql.connect(**DB_CONFIG)
-        cursor = conn.cursor(pymysql.cursors.DictCursor)
+        games = fetch_recent_games('hitter', key_field, [key])[key]
+        print(f"✅ {key}의 최근 {len(games)}경기 데이터 조회 완료")
         
-        try:
-            cursor.execute("""
-                SELECT 
-                    `일자`, `상대`, `AVG`, `PA`, `AB`, `R`, `H`, 
-                    `2B`, `3B`, `HR`, `RBI`, `SB`, `CS`, `BB`, `HBP`, `SO`, `GDP`
-                FROM `hitter_recent_games_log`
-                WHERE `선수명` = %s
-                ORDER BY `일자` ASC
-            """, (player_name,))
-            
-            games = cursor.fetchall()
-            print(f"✅ {player_name}의 최근 {len(games)}경기 데이터 조회 완료")
-            
-            return Response(games, status=status.HTTP_200_OK)
-        finally:
-            conn.close()
+        return Response(games, status=status.HTTP_200_OK)
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -323,10 +531,12 @@ def get_hitter_recent_games(request):
 def get_pitcher_recent_games(request):
     """
     투수 최근 경기 기록 가져오기
+    GET /api/pitcher-recent-games/?player_id=76715
     GET /api/pitcher-recent-games/?player_name=류현진
     
     Query Parameters:
-        player_name: 선수 이름
+        player_id: KBO 선수 ID (/api/mysql-players/ 응답의 id, 동명이인 구분)
+        player_name: 선수 이름 (player_id가 없을 때)
     
     Returns:
     [
@@ -341,37 +551,20 @@ def get_pitcher_recent_games(request):
     ]
     """
     try:
-        from config.db_config import DB_CONFIG
-        
-        player_name = request.query_params.get('player_name')
+        key_field, key = recent_games_key(request.query_params)
         
-        if not player_name:
+        if not key:
             return Response(
-                {'error': 'player_name 파라미터가 필요합니다.'},
+                {'error': 'player_id 또는 player_name 파라미터가 필요합니다.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        print(f"🔍 요청된 투수: {player_name}")
+        print(f"🔍 요청된 투수: {key}")
         
-        conn = pymysql.connect(**DB_CONFIG)
-        cursor = conn.cursor(pymysql.cursors.DictCursor)
+        games = fetch_recent_games('pitcher', key_field, [key])[key]
+        print(f"✅ {key}의 최근 {len(games)}경기 데이터 조회 완료")
         
-        try:
-            cursor.execute("""
-                SELECT 
-                    `일자`, `상대`, `결과`, `ERA`, `TBF`, `IP`, `H`, 
-                    `HR`, `BB`, `HBP`, `SO`, `R`, `ER`, `AVG`
-                FROM `pitcher_recent_games_log`
-                WHERE `선수명` = %s
-                ORDER BY `일자` ASC
-            """, (player_name,))
-            
-            games = cursor.fetchall()
-            print(f"✅ {player_name}의 최근 {len(games)}경기 데이터 조회 완료")
-            
-            return Response(games, status=status.HTTP_200_OK)
-        finally:
-            conn.close()
+        return Response(games, status=status.HTTP_200_OK)
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -381,89 +574,123 @@ def get_pitcher_recent_games(request):
         )
 
 
+def parse_recent_games_params(params):
+    """
+    일괄 최근 경기 조회 파라미터 → (key_field, keys, kinds)
+    잘못된 요청이면 ValueError
+    """
+    player_ids = params.getlist('player_ids')
+    if player_ids:
+        key_field, keys = 'player_id', player_ids
+    else:
+        key_field, keys = '선수명', params.getlist('names')
+    
+    # 중복 제거 (요청 순서 유지)
+    keys = list(dict.fromkeys(key for key in keys if key))
+    
+    if not keys:
+        raise ValueError('names 또는 player_ids 파라미터가 필요합니다.')
+    if len(keys) > MAX_BATCH_PLAYERS:
+        raise ValueError(f'한 번에 최대 {MAX_BATCH_PLAYERS}명까지 조회할 수 있습니다.')
+    
+    player_type = params.get('type')
+    kinds = [player_type] if player_type in RECENT_GAME_TABLES else list(RECENT_GAME_TABLES)
+    return key_field, keys, kinds
+
+
 @api_view(['GET'])
-def get_player_images(request):
+def get_recent_games_batch(request):
     """
-    선수 이미지 목록 가져오기 (S3 URL 사용)
-    GET /api/player-images/?names=류현진&names=김광현
+    여러 선수의 최근 경기 기록 한 번에 가져오기
+    GET /api/recent-games/?names=양의지&names=류현진
+    GET /api/recent-games/?player_ids=76232&player_ids=76715
     
     Query Parameters:
         names: 선수 이름 목록 (여러 개 가능)
+        player_ids: 선수 ID 목록 (여러 개 가능, names 대신 사용)
+        type: 'hitter' 또는 'pitcher' (생략 시 두 테이블 모두 조회)
+    
+    Returns (기록이 있는 선수만 포함):
+    {
+      "hitters": {"양의지": [{"일자": "09.04", ...}, ...]},
+      "pitchers": {"류현진": [{"일자": "09.04", ...}, ...]}
+    }
+    """
+    try:
+        try:
+            key_field, keys, kinds = parse_recent_games_params(request.query_params)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        result = {}
+        for kind in kinds:
+            games_by_player = fetch_recent_games(kind, key_field, keys)
+            result[f'{kind}s'] = {key: games_by_player[key] for key in keys if games_by_player[key]}
+        
+        return Response(result, status=status.HTTP_200_OK)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return Response(
+            {'error': str(e), 'detail': '최근 경기 데이터 조회 중 오류가 발생했습니다.'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@snapshot('player-image-manifest')
+def player_image_manifest_snapshot():
+    """
+    선수 이미지 매니페스트 (데이터 버전당 photo_data 쿼리 한 번)
+    upload_to_s3.py가 만든 매니페스트 파일이 있으면 이미지 크기를 채운다
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            SELECT player_id, player_name, image_1, image_2, image_3, profile_img
+            FROM photo_data
+        """)
+        rows = dictfetchall(cursor)
+    return ImageManifest(build_manifest(rows, load_sizes()))
+
+
+def player_images_page(manifest, params):
+    """이미지 조회 파라미터 → 이미지 목록 (동기/비동기 뷰 공용, 잘못된 요청이면 ValueError)"""
+    player_ids, player_names = parse_image_params(params)
+    return manifest.lookup(player_ids, player_names)
+
+
+@api_view(['GET', 'POST'])
+def get_player_images(request):
+    """
+    선수 이미지 목록 가져오기 (S3 URL 사용, 인메모리 매니페스트에서 조회)
+    GET /api/player-images/?player_ids=76715&names=김광현
+    POST /api/player-images/ {"player_ids": ["76715", ...], "names": [...]}  (많은 선수를 한 번에 조회)
+    
+    Query Parameters / Body:
+        player_ids: 선수 ID 목록 (여러 개 가능)
+        names: 선수 이름 목록 (여러 개 가능, player_id가 없는 선수용)
     
     Returns:
     [
       {
-        "id": "1",
+        "id": "류현진_1",
         "playerName": "류현진",
-        "playerId": 1001,
+        "playerId": "76715",
         "imageUrl": "https://s3...amazonaws.com/players/류현진_1.jpg",
         "fileName": "류현진_1.jpg",
-        "imageType": "1"
+        "imageType": "1",
+        "width": 600,
+        "height": 800
       },
       ...
     ]
     """
     try:
-        from config.db_config import DB_CONFIG
-        
-        player_names = request.query_params.getlist('names')
-        
-        if not player_names:
-            return Response([], status=status.HTTP_200_OK)
-        
-        print(f"🔍 요청된 선수들: {player_names}")
-        
-        conn = pymysql.connect(**DB_CONFIG)
-        cursor = conn.cursor(pymysql.cursors.DictCursor)
-        
+        params = request.data if request.method == 'POST' else request.query_params
         try:
-            placeholders = ','.join(['%s'] * len(player_names))
-            cursor.execute(f"""
-                SELECT 
-                    player_id,
-                    player_name,
-                    image_1,
-                    image_2,
-                    image_3,
-                    profile_img
-                FROM photo_data
-                WHERE player_name IN ({placeholders})
-            """, player_names)
-            
-            players = cursor.fetchall()
-            print(f"✅ DB에서 {len(players)}명의 선수 데이터 조회 완료")
-            
-            image_files = []
-            for player in players:
-                player_name = player.get('player_name')
-                player_id = player.get('player_id')
-                print(f"📋 처리 중: {player_name} (player_id: {player_id})")
-                
-                image_types = [
-                    ('1', player.get('image_1')),
-                    ('2', player.get('image_2')),
-                    ('3', player.get('image_3')),
-                    ('profile', player.get('profile_img'))
-                ]
-                
-                for image_type, image_url in image_types:
-                    if image_url:
-                        image_files.append({
-                            'id': f"{player_name}_{image_type}",
-                            'playerName': player_name,
-                            'playerId': player_id,
-                            'imageUrl': image_url,
-                            'fileName': f"{player_name}_{image_type}.jpg",
-                            'imageType': image_type
-                        })
-                    else:
-                        print(f"   ⚠️ {image_type} 이미지 없음")
-            
-            print(f"📸 총 {len(image_files)}개의 이미지 반환")
-            
-            return Response(image_files, status=status.HTTP_200_OK)
-        finally:
-            conn.close()
+            images = player_images_page(player_image_manifest_snapshot.get(), params)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(images, status=status.HTTP_200_OK)
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -473,46 +700,98 @@ def get_player_images(request):
         )
 
 
+def profile_images(manifest, player_id, name):
+    """프로필 이미지 (player_id로 찾고, photo_data에 player_id가 없는 선수는 이름으로)"""
+    return manifest.images_for_id(player_id) or manifest.images_for_name(name)
+
+
+@snapshot('player-teams')
+def player_teams_snapshot():
+    """player_id → 팀명 (2025 목록 팀 필터용, 2025 테이블에는 팀명이 없음)"""
+    teams = {}
+    for table in ('kbo_hitters_top150', 'kbo_pitchers_top150'):
+        for row in stat_table(table).rows:
+            if row['player_id']:
+                teams[str(row['player_id'])] = row['팀명']
+    return teams
+
+
+def stat_list_page(request, list_snapshot):
+    """
+    ?limit=&cursor=&sort=&fields=&team= 파라미터로 한 페이지 응답
+    파라미터가 없으면 None (기존 전체 목록 응답 사용)
+    """
+    params = request.query_params
+    if not has_list_params(params):
+        return None
+
+    try:
+        page = list_snapshot.get().page(**parse_list_params(params))
+    except InvalidListQuery as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(page, status=status.HTTP_200_OK)
+
+
+@snapshot('hitters-2025')
+def hitters_2025_snapshot():
+    """2025 타자 목록 (선수명 순, 기록은 숫자로 변환된 인메모리 저장소 행)"""
+    hitters = stat_table('2025_score_hitters').rows
+    print(f"✅ 2025 타자 {len(hitters)}명 조회 완료")
+    return hitters
+
+
+@snapshot('hitters-2025-list')
+def hitters_2025_list_snapshot():
+    """2025 타자 목록 + 팀 정보 (정렬 기준별 정렬 결과는 요청 시 한 번만 계산)"""
+    return StatList(hitters_2025_snapshot.get(), player_teams_snapshot.get())
+
+
+@snapshot('hitters-2025-columnar')
+def hitters_2025_columnar_snapshot():
+    """2025 타자 목록 컬럼형 응답 (columns + rows)"""
+    return to_columnar(hitters_2025_snapshot.get())
+
+
 @api_view(['GET'])
+@renderer_classes(LIST_RENDERER_CLASSES)
 def get_2025_hitters(request):
     """
     2025 타자 목록 가져오기
     GET /api/hitters-2025/
+    GET /api/hitters-2025/?sort=-HR&limit=50&fields=player_id,선수명,HR&team=LG&cursor=...
+    
+    파라미터가 없으면 미리 인코딩된 전체 목록 스냅샷으로 응답합니다 (ETag / If-None-Match 304 지원).
+    
+    Query Parameters (하나라도 있으면 페이지 응답):
+    - sort: 정렬 컬럼 (기본 선수명, '-'를 붙이면 내림차순, 기록이 없는 선수는 마지막)
+    - limit: 페이지 크기 (기본 50, 최대 500)
+    - cursor: 이전 응답의 next_cursor
+    - fields: 응답에 포함할 컬럼 (쉼표로 구분)
+    - team: 팀명 필터 (kbo_*_top150에 있는 선수만 팀 정보가 있음)
+    
+    페이지 응답: {"count": 150, "next_cursor": "..." 또는 null, "results": [...]}
+    
+    format=columnar (또는 msgpack): 키 이름을 한 번만 보내는 컬럼형 응답
+    {"columns": ["player_id", "선수명", ...], "rows": [["76232", "양의지", ...], ...]}
+    (페이지 응답은 results가 {"columns", "rows"}로 바뀜)
     
     Returns:
     [
       {
         "player_id": "76232",
         "선수명": "양의지",
-        "AVG": "0.337",
-        "G": "130",
+        "AVG": 0.337,
+        "G": 130,
         ...
       },
       ...
     ]
     """
     try:
-        from config.db_config import DB_CONFIG
-        
-        conn = pymysql.connect(**DB_CONFIG)
-        cursor = conn.cursor(pymysql.cursors.DictCursor)
-        
-        try:
-            cursor.execute("""
-                SELECT 
-                    `player_id`, `선수명`, `AVG`, `G`, `PA`, `AB`, `R`, `H`, 
-                    `2B`, `3B`, `HR`, `TB`, `RBI`, `SAC`, `SF`, `SB`, `CS`, 
-                    `BB`, `IBB`, `HBP`, `SO`, `GDP`, `SLG`, `OBP`, `OPS`
-                FROM `2025_score_hitters`
-                ORDER BY `선수명`
-            """)
-            
-            hitters = cursor.fetchall()
-            print(f"✅ 2025 타자 {len(hitters)}명 조회 완료")
-            
-            return Response(hitters, status=status.HTTP_200_OK)
-        finally:
-            conn.close()
+        page = stat_list_page(request, hitters_2025_list_snapshot)
+        if page is not None:
+            return page
+        return formatted_snapshot_response(request, hitters_2025_snapshot, hitters_2025_columnar_snapshot)
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -522,52 +801,358 @@ def get_2025_hitters(request):
         )
 
 
+@snapshot('pitchers-2025')
+def pitchers_2025_snapshot():
+    """2025 투수 목록 (선수명 순, 기록은 숫자로 변환된 인메모리 저장소 행)"""
+    pitchers = stat_table('2025_score_pitchers').rows
+    print(f"✅ 2025 투수 {len(pitchers)}명 조회 완료")
+    return pitchers
+
+
+@snapshot('pitchers-2025-list')
+def pitchers_2025_list_snapshot():
+    """2025 투수 목록 + 팀 정보 (정렬 기준별 정렬 결과는 요청 시 한 번만 계산)"""
+    return StatList(pitchers_2025_snapshot.get(), player_teams_snapshot.get())
+
+
+@snapshot('pitchers-2025-columnar')
+def pitchers_2025_columnar_snapshot():
+    """2025 투수 목록 컬럼형 응답 (columns + rows)"""
+    return to_columnar(pitchers_2025_snapshot.get())
+
+
 @api_view(['GET'])
+@renderer_classes(LIST_RENDERER_CLASSES)
 def get_2025_pitchers(request):
     """
     2025 투수 목록 가져오기
     GET /api/pitchers-2025/
+    GET /api/pitchers-2025/?sort=ERA&limit=50&fields=player_id,선수명,HR&team=LG&cursor=...
+    
+    파라미터가 없으면 미리 인코딩된 전체 목록 스냅샷으로 응답합니다 (ETag / If-None-Match 304 지원).
+    
+    Query Parameters (하나라도 있으면 페이지 응답):
+    - sort: 정렬 컬럼 (기본 선수명, '-'를 붙이면 내림차순, 기록이 없는 선수는 마지막)
+    - limit: 페이지 크기 (기본 50, 최대 500)
+    - cursor: 이전 응답의 next_cursor
+    - fields: 응답에 포함할 컬럼 (쉼표로 구분)
+    - team: 팀명 필터 (kbo_*_top150에 있는 선수만 팀 정보가 있음)
+    
+    페이지 응답: {"count": 150, "next_cursor": "..." 또는 null, "results": [...]}
+    
+    format=columnar (또는 msgpack): 키 이름을 한 번만 보내는 컬럼형 응답
+    {"columns": ["player_id", "선수명", ...], "rows": [["76715", "류현진", ...], ...]}
+    (페이지 응답은 results가 {"columns", "rows"}로 바뀜)
     
     Returns:
     [
       {
         "player_id": "76715",
         "선수명": "류현진",
-        "ERA": "3.23",
-        "G": "26",
+        "ERA": 3.23,
+        "G": 26,
+        "IP": "139 1/3",
         ...
       },
       ...
     ]
     """
     try:
-        from config.db_config import DB_CONFIG
+        page = stat_list_page(request, pitchers_2025_list_snapshot)
+        if page is not None:
+            return page
+        return formatted_snapshot_response(request, pitchers_2025_snapshot, pitchers_2025_columnar_snapshot)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return Response(
+            {'error': str(e), 'detail': '투수 목록 조회 중 오류가 발생했습니다.'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+def _leaderboard_builder(kind, source):
+    def build():
+        # 팀 경기 수는 같은 출처의 타자 테이블 기준 (투수 테이블 G는 등판 수)
+        games = team_games(stat_table(LEADER_TABLES[('hitter', source)]))
+        return Leaderboard(stat_table(LEADER_TABLES[(kind, source)]), kind, games, player_teams_snapshot.get())
+    return build
+
+
+# (선수 유형, 기록 출처) → 순위표 스냅샷 (데이터 버전이 바뀌면 모든 기록의 순위를 다시 계산)
+leaderboard_snapshots = {
+    (kind, source): snapshot(f'leaders:{kind}:{source}')(_leaderboard_builder(kind, source))
+    for kind, source in LEADER_TABLES
+}
+
+
+def leaders_page(params):
+    """순위표 조회 파라미터 → 응답 dict (잘못된 요청이면 ValueError)"""
+    kind, source, stat, qualified, limit = parse_leaders_params(params)
+    board = leaderboard_snapshots[(kind, source)].get()
+    return {'type': kind, 'source': source, **board.leaders(stat, qualified, limit)}
+
+
+@api_view(['GET'])
+@renderer_classes(LIST_RENDERER_CLASSES)
+def get_leaders(request):
+    """
+    기록 순위표 가져오기
+    GET /api/leaders/?stat=HR&type=hitter&limit=20
+    GET /api/leaders/?stat=ERA&type=pitcher&source=top150&qualified=false
+    
+    모든 기록의 순위는 데이터가 로드될 때 한 번 계산되어 있어 요청은 상위 limit명만 잘라 응답합니다.
+    
+    Query Parameters:
+    - stat: 기록 컬럼 (필수, 예: HR, AVG, OPS, ERA, SO, IP)
+    - type: 'hitter' (기본) 또는 'pitcher'
+    - source: '2025' (기본, 2025_score_*) 또는 'top150' (kbo_*_top150)
+    - qualified: 규정 타석(팀 경기 수 × 3.1) / 규정 이닝(팀 경기 수 × 1.0) 충족 선수만
+      (생략 시 AVG/OBP/SLG/OPS, ERA/WHIP/WPCT/AVG 같은 비율 기록만 true)
+    - limit: 인원 수 (기본 10, 최대 100)
+    
+    낮을수록 좋은 기록(평균자책점, 피안타, 삼진(타자) 등)은 오름차순이며, 동률은 같은 순위입니다.
+    
+    Returns:
+    {
+      "type": "hitter",
+      "source": "2025",
+      "stat": "AVG",
+      "qualified": true,
+      "min_qualifying": {"column": "PA", "value": 446.4},
+      "order": "desc",
+      "results": [
+        {"rank": 1, "player_id": "52605", "선수명": "김도영", "팀명": "KIA", "value": 0.347},
+        ...
+      ]
+    }
+    """
+    try:
+        try:
+            return Response(leaders_page(request.query_params), status=status.HTTP_200_OK)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return Response(
+            {'error': str(e), 'detail': '기록 순위 조회 중 오류가 발생했습니다.'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@snapshot('player-profiles')
+def player_profiles_snapshot():
+    """
+    선수 ID별 프로필 정적 부분 (시즌 기록 + 2025 기록 + 능력치)
+    /api/mysql-players/ 와 2025 목록 스냅샷에서 만든다 (능력치는 선수에 붙은 값을 축 형식으로만 바꿈)
+    """
+    hitters_2025 = {str(row['player_id']): row for row in hitters_2025_snapshot.get()}
+    pitchers_2025 = {str(row['player_id']): row for row in pitchers_2025_snapshot.get()}
+    
+    profiles = {}
+    for player in unique_players(players_by_position_snapshot.get()):
+        kind = 'pitcher' if player['position'] == 'pitcher' else 'hitter'
+        season_2025 = pitchers_2025 if kind == 'pitcher' else hitters_2025
+        profiles[player['id']] = {
+            'player': player,
+            'season_2025': season_2025.get(str(player['id'])),
+            'ratings': rating_axes(kind, player['ratings'], player['ratings_scale']),
+        }
+    return profiles
+
+
+@api_view(['GET'])
+def get_player_profile(request, player_id):
+    """
+    선수 프로필 한 번에 가져오기 (시즌 기록 + 능력치 + 이미지 + 최근 경기)
+    GET /api/players/<id>/profile/
+    
+    id는 /api/mysql-players/ 응답의 id (KBO player_id)입니다.
+    player_id가 아직 없는 선수(임시 ID)는 최근 경기를 이름으로 찾습니다.
+    모든 조각은 캐시(스냅샷/선수별 캐시)에서 조립됩니다.
+    
+    Returns:
+    {
+      "player": {"id": 76232, "name": "양의지", "positions": ["catcher"], ...},
+      "season_2025": {"player_id": "76232", "선수명": "양의지", "AVG": 0.337, ...},
+      "ratings": {"type": "hitter", "scale": "league_percentile", "axes": [{"key": "power", "label": "파워", "value": 70}, ...]},
+      "images": [{"imageType": "profile", "imageUrl": "https://...", ...}, ...],
+      "recent_games": [{"일자": "09.04", "상대": "NC", ...}, ...]
+    }
+    """
+    try:
+        profile = player_profiles_snapshot.get().get(player_id)
+        
+        if profile is None:
+            return Response(
+                {'error': '선수를 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
         
-        conn = pymysql.connect(**DB_CONFIG)
-        cursor = conn.cursor(pymysql.cursors.DictCursor)
+        name = profile['player']['name']
+        kind = 'pitcher' if profile['player']['position'] == 'pitcher' else 'hitter'
+        key_field, key = profile_recent_games_key(profile['player'])
         
+        return Response({
+            **profile,
+            'images': profile_images(player_image_manifest_snapshot.get(), player_id, name),
+            'recent_games': fetch_recent_games(kind, key_field, [key])[key],
+        }, status=status.HTTP_200_OK)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return Response(
+            {'error': str(e), 'detail': '선수 프로필 조회 중 오류가 발생했습니다.'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@snapshot('team-stat-source')
+def team_stat_source_snapshot():
+    """팀 요약용 기록 저장소 테이블 + (타자 행 번호, 포지션) → 수비율"""
+    return TeamStatSource(
+        stat_table('kbo_hitters_top150'),
+        stat_table('kbo_pitchers_top150'),
+        stat_table('kbo_defense_positions'),
+    )
+
+
+def temporary_players(player_ids):
+    """
+    임시 ID → (선수명, 팀명) (프로필과 같은 /api/mysql-players/ 선수 목록에서)
+    라인업에 임시 ID가 없으면 선수 목록 스냅샷을 읽지 않는다
+    """
+    if all(player_id >= TEMPORARY_ID_LIMIT for player_id in player_ids):
+        return {}
+    return {
+        player['id']: (player['name'], player['team'])
+        for player in unique_players(players_by_position_snapshot.get())
+        if player['id'] < TEMPORARY_ID_LIMIT
+    }
+
+
+def team_summary_page(params):
+    """라인업 파라미터 → 팀 요약 (라인업 키별 캐시, 잘못된 요청이면 ValueError)"""
+    batters, pitchers = parse_lineup_params(params)
+    key = lineup_hash(batters, pitchers)
+
+    def load(missing):
+        temporary = temporary_players([*batters.values(), *pitchers])
+        return {key: team_summary(team_stat_source_snapshot.get(), batters, pitchers, temporary)}
+
+    return cached_by_key('team-summary', [key], load)[key]
+
+
+@api_view(['GET', 'POST'])
+def get_team_summary(request):
+    """
+    선택한 라인업의 팀 요약 (기록 평균 / 합계, 팀 능력치, 예상 승률)
+    GET /api/team-summary/?catcher=76232&third=52605&pitchers=76715&pitchers=69446
+    POST /api/team-summary/ {"catcher": 76232, "third": 52605, "pitchers": [76715, 69446]}
+    
+    Query Parameters / Body:
+        catcher, first, second, third, shortstop, left, center, right: 포지션별 타자 ID
+        pitchers: 투수 ID 목록 (선발 + 불펜)
+    
+    ID는 /api/mysql-players/ 응답의 id (KBO player_id)입니다.
+    player_id가 아직 없는 선수(임시 ID)는 선수명 + 팀명으로 기록을 찾습니다.
+    같은 라인업(포지션 / 투수 순서 무관)은 데이터 버전마다 한 번만 계산합니다.
+    
+    Returns:
+    {
+      "lineup_hash": "3f2a9c0d1e4b5a6c",
+      "stats": {"batting_avg": 0.33, "rbis": 101.5, "home_runs": 27.5, "runs": 100.0,
+                "fielding_percentage": 0.967, "total_bases": 551, "hits": 317, "at_bats": 952,
+                "era": 3.765, "wins": 12.5, "losses": 7.0, "saves": 0.0, "holds": 0.0, "strikeouts": 127.0},
+      "abilities": {"type": "team", "axes": [{"key": "power", "label": "파워", "value": 70}, ...]},
+      "expected_win_rate": 0.572,
+      "missing": []
+    }
+    missing: 기록을 찾을 수 없어 계산에서 제외한 선수 ID
+    """
+    try:
+        params = request.data if request.method == 'POST' else request.query_params
         try:
-            cursor.execute("""
-                SELECT 
-                    `player_id`, `선수명`, `ERA`, `G`, `CG`, `SHO`, `W`, `L`, 
-                    `SV`, `HLD`, `WPCT`, `TBF`, `NP`, `IP`, `H`, `2B`, `3B`, `HR`,
-                    `SAC`, `SF`, `BB`, `IBB`, `SO`, `WP`, `BK`, `R`, `ER`, 
-                    `BSV`, `WHIP`, `AVG`, `QS`
-                FROM `2025_score_pitchers`
-                ORDER BY `선수명`
-            """)
-            
-            pitchers = cursor.fetchall()
-            print(f"✅ 2025 투수 {len(pitchers)}명 조회 완료")
-            
-            return Response(pitchers, status=status.HTTP_200_OK)
-        finally:
-            conn.close()
+            return Response(team_summary_page(params), status=status.HTTP_200_OK)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         import traceback
         traceback.print_exc()
         return Response(
-            {'error': str(e), 'detail': '투수 목록 조회 중 오류가 발생했습니다.'},
+            {'error': str(e), 'detail': '팀 요약 계산 중 오류가 발생했습니다.'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+def hot_players(kind, window, limit):
+    """
+    최근 폼 상위 선수 (player_recent_form 인덱스 순서로 한 번 조회)
+    테이블이 아직 없으면(build_materialized 실행 전) 경기 로그에서 바로 계산한다
+    """
+    with connection.cursor() as cursor:
+        try:
+            cursor.execute(*hot_players_query(kind, window, limit))
+            return dictfetchall(cursor)
+        except DatabaseError as e:
+            print(f"⚠️ {FORM_TABLE} 조회 실패, 경기 로그에서 계산합니다 "
+                  f"(python manage.py build_materialized): {e}")
+            return hot_players_from_rows(form_rows(cursor), kind, window, limit)
+
+
+def hot_players_page(params):
+    """최근 폼 상위 선수 파라미터 → 응답 dict (요청별 캐시, 잘못된 요청이면 ValueError)"""
+    kind, window, limit = parse_hot_params(params)
+    key = f'{kind}:{window}:{limit}'
+
+    def load(missing):
+        players = hot_players(kind, window, limit)
+        return {key: {
+            'type': kind,
+            'games': window,
+            'results': [{'rank': rank, **player} for rank, player in enumerate(players, 1)],
+        }}
+
+    return cached_by_key('hot-players', [key], load)[key]
+
+
+@api_view(['GET'])
+def get_hot_players(request):
+    """
+    최근 폼 상위 선수 (최근 3 / 5 / 10경기)
+    GET /api/hot-players/?type=hitter&games=5&limit=10
+    GET /api/hot-players/?type=pitcher&games=3
+    
+    최근 경기 기록은 데이터를 올릴 때 선수별로 계산되어 있어(player_recent_form 테이블)
+    요청은 인덱스 순서로 limit행만 읽습니다.
+    
+    Query Parameters:
+    - type: 'hitter' (기본, OPS 높은 순) 또는 'pitcher' (ERA 낮은 순)
+    - games: 최근 경기 수 3, 5 (기본), 10 - 그만큼 출장한 선수만
+    - limit: 인원 수 (기본 10, 최대 50)
+    
+    Returns:
+    {
+      "type": "hitter",
+      "games": 5,
+      "results": [
+        {"rank": 1, "player_id": 52605, "선수명": "김도영", "AB": 19, "AVG": 0.421, "OPS": 1.302},
+        ...
+      ]
+    }
+    투수는 AB / AVG / OPS 대신 IP / ERA / WHIP
+    """
+    try:
+        try:
+            return Response(hot_players_page(request.query_params), status=status.HTTP_200_OK)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return Response(
+            {'error': str(e), 'detail': '최근 폼 상위 선수 조회 중 오류가 발생했습니다.'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
@@ -710,6 +1295,32 @@ def _simulate_single_at_bat(batter, pitcher, league_avg=0.270):
         return ('1B', 1)
 
 
+# 몬테카를로 시뮬레이션 기본 횟수
+SIMULATION_COUNT = 2000
+
+# 리그 평균 타율
+LEAGUE_AVG = 0.270
+
+
+def _run_monte_carlo(batter, pitcher, simulation_count=SIMULATION_COUNT, league_avg=LEAGUE_AVG):
+    """
+    타자 vs 투수 몬테카를로 시뮬레이션 (내부 함수)
+    Returns: (결과별 횟수 dict, 총 진루 수)
+    """
+    result_counts = {
+        'HR': 0, '3B': 0, '2B': 0, '1B': 0,
+        'BB': 0, 'SO': 0, 'OUT': 0
+    }
+    total_bases = 0
+    
+    for _ in range(simulation_count):
+        result_type, bases = _simulate_single_at_bat(batter, pitcher, league_avg)
+        result_counts[result_type] += 1
+        total_bases += bases
+    
+    return result_counts, total_bases
+
+
 @api_view(['POST'])
 def simulate_at_bat(request):
     """
@@ -773,23 +1384,8 @@ def simulate_at_bat(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # 리그 평균 타율
-        league_avg = 0.270
-        
         # 몬테카를로 시뮬레이션: 2000회 실행
-        SIMULATION_COUNT = 2000
-        results = []
-        result_counts = {
-            'HR': 0, '3B': 0, '2B': 0, '1B': 0,
-            'BB': 0, 'SO': 0, 'OUT': 0
-        }
-        total_bases = 0
-        
-        for _ in range(SIMULATION_COUNT):
-            result_type, bases = _simulate_single_at_bat(batter, pitcher, league_avg)
-            results.append(result_type)
-            result_counts[result_type] += 1
-            total_bases += bases
+        result_counts, total_bases = _run_monte_carlo(batter, pitcher, SIMULATION_COUNT)
         
         # 통계 계산
         distribution = {
@@ -0,0 +1,150 @@
+"""
+서버 시작 시 캐시 미리 채우기 + 준비 상태 확인 (GET /readyz)
+
+warm_up()은 등록된 모든 스냅샷(기록 저장소 테이블, 선수 목록, 2025 기록, 순위표,
+검색 인덱스, 프로필 등)을 만든다. wsgi.py / asgi.py에서 앱을 불러올 때 호출하므로
+gunicorn --preload면 마스터 프로세스에서 한 번 만들고 워커가 fork로 공유한다.
+
+/readyz는 미리 채우기가 끝나 WARMED_UP이 설정되고 DB 연결이 응답할 때만 200을 반환한다.
+/readyz는 스냅샷을 만들지 않는다 (DB가 느려도 준비 확인 요청이 스냅샷 생성을 기다리지 않도록).
+시작 시 DB에 연결하지 못해 만들지 못한 스냅샷은 백그라운드 스레드가 간격을 늘려 가며 다시 만든다.
+(데이터 버전이 바뀌어 다시 만들어야 하는 스냅샷은 이전 값으로 응답할 수 있으므로 준비 상태로 본다)
+"""
+
+import os
+import threading
+import time
+
+from django.db import connection
+from django.http import JsonResponse
+
+from .snapshots import SNAPSHOTS
+
+# 미리 채우기가 끝나 모든 스냅샷이 만들어졌는지 (한 번 설정되면 유지, /readyz는 이 값만 확인)
+WARMED_UP = threading.Event()
+
+# 실패한 스냅샷을 다시 만들기 전 대기 시간 (초, 마지막 값 반복)
+RETRY_SECONDS = (5, 10, 30, 60)
+
+# 동시에 여러 스레드가 미리 채우기를 실행하지 않도록
+_warmup_lock = threading.Lock()
+
+# 마지막 미리 채우기에서 실패한 스냅샷 (이름 → 오류 메시지)
+_errors = {}
+
+
+def registered_snapshots():
+    """미리 채울 스냅샷 목록 (뷰 모듈을 불러와 모든 스냅샷이 등록되게 한다)"""
+    from . import views  # noqa: F401
+
+    return dict(SNAPSHOTS)
+
+
+def warm_up(only_missing=False):
+    """
+    등록된 스냅샷을 모두 만든다 (실패해도 나머지는 계속)
+
+    Args:
+        only_missing: True면 아직 한 번도 만들지 않은 스냅샷만
+
+    Returns:
+        {이름: 오류 메시지} (모두 성공하면 빈 dict, 이때 WARMED_UP 설정)
+    """
+    with _warmup_lock:
+        started = time.perf_counter()
+        built = 0
+        for name, instance in registered_snapshots().items():
+            if only_missing and instance.last_value() is not None:
+                continue
+            try:
+                instance.get()
+                built += 1
+                _errors.pop(name, None)
+            except Exception as e:
+                # 테이블이 없거나 DB에 연결할 수 없어도 서버는 시작 (백그라운드 재시도 또는 첫 요청에서 다시 시도)
+                _errors[name] = str(e)
+                print(f"⚠️ 캐시 미리 채우기 실패: {name} ({e})")
+        print(f"🔥 캐시 미리 채우기: {built}개 ({(time.perf_counter() - started) * 1000:.1f}ms)")
+        if not _errors:
+            WARMED_UP.set()
+        return dict(_errors)
+
+
+def _retry_until_warm():
+    """실패한 스냅샷을 모두 만들 때까지 간격을 늘려 가며 다시 시도 (백그라운드 스레드)"""
+    attempt = 0
+    while not WARMED_UP.is_set():
+        time.sleep(RETRY_SECONDS[min(attempt, len(RETRY_SECONDS) - 1)])
+        attempt += 1
+        warm_up(only_missing=True)
+    # 이 스레드의 DB 연결은 다시 쓰지 않음
+    connection.close()
+
+
+def start_retry():
+    """실패한 스냅샷 재시도 스레드 시작 (이미 모두 만들어졌으면 아무것도 하지 않음)"""
+    if not WARMED_UP.is_set():
+        threading.Thread(target=_retry_until_warm, name='snapshot-warmup-retry', daemon=True).start()
+
+
+def warm_up_on_start():
+    """
+    wsgi.py / asgi.py에서 앱을 불러올 때 호출
+
+    모든 스냅샷을 만들고, 실패한 스냅샷이 있으면 백그라운드 스레드에서 다시 시도한다.
+    gunicorn --preload면 fork된 워커에는 마스터의 스레드가 없으므로 워커에서 재시도 스레드를 다시 시작한다.
+    """
+    if warm_up():
+        start_retry()
+        os.register_at_fork(after_in_child=start_retry)
+
+
+def check_database():
+    """DB 연결 확인 → {"ok": bool, "ms" 또는 "error"}"""
+    started = time.perf_counter()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+    except Exception as e:
+        return {'ok': False, 'error': str(e)}
+    return {'ok': True, 'ms': round((time.perf_counter() - started) * 1000, 1)}
+
+
+def readyz_view(request):
+    """
+    GET /readyz - 미리 채우기가 끝나고 DB가 응답하면 200, 아니면 503 (스냅샷은 만들지 않음)
+
+    Returns:
+    {
+      "status": "ready" | "warming_up" | "not_ready",
+      "snapshots": {"total": 20, "missing": [], "stale": [], "errors": {}},
+      "database": {"ok": true, "ms": 0.4}  (미리 채우는 중이면 null)
+    }
+    """
+    snapshots = registered_snapshots()
+    missing = sorted(name for name, instance in snapshots.items() if instance.last_value() is None)
+    stale = sorted(
+        name for name, instance in snapshots.items()
+        if instance.last_value() is not None and not instance.is_current()
+    )
+    if not WARMED_UP.is_set():
+        # 미리 채우는 중 (또는 백그라운드 재시도 중)이면 DB도 확인하지 않고 바로 503
+        status, database = 'warming_up', None
+    else:
+        database = check_database()
+        status = 'ready' if database['ok'] else 'not_ready'
+    return JsonResponse(
+        {
+            'status': status,
+            'snapshots': {
+                'total': len(snapshots),
+                'missing': missing,
+                'stale': stale,
+                'errors': {name: _errors[name] for name in missing if name in _errors},
+            },
+            'database': database,
+        },
+        status=200 if status == 'ready' else 503,
+        json_dumps_params={'ensure_ascii': False},
+    )
@@ -14,3 +14,14 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_asgi_application()
+
+# 기록 저장소 / 스냅샷 캐시를 미리 채운다 (첫 요청에서 DB를 기다리지 않도록)
+# 끝나면 /readyz가 200을 반환하고, 실패한 스냅샷은 백그라운드에서 다시 시도한다
+# gunicorn --preload면 마스터에서 한 번 채우고 워커가 fork로 공유한다
+from django.db import connections  # noqa: E402
+
+from baseball.warmup import warm_up_on_start  # noqa: E402
+
+warm_up_on_start()
+# fork된 워커끼리 같은 DB 소켓을 공유하지 않도록 미리 채우기에 쓴 연결을 닫는다
+connections.close_all()
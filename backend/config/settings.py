@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -50,6 +51,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "baseball.metrics.MetricsMiddleware",  # 엔드포인트별 지표 (/metrics) - 다른 미들웨어 시간까지 포함하도록 맨 앞
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",  # CORS 설정 추가
@@ -92,6 +94,11 @@ DATABASES = {
         "PASSWORD": "wldus08095**",
         "HOST": "baseball-db.c1awk62uemxb.ap-northeast-2.rds.amazonaws.com",
         "PORT": "3306",
+        # 스레드별 영구 연결 재사용 (요청마다 RDS TCP/TLS/인증 핸드셰이크 방지)
+        # - CONN_MAX_AGE: 연결 재사용 최대 시간(초), 초과 시 요청 종료 시점에 닫고 새로 연결
+        # - CONN_HEALTH_CHECKS: 재사용 전 연결 상태 확인 (끊긴 연결은 자동 교체)
+        "CONN_MAX_AGE": 600,
+        "CONN_HEALTH_CHECKS": True,
         "OPTIONS": {
             "charset": "utf8mb4",
             "init_command": "SET sql_mode='STRICT_TRANS_TABLES'",
@@ -99,6 +106,16 @@ DATABASES = {
     }
 }
 
+# 비동기 읽기 API(/api/async/, ASGI)용 aiomysql 연결 풀 크기 (프로세스당)
+ASYNC_DB_POOL_MIN_SIZE = 1
+ASYNC_DB_POOL_MAX_SIZE = 20
+
+# /metrics 접근 허용 (엔드포인트별 트래픽 / DB / 캐시 지표가 API와 같은 호스트에 공개되지 않도록)
+# - METRICS_ALLOWED_IPS: 토큰 없이 조회할 수 있는 주소 (같은 서버의 Prometheus / 에이전트)
+# - METRICS_TOKEN: 설정하면 'Authorization: Bearer <토큰>' 요청도 허용 (원격 수집기용)
+METRICS_ALLOWED_IPS = ['127.0.0.1', '::1']
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
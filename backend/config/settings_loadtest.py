@@ -0,0 +1,38 @@
+"""
+부하 테스트용 설정 (운영 RDS 대신 로컬 DB 사용)
+
+    python manage.py migrate --settings=config.settings_loadtest
+    python manage.py seed_loadtest_data --settings=config.settings_loadtest
+    python manage.py loadtest --serve wsgi --mix mixed --settings=config.settings_loadtest
+
+LOADTEST_DB=sqlite (기본): backend/loadtest.sqlite3
+LOADTEST_DB=mysql: 로컬 MySQL 호환 서버 (LOADTEST_DB_HOST / PORT / NAME / USER / PASSWORD)
+"""
+
+import os
+
+from .settings import *  # noqa: F401,F403
+from .settings import BASE_DIR, DATABASES
+
+if os.environ.get('LOADTEST_DB', 'sqlite') == 'mysql':
+    DATABASES = {
+        "default": {
+            **DATABASES["default"],
+            "NAME": os.environ.get('LOADTEST_DB_NAME', 'nineup_loadtest'),
+            "USER": os.environ.get('LOADTEST_DB_USER', 'root'),
+            "PASSWORD": os.environ.get('LOADTEST_DB_PASSWORD', ''),
+            "HOST": os.environ.get('LOADTEST_DB_HOST', '127.0.0.1'),
+            "PORT": os.environ.get('LOADTEST_DB_PORT', '3306'),
+        }
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.environ.get('LOADTEST_DB_NAME', str(BASE_DIR / 'loadtest.sqlite3')),
+        }
+    }
+
+ALLOWED_HOSTS = ['*']
+# 요청별 SQL 기록(DEBUG)이 메모리 / 지연 시간에 섞이지 않도록
+DEBUG = False
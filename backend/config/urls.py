@@ -19,9 +19,14 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from baseball.metrics import metrics_view
+from baseball.warmup import readyz_view
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", include("baseball.urls")),  # API 엔드포인트: /api/players/
+    path("metrics", metrics_view, name="metrics"),  # Prometheus 지표
+    path("readyz", readyz_view, name="readyz"),  # 준비 상태 (캐시 + DB)
 ]
 
 # 개발 환경에서 미디어 파일 제공
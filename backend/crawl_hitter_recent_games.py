@@ -15,6 +15,9 @@ import pymysql
 from pymysql.cursors import DictCursor
 import time
 from config.db_config import DB_CONFIG
+from baseball.crawled_schema import db_value
+from baseball.materialized_tables import rebuild_materialized
+from baseball.snapshots import mark_data_changed
 
 # 선수 상세 페이지 URL 패턴
 HITTER_DETAIL_URL = "https://www.koreabaseball.com/Record/Player/HitterDetail/Basic.aspx?playerId={id}"
@@ -205,8 +208,8 @@ def create_hitter_log_table(cursor, conn):
             `SO` VARCHAR(10),
             `GDP` VARCHAR(10),
             `created_at` TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            INDEX `idx_player_id` (`player_id`),
-            INDEX `idx_선수명` (`선수명`),
+            INDEX `idx_player_id_일자` (`player_id`, `일자`),
+            INDEX `idx_선수명_일자` (`선수명`, `일자`),
             INDEX `idx_일자` (`일자`)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
         """
@@ -493,33 +496,33 @@ def save_2025_score_to_db(cursor, conn, score_data):
             `OPS` = VALUES(`OPS`)
         """
         
-        # 딕셔너리에서 안전하게 값 추출 (.get 사용)
+        # 딕셔너리에서 안전하게 값 추출 (.get 사용, '' / '-'는 NULL - 숫자 타입 컬럼 호환)
         cursor.execute(insert_query, (
             score_data['player_id'],
             score_data['선수명'],
-            score_data.get('G', ''),
-            score_data.get('PA', ''),
-            score_data.get('AB', ''),
-            score_data.get('R', ''),
-            score_data.get('H', ''),
-            score_data.get('2B', ''),
-            score_data.get('3B', ''),
-            score_data.get('HR', ''),
-            score_data.get('TB', ''),
-            score_data.get('RBI', ''),
-            score_data.get('SAC', ''),  # 추가됨
-            score_data.get('SF', ''),   # 추가됨
-            score_data.get('SB', ''),
-            score_data.get('CS', ''),
-            score_data.get('BB', ''),
-            score_data.get('IBB', ''),
-            score_data.get('HBP', ''),
-            score_data.get('SO', ''),
-            score_data.get('GDP', ''),
-            score_data.get('AVG', ''),
-            score_data.get('OBP', ''),
-            score_data.get('SLG', ''),
-            score_data.get('OPS', ''),
+            db_value(score_data.get('G')),
+            db_value(score_data.get('PA')),
+            db_value(score_data.get('AB')),
+            db_value(score_data.get('R')),
+            db_value(score_data.get('H')),
+            db_value(score_data.get('2B')),
+            db_value(score_data.get('3B')),
+            db_value(score_data.get('HR')),
+            db_value(score_data.get('TB')),
+            db_value(score_data.get('RBI')),
+            db_value(score_data.get('SAC')),  # 추가됨
+            db_value(score_data.get('SF')),   # 추가됨
+            db_value(score_data.get('SB')),
+            db_value(score_data.get('CS')),
+            db_value(score_data.get('BB')),
+            db_value(score_data.get('IBB')),
+            db_value(score_data.get('HBP')),
+            db_value(score_data.get('SO')),
+            db_value(score_data.get('GDP')),
+            db_value(score_data.get('AVG')),
+            db_value(score_data.get('OBP')),
+            db_value(score_data.get('SLG')),
+            db_value(score_data.get('OPS')),
         ))
         
         conn.commit()
@@ -605,6 +608,14 @@ def main():
         print(f"❌ 2025 성적 실패: {score_fail_count}명")
         print("=" * 80)
         
+        if score_success_count > 0:
+            # 구체화 테이블 (능력치, 최근 폼)을 새 기록으로 다시 만든 뒤
+            for table, count in rebuild_materialized(cursor, 'mysql'):
+                conn.commit()
+                print(f"✅ {table}: {count}행 생성")
+            # 실행 중인 API 서버의 인메모리 스냅샷 갱신
+            mark_data_changed()
+        
     except Exception as e:
         print(f"❌ 크롤링 오류: {e}")
         import traceback
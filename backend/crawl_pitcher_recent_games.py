@@ -4,6 +4,9 @@ import pymysql
 
 # ✅ 요청하신대로 외부 파일에서 DB 설정 가져오기
 from config.db_config import DB_CONFIG
+from baseball.crawled_schema import db_value
+from baseball.materialized_tables import rebuild_materialized
+from baseball.snapshots import mark_data_changed
 from pymysql.cursors import DictCursor
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -86,7 +89,8 @@ def save_to_db(conn, data):
         """
         
         with conn.cursor() as cursor:
-            cursor.execute(sql, list(data.values()))
+            # 숫자 타입 컬럼(migrate_crawled_schema)에도 저장되도록 '' / '-'는 NULL
+            cursor.execute(sql, [db_value(value) for value in data.values()])
         conn.commit()
         print(f"  💾 DB 저장 완료: {data['선수명']} (ERA: {data['ERA']}, BB: {data['BB']})")
         
@@ -317,6 +321,15 @@ def main():
                 print(f"  ⚠️ {p_name}: 데이터 수집 실패")
             
             time.sleep(1.5)  # 서버 부하 방지
+        
+        # 6. 구체화 테이블 (능력치, 최근 폼)을 새 기록으로 다시 만든다
+        with conn.cursor() as cursor:
+            for table, count in rebuild_materialized(cursor, 'mysql'):
+                conn.commit()
+                print(f"✅ {table}: {count}행 생성")
+
+        # 7. 실행 중인 API 서버의 인메모리 스냅샷 갱신
+        mark_data_changed()
 
     except Exception as e:
         print(f"❌ 치명적 오류 발생: {e}")
@@ -97,8 +97,8 @@ def main():
     print(df_with_position[['순위', '선수명', '팀명', '포지션', '포지션_영문', 'AVG', 'HR', 'RBI']].head(20).to_string(index=False))
     
     print("\n💡 다음 단계:")
-    print("  1. python backend/sql_script/upload.py  # MySQL에 업로드")
-    print("  2. Django views.py 수정 (kbo_hitters_with_positions 테이블 사용)")
+    print("  1. python backend/sql_script/upload.py  # MySQL에 업로드 (kbo_hitters_with_positions 테이블도 자동 생성)")
+    print("  2. 또는 python backend/manage.py build_materialized  # 구체화 테이블만 다시 생성")
 
 if __name__ == "__main__":
     main()
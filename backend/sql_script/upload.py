@@ -1,5 +1,6 @@
 import pandas as pd
 from sqlalchemy import create_engine
+import argparse
 import glob
 import os
 import re
@@ -8,11 +9,23 @@ import sys
 # 상위 디렉토리의 db_config import를 위해 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.db_config import DB_USER, DB_PASSWORD, DB_HOST, DB_NAME, DB_PORT
+from baseball.crawled_schema import CRAWLED_TABLES, DEFAULT_SEASON, apply_plan, plan_table
+from baseball.materialized_tables import MATERIALIZED_TABLE_NAMES, MATERIALIZED_TABLES
+from baseball.snapshots import mark_data_changed
 
 # ==========================================
 # 2. 실행 코드 (자동으로 모든 .xlsx, .csv 파일 업로드)
 # ==========================================
 
+parser = argparse.ArgumentParser(description='backend/data의 .xlsx / .csv 파일을 MySQL에 업로드합니다')
+parser.add_argument(
+    '--season',
+    type=int,
+    default=DEFAULT_SEASON,
+    help=f"경기 로그 일자('09.04')에 붙일 시즌 연도 (기본 {DEFAULT_SEASON})",
+)
+args = parser.parse_args()
+
 def clean_table_name(filename):
     """파일명을 테이블명으로 변환 (예: batterlist.xlsx -> batter_list)"""
     # 확장자 제거
@@ -79,6 +92,11 @@ try:
             # 테이블명 생성 (파일명 기반)
             table_name = clean_table_name(file_name)
             
+            # 구체화 테이블은 업로드 후 크롤링 테이블에서 다시 만든다 (아래 (5))
+            if table_name in MATERIALIZED_TABLE_NAMES:
+                print(f"  ⏭️  건너뜀: '{table_name}'은 업로드 후 자동 생성")
+                continue
+            
             # DB에 업로드
             df.to_sql(name=table_name, con=engine, if_exists='replace', index=False)
             
@@ -89,7 +107,40 @@ try:
             print(f"  ❌ 실패: {e}")
             fail_count += 1
     
-    # (4) 최종 결과
+    # (4) 업로드한 테이블(문자열 TEXT 컬럼) → 숫자 / VARCHAR 타입 + API 쿼리용 인덱스
+    if success_count > 0:
+        raw_connection = engine.raw_connection()
+        try:
+            cursor = raw_connection.cursor()
+            for table in CRAWLED_TABLES:
+                plan = plan_table(cursor, table)
+                if plan is None:
+                    continue
+                apply_plan(cursor, table, plan, args.season)
+                for column, reason in plan['skipped']:
+                    print(f"  ⚠️  {table}.{column}: 건너뜀 ({reason})")
+            raw_connection.commit()
+            print(f"\n✅ 크롤링 테이블 타입 / 인덱스 정리 완료 (일자 시즌: {args.season})")
+        except Exception as e:
+            print(f"\n❌ 크롤링 테이블 정리 실패: {e}")
+        finally:
+            raw_connection.close()
+
+    # (5) 구체화 테이블 (타자 + 포지션, 리그 백분위 능력치, 최근 폼 - API가 다시 계산하지 않음)
+    if success_count > 0:
+        for table, rebuild in MATERIALIZED_TABLES:
+            raw_connection = engine.raw_connection()
+            try:
+                cursor = raw_connection.cursor()
+                count = rebuild(cursor, 'mysql')
+                raw_connection.commit()
+                print(f"\n✅ {table}: {count}행 생성")
+            except Exception as e:
+                print(f"\n❌ {table} 생성 실패: {e}")
+            finally:
+                raw_connection.close()
+    
+    # (6) 최종 결과
     print("\n" + "=" * 60)
     print("📊 업로드 완료!")
     print("=" * 60)
@@ -98,6 +149,8 @@ try:
     print("=" * 60)
     
     if success_count > 0:
+        # 실행 중인 API 서버의 인메모리 스냅샷 갱신
+        mark_data_changed()
         print("\n💡 확인: python check_data.py")
 
 except Exception as e:
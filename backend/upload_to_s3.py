@@ -12,6 +12,9 @@ sys.path.insert(0, backend_dir)
 # db_config는 backend/config 폴더에 있음 (gitignore에 포함되어 커밋되지 않음)
 from config.db_config import DB_CONFIG
 
+from baseball.image_manifest import MANIFEST_FILE, build_manifest, image_size, write_manifest
+from baseball.snapshots import mark_data_changed
+
 # ==========================================
 # 1. AWS S3 설정
 # ==========================================
@@ -26,6 +29,39 @@ except ImportError:
     REGION = os.getenv('AWS_REGION', 'ap-northeast-2')
 
 IMAGE_FOLDER = 'player_images'
+IMAGE_FILE_PATTERN = re.compile(r'^(.+?)_(1|2|3|profile)$')
+
+
+def s3_image_url(filename):
+    """업로드된 이미지의 S3 URL (예: players/류현진_1.jpg)"""
+    return f"https://{BUCKET_NAME}.s3.{REGION}.amazonaws.com/players/{filename}"
+
+
+def local_image_sizes():
+    """IMAGE_FOLDER의 이미지 → {S3 URL: (가로, 세로)}"""
+    sizes = {}
+    if not os.path.isdir(IMAGE_FOLDER):
+        return sizes
+    for filename in os.listdir(IMAGE_FOLDER):
+        if IMAGE_FILE_PATTERN.match(os.path.splitext(filename)[0]):
+            sizes[s3_image_url(filename)] = image_size(os.path.join(IMAGE_FOLDER, filename))
+    return sizes
+
+
+def update_image_manifest(cursor):
+    """
+    photo_data 전체로 선수 이미지 매니페스트(player_id → 이미지 목록 + 크기)를 만들어 저장하고
+    서버 스냅샷이 다시 만들어지도록 데이터 갱신 표시
+    """
+    cursor.execute("""
+        SELECT player_id, player_name, image_1, image_2, image_3, profile_img
+        FROM photo_data
+    """)
+    manifest = build_manifest(cursor.fetchall(), local_image_sizes())
+    write_manifest(manifest)
+    mark_data_changed()
+    print(f"🗂️  이미지 매니페스트 저장: {len(manifest['players'])}명 -> {MANIFEST_FILE}")
+
 
 def upload_s3_and_update_db(clear_existing=False):
     """
@@ -86,7 +122,7 @@ def upload_s3_and_update_db(clear_existing=False):
             # 선수 이름 추출 (예: 류현진_1.jpg -> 류현진, 류현진_profile.jpg -> 류현진)
             # 파일명 형식: {선수명}_1.jpg, {선수명}_2.jpg, {선수명}_3.jpg, {선수명}_profile.jpg
             name_without_ext = os.path.splitext(filename)[0]
-            match = re.match(r'^(.+?)_(1|2|3|profile)$', name_without_ext)
+            match = IMAGE_FILE_PATTERN.match(name_without_ext)
             if match:
                 player_name = match.group(1)
                 image_type = match.group(2)
@@ -112,7 +148,7 @@ def upload_s3_and_update_db(clear_existing=False):
                 )
 
                 # (2) URL 생성
-                image_url = f"https://{BUCKET_NAME}.s3.{REGION}.amazonaws.com/{s3_file_name}"
+                image_url = s3_image_url(filename)
 
                 # (3) 이미지 타입별 컬럼 매핑 (기존 컬럼 사용)
                 column_map = {
@@ -205,10 +241,20 @@ def upload_s3_and_update_db(clear_existing=False):
             except Exception as e:
                 print(f"❌ {player_name} 업로드 실패: {e}")
 
+        update_image_manifest(cursor)
     finally:
         conn.close()
         print("\n🎉 모든 이미지가 S3로 이동했습니다!")
 
+
+def rebuild_manifest_only():
+    """업로드 없이 photo_data로 이미지 매니페스트만 다시 만듭니다."""
+    conn = pymysql.connect(**DB_CONFIG)
+    try:
+        update_image_manifest(conn.cursor(pymysql.cursors.DictCursor))
+    finally:
+        conn.close()
+
 if __name__ == "__main__":
     import argparse
     
@@ -218,9 +264,18 @@ if __name__ == "__main__":
         action='store_true',
         help='기존 photo_data 테이블의 모든 데이터를 삭제하고 새로 시작'
     )
+    parser.add_argument(
+        '--manifest-only',
+        action='store_true',
+        help='업로드 없이 photo_data로 이미지 매니페스트(player_image_manifest.json)만 다시 생성'
+    )
     
     args = parser.parse_args()
     
+    if args.manifest_only:
+        rebuild_manifest_only()
+        sys.exit(0)
+    
     print("=" * 60)
     if args.clear:
         print("⚠️  기존 데이터 삭제 모드로 실행합니다.")
@@ -11,7 +11,7 @@ import {
   TouchableOpacity,
   View
 } from 'react-native';
-import { getMysqlPlayersByPosition } from '../services/playerService';
+import { getMysqlPlayersByPosition, searchPlayers } from '../services/playerService';
 import { Player, PlayerPosition, POSITION_NAMES } from '../types/player';
 
 interface PlayerSelectorProps {
@@ -53,6 +53,8 @@ export default function PlayerSelector({
   const [error, setError] = useState<string | null>(null);
   const [selectedTeam, setSelectedTeam] = useState<string | null>(null);
   const [searchQuery, setSearchQuery] = useState<string>('');
+  // 서버 검색 결과 선수 ID (초성/오타 검색, 이름 포함 여부 필터와 합쳐서 사용)
+  const [searchMatchIds, setSearchMatchIds] = useState<Set<number> | null>(null);
 
   const teams = ['KIA', 'KT', '삼성', 'LG', '두산', '롯데', 'NC', '한화', '키움', 'SSG'];
   const teamDisplayNames: Record<string, string> = {
@@ -81,6 +83,26 @@ export default function PlayerSelector({
     fetchPlayers();
   }, []);
 
+  // 검색어 입력이 멈추면 서버 검색 (입력 중 요청이 몰리지 않도록 200ms 대기)
+  useEffect(() => {
+    const query = searchQuery.trim();
+    setSearchMatchIds(null);
+    if (!query) return;
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const results = await searchPlayers(query);
+        if (!cancelled) setSearchMatchIds(new Set(results.map(player => player.id)));
+      } catch (err) {
+        if (!cancelled) setSearchMatchIds(null);
+      }
+    }, 200);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [searchQuery]);
+
   const togglePosition = (position: PlayerPosition | 'starting' | 'relief') => {
     if (expandedPosition === position) setExpandedPosition(null);
     else setExpandedPosition(position);
@@ -127,8 +149,10 @@ export default function PlayerSelector({
 
   const filterPlayersBySearch = (players: Player[]) => {
     if (!searchQuery.trim()) return players;
+    // 서버 검색은 최대 50명까지만 주므로 이름 포함 선수도 함께 보여줌
     const query = searchQuery.trim().toLowerCase();
     return players.filter(player => {
+      if (searchMatchIds && searchMatchIds.has(player.id)) return true;
       const playerName = (player.name || '').toLowerCase();
       return playerName.includes(query);
     });
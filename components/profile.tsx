@@ -14,7 +14,7 @@ import {
   View
 } from 'react-native';
 import Svg, { Circle, G, Line, Path, Rect, Text as SvgText } from 'react-native-svg';
-import { API_ENDPOINTS, API_HEADERS, API_URL } from '../config/api';
+import { API_ENDPOINTS, API_HEADERS } from '../config/api';
 import { addOpacity, getTeamColors } from '../constants/teamColors';
 import { Player } from '../types/player';
 
@@ -67,15 +67,26 @@ const getTeamLogo = (teamName: string): any => {
   return null;
 };
 
-interface PlayerAbilities {
-  stat1: number; // Power / Control
-  stat2: number; // Accuracy / Strikeouts
-  stat3: number; // Scoring / Hit Suppression
-  stat4: number; // Defense / Clutch
-  stat5: number; // Stamina
-  isPitcher: boolean;
+// 오각형 능력치 축 (서버가 계산한 ratings의 키, 순서 = 꼭짓점 순서)
+interface RatingAxis {
+  key: string;
+  label: string;
+  value: number;
 }
 
+const HITTER_RATING_AXES: [string, string][] = [
+  ['power', '파워'], ['accuracy', '정확도'], ['scoring', '득점력'], ['defense', '수비'], ['stamina', '체력'],
+];
+const PITCHER_RATING_AXES: [string, string][] = [
+  ['control', '제구'], ['strikeouts', '탈삼진 능력'], ['hit_suppression', '피안타 억제력'], ['clutch', '위기관리'], ['stamina', '체력'],
+];
+
+// 능력치 척도 표시 (/api/mysql-players/ 의 ratings_scale)
+const RATING_SCALE_LABELS: Record<string, string> = {
+  league_percentile: '리그 백분위 기준',
+  fixed: '고정 기준 (리그 백분위 계산 전)',
+};
+
 interface RecentGameData {
   일자: string;
   상대: string;
@@ -109,6 +120,8 @@ export default function Profile({ player, visible, onClose }: ProfileProps) {
   const pentagonChartOpacity = useRef(new Animated.Value(0)).current;
   const pentagonChartScale = useRef(new Animated.Value(0.8)).current;
   const [pentagonChartLoading, setPentagonChartLoading] = useState(true);
+  // 프로필 응답의 능력치 (선수 객체에 ratings가 없을 때 사용)
+  const [profileRatings, setProfileRatings] = useState<{ scale: string; axes: RatingAxis[] } | null>(null);
   
   const [recentChartBarHeights, setRecentChartBarHeights] = useState<number[]>([]);
   const [pitcherChartBarHeights, setPitcherChartBarHeights] = useState<number[]>([]);
@@ -121,100 +134,54 @@ export default function Profile({ player, visible, onClose }: ProfileProps) {
   useEffect(() => {
     if (!player || !visible) {
       setProfileImageUrl(null);
+      setRecentGames([]);
+      setRecentPitcherGames([]);
+      setProfileRatings(null);
       return;
     }
 
-    const fetchProfileImage = async () => {
+    const isPitcher = player.position === 'pitcher';
+
+    // 선수 프로필 통합 API 한 번으로 이미지 + 최근 경기
+    const fetchProfile = async () => {
       try {
         setImageLoading(true);
-        const namesParam = `names=${encodeURIComponent(player.name)}`;
-        const url = `${API_URL}/api/player-images/?${namesParam}`;
-        
-        const response = await fetch(url);
-        if (!response.ok) {
-          return;
-        }
-        
-        const data = await response.json();
-        const profileImage = data.find((img: any) => img.imageType === 'profile');
-        if (profileImage && profileImage.imageUrl) {
-          setProfileImageUrl(profileImage.imageUrl);
+        if (isPitcher) {
+          setPitcherGamesLoading(true);
         } else {
-          setProfileImageUrl(null);
+          setGamesLoading(true);
         }
-      } catch (error) {
-        console.error('Profile image load failed:', error);
-        setProfileImageUrl(null);
-      } finally {
-        setImageLoading(false);
-      }
-    };
-
-    fetchProfileImage();
-  }, [player, visible]);
-
-  useEffect(() => {
-    if (!player || !visible || player.batting_average === undefined) {
-      setRecentGames([]);
-      return;
-    }
-
-    const fetchRecentGames = async () => {
-      try {
-        setGamesLoading(true);
-        const url = API_ENDPOINTS.hitterRecentGames(player.name);
-        const response = await fetch(url, {
+        const response = await fetch(API_ENDPOINTS.playerProfile(player.id), {
           method: 'GET',
           headers: API_HEADERS,
         });
 
         if (!response.ok) {
+          setProfileImageUrl(null);
+          setRecentGames([]);
+          setRecentPitcherGames([]);
           return;
         }
 
         const data = await response.json();
-        setRecentGames(data);
+        const profileImage = (data.images || []).find((img: any) => img.imageType === 'profile');
+        setProfileImageUrl(profileImage && profileImage.imageUrl ? profileImage.imageUrl : null);
+        setRecentGames(isPitcher ? [] : data.recent_games || []);
+        setRecentPitcherGames(isPitcher ? data.recent_games || [] : []);
+        setProfileRatings(data.ratings || null);
       } catch (error) {
-        console.error('Recent games load failed:', error);
+        console.error('Player profile load failed:', error);
+        setProfileImageUrl(null);
         setRecentGames([]);
-      } finally {
-        setGamesLoading(false);
-      }
-    };
-
-    fetchRecentGames();
-  }, [player, visible]);
-
-  useEffect(() => {
-    if (!player || !visible || player.era === undefined) {
-      setRecentPitcherGames([]);
-      return;
-    }
-
-    const fetchRecentPitcherGames = async () => {
-      try {
-        setPitcherGamesLoading(true);
-        const url = API_ENDPOINTS.pitcherRecentGames(player.name);
-        const response = await fetch(url, {
-          method: 'GET',
-          headers: API_HEADERS,
-        });
-
-        if (!response.ok) {
-          return;
-        }
-
-        const data = await response.json();
-        setRecentPitcherGames(data);
-      } catch (error) {
-        console.error('Pitcher recent games load failed:', error);
         setRecentPitcherGames([]);
       } finally {
+        setImageLoading(false);
+        setGamesLoading(false);
         setPitcherGamesLoading(false);
       }
     };
 
-    fetchRecentPitcherGames();
+    fetchProfile();
   }, [player, visible]);
 
   useEffect(() => {
@@ -451,73 +418,23 @@ export default function Profile({ player, visible, onClose }: ProfileProps) {
     }
   }, [pitcherGamesLoading, recentPitcherGames]);
 
-  const playerAbilities = useMemo((): PlayerAbilities => {
+  // 능력치는 서버에서 계산한 값을 그대로 표시 (/api/mysql-players/ 선수의 ratings, 없으면 프로필 응답)
+  const playerRatings = useMemo((): { scale: string | null; axes: RatingAxis[] } => {
     if (!player) {
-      return { stat1: 0, stat2: 0, stat3: 0, stat4: 0, stat5: 0, isPitcher: false };
+      return { scale: null, axes: [] };
     }
-
-    if (player.batting_average !== undefined || player.home_runs !== undefined || player.rbis !== undefined) {
-      const tbMinusH = (player.total_bases || 0) - (player.hits || 0);
-      const power = (player.at_bats && player.at_bats > 0)
-        ? Math.min(100, ((tbMinusH / player.at_bats) / 0.350) * 100)
-        : Math.min(100, ((player.home_runs || 0) / 50) * 100);
-
-      const accuracy = Math.min(100, ((player.batting_average || 0) / 0.400) * 100);
-      const scoring = Math.min(100, ((player.stolen_bases || 0) / 100) * 100);
-
-      let defense: number;
-      if (player.fielding_percentage !== undefined && player.fielding_percentage !== null && player.fielding_percentage > 0) {
-        defense = Math.max(0, Math.min(100, ((player.fielding_percentage - 0.850) / 0.150) * 100));
-      } else {
-        defense = (accuracy * 0.6 + power * 0.4);
-      }
-
-      const stamina = Math.min(100, ((player.at_bats || 0) / 600) * 100);
-
-      return {
-        stat1: Math.round(power),
-        stat2: Math.round(accuracy),
-        stat3: Math.round(scoring),
-        stat4: Math.round(defense),
-        stat5: Math.round(stamina),
-        isPitcher: false,
-      };
-    }
-
-    if (player.era !== undefined) {
-      const bbPer9 = (player.innings_pitched && player.innings_pitched > 0 && player.walks !== undefined)
-        ? (player.walks * 9) / player.innings_pitched
-        : 3.0;
-      const normalized = Math.max(0, Math.min(1, (12.0 - bbPer9) / 12.0));
-      const control = Math.max(0, Math.min(100, Math.pow(normalized, 0.7) * 100));
-
-      const strikeoutAbility = Math.min(100, ((player.strikeouts || 0) / 200) * 100);
-      const hitSuppression = (control * 0.6 + strikeoutAbility * 0.4);
-
-      const inverseNormalize = (value: number, min: number, max: number): number => {
-        if (value <= min) return 100;
-        if (value >= max) return 0;
-        return ((max - value) / (max - min)) * 100;
-      };
-      
-      const whipEraSum = (player.whip || 0) + (player.era || 0);
-      const clutch = inverseNormalize(whipEraSum, 0.5, 10);
-      const stamina = Math.min(100, ((player.innings_pitched || 0) / 150) * 100);
-
+    const ratings = player.ratings;
+    if (ratings) {
+      const axes = player.position === 'pitcher' ? PITCHER_RATING_AXES : HITTER_RATING_AXES;
       return {
-        stat1: Math.round(control),
-        stat2: Math.round(strikeoutAbility),
-        stat3: Math.round(hitSuppression),
-        stat4: Math.round(clutch),
-        stat5: Math.round(stamina),
-        isPitcher: true,
+        scale: player.ratings_scale || null,
+        axes: axes.map(([key, label]) => ({ key, label, value: ratings[key] ?? 0 })),
       };
     }
+    return profileRatings || { scale: null, axes: [] };
+  }, [player, profileRatings]);
 
-    return { stat1: 50, stat2: 50, stat3: 50, stat4: 50, stat5: 50, isPitcher: false };
-  }, [player]);
-
-  const PentagonChart = ({ abilities, size = 200 }: { abilities: PlayerAbilities; size?: number }) => {
+  const PentagonChart = ({ axes, size = 200 }: { axes: RatingAxis[]; size?: number }) => {
     const padding = 50;
     const svgSize = size + padding * 2;
     const center = svgSize / 2;
@@ -525,13 +442,7 @@ export default function Profile({ player, visible, onClose }: ProfileProps) {
     const angles = [90, 18, -54, -126, -198];
 
     const points = angles.map((angle, index) => {
-      const value = [
-        abilities.stat1,
-        abilities.stat2,
-        abilities.stat3,
-        abilities.stat4,
-        abilities.stat5
-      ][index];
+      const value = axes[index] ? axes[index].value : 0;
       const rad = (angle * Math.PI) / 180;
       const distance = (value / 100) * radius;
       const x = center + distance * Math.cos(rad);
@@ -553,9 +464,9 @@ export default function Profile({ player, visible, onClose }: ProfileProps) {
       return gridPath;
     });
 
-    const labels = abilities.isPitcher
-      ? ['제구', '탈삼진 능력', '피안타 억제력', '위기관리', '체력']
-      : ['파워', '정확도', '득점력', '수비', '체력'];
+    const labels = axes.length > 0
+      ? axes.map(axis => axis.label)
+      : (player?.position === 'pitcher' ? PITCHER_RATING_AXES : HITTER_RATING_AXES).map(([, label]) => label);
 
     if (pentagonChartLoading) {
       return (
@@ -1580,7 +1491,10 @@ export default function Profile({ player, visible, onClose }: ProfileProps) {
             </View>
 
             <View style={styles.chartSection}>
-              <PentagonChart abilities={playerAbilities} size={220} />
+              <PentagonChart axes={playerRatings.axes} size={220} />
+              {playerRatings.scale && RATING_SCALE_LABELS[playerRatings.scale] && (
+                <Text style={styles.chartCaption}>{RATING_SCALE_LABELS[playerRatings.scale]}</Text>
+              )}
             </View>
           </ScrollView>
         </BlurView>
@@ -1734,6 +1648,11 @@ const styles = StyleSheet.create({
     color: '#000000',
     marginBottom: 16,
   },
+  chartCaption: {
+    fontSize: 12,
+    color: '#666666',
+    marginTop: -8,
+  },
   chartContainer: {
     alignItems: 'center',
     justifyContent: 'center',
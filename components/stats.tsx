@@ -16,6 +16,7 @@ import {
 import Svg, { G, Path, Text as SvgText } from 'react-native-svg';
 import { Player, PlayerPosition } from '../types/player';
 import { get2025Pitchers, get2025Hitters, simulateAtBat, Pitcher2025, Hitter2025, SimulationResult } from '../services/simulationService';
+import { getTeamSummary, TeamLineup, TeamSummary } from '../services/playerService';
 
 const { width } = Dimensions.get('window');
 
@@ -114,6 +115,12 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
   const [showPitcherModal, setShowPitcherModal] = useState(false);
   const [showResultModal, setShowResultModal] = useState(false);
   const [showDetailedStats, setShowDetailedStats] = useState(false);
+  // 서버에서 계산한 팀 요약 (/api/team-summary/) + 요청한 라인업 (라인업이 바뀌면 이전 응답은 표시하지 않음)
+  const [teamSummaryResult, setTeamSummaryResult] = useState<{
+    lineup: TeamLineup;
+    summary: TeamSummary | null;
+    failed: boolean;
+  } | null>(null);
 
   // 선택된 선수 중 타자와 투수 분리
   const batters = useMemo(() => {
@@ -123,6 +130,9 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
       .filter((p): p is Player => p !== undefined);
   }, [selectedPlayers]);
 
+  // 목록 key / 타순 중복 확인용 (한 선수가 여러 포지션에 있으면 /api/mysql-players/ id가 같음)
+  const lineupKey = (player: Player) => `${player.position}-${player.id}`;
+
   const pitchers = useMemo(() => {
     const allPitchers: Player[] = [];
     if (startingPitcher) {
@@ -182,25 +192,25 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
       
       const batterData = {
         name: selectedBatter.name,
-        AVG: parseFloat(batter2025.AVG || '0'),
-        H: parseFloat(batter2025.H || '0'),
-        '2B': parseFloat((batter2025 as any)['2B'] || '0'),
-        '3B': parseFloat((batter2025 as any)['3B'] || '0'),
-        HR: parseFloat(batter2025.HR || '0'),
-        BB: parseFloat(batter2025.BB || '0'),
-        SO: parseFloat(batter2025.SO || '0'),
-        PA: parseFloat(batter2025.PA || '0'),
-        AB: parseFloat(batter2025.AB || '0'),
+        AVG: batter2025.AVG ?? 0,
+        H: batter2025.H ?? 0,
+        '2B': batter2025['2B'] ?? 0,
+        '3B': batter2025['3B'] ?? 0,
+        HR: batter2025.HR ?? 0,
+        BB: batter2025.BB ?? 0,
+        SO: batter2025.SO ?? 0,
+        PA: batter2025.PA ?? 0,
+        AB: batter2025.AB ?? 0,
       };
 
       const pitcherData = {
         name: selectedPitcher.선수명,
-        TBF: parseFloat(selectedPitcher.TBF || '0'),
-        BB: parseFloat(selectedPitcher.BB || '0'),
-        SO: parseFloat(selectedPitcher.SO || '0'),
-        AVG: parseFloat(selectedPitcher.AVG || '0'),
-        H: parseFloat(selectedPitcher.H || '0'),
-        HR: parseFloat(selectedPitcher.HR || '0'),
+        TBF: selectedPitcher.TBF ?? 0,
+        BB: selectedPitcher.BB ?? 0,
+        SO: selectedPitcher.SO ?? 0,
+        AVG: selectedPitcher.AVG ?? 0,
+        H: selectedPitcher.H ?? 0,
+        HR: selectedPitcher.HR ?? 0,
       };
 
       const result = await simulateAtBat(batterData, pitcherData);
@@ -214,117 +224,75 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
     }
   };
 
-  // 통계 계산
-  const teamStats = useMemo((): TeamStats => {
-    const stats: TeamStats = {
-      battingAvg: 0,
-      rbis: 0,
-      homeRuns: 0,
-      runs: 0,
-      fieldingPercentage: 0,
-      totalBases: 0,
-      hits: 0,
-      atBats: 0,
-      era: 0,
-      wins: 0,
-      losses: 0,
-      saves: 0,
-      holds: 0,
-      strikeouts: 0,
-    };
-
-    if (batters.length > 0) {
-      // 타자 통계 평균 계산
-      const totalAvg = batters.reduce((sum, p) => sum + (p.batting_average || 0), 0);
-      const totalRbis = batters.reduce((sum, p) => sum + (p.rbis || 0), 0);
-      const totalHr = batters.reduce((sum, p) => sum + (p.home_runs || 0), 0);
-      const totalRuns = batters.reduce((sum, p) => sum + (p.stolen_bases || 0), 0); // 백엔드에서 득점을 stolen_bases로 매핑
-      const totalFpct = batters.reduce((sum, p) => sum + (p.fielding_percentage || 0), 0);
-      const totalTB = batters.reduce((sum, p) => sum + (p.total_bases || 0), 0);
-      const totalH = batters.reduce((sum, p) => sum + (p.hits || 0), 0);
-      const totalAB = batters.reduce((sum, p) => sum + (p.at_bats || 0), 0);
-
-      stats.battingAvg = totalAvg / batters.length;
-      stats.rbis = totalRbis / batters.length;
-      stats.homeRuns = totalHr / batters.length;
-      stats.runs = totalRuns / batters.length;
-      stats.fieldingPercentage = totalFpct / batters.length;
-      stats.totalBases = totalTB;
-      stats.hits = totalH;
-      stats.atBats = totalAB;
-    }
-
-    if (pitchers.length > 0) {
-      // 투수 통계 평균 계산
-      const totalEra = pitchers.reduce((sum, p) => sum + (p.era || 0), 0);
-      const totalWins = pitchers.reduce((sum, p) => sum + (p.wins || 0), 0);
-      const totalLosses = pitchers.reduce((sum, p) => sum + (p.losses || 0), 0);
-      const totalSaves = pitchers.reduce((sum, p) => sum + (p.saves || 0), 0);
-      const totalHolds = pitchers.reduce((sum, p) => sum + (p.holds || 0), 0);
-      const totalK = pitchers.reduce((sum, p) => sum + (p.strikeouts || 0), 0);
-
-      stats.era = totalEra / pitchers.length;
-      stats.wins = totalWins / pitchers.length;
-      stats.losses = totalLosses / pitchers.length;
-      stats.saves = totalSaves / pitchers.length;
-      stats.holds = totalHolds / pitchers.length;
-      stats.strikeouts = totalK / pitchers.length;
-    }
-
-    return stats;
+  // 팀 요약 요청 라인업 (선택한 선수가 바뀔 때만 새로 만들어 다시 요청)
+  const teamLineup = useMemo((): TeamLineup => {
+    const lineup: TeamLineup = { pitchers: pitchers.map(p => p.id) };
+    batters.forEach(player => {
+      if (player.position !== 'pitcher') lineup[player.position] = player.id;
+    });
+    return lineup;
   }, [batters, pitchers]);
 
-  // 팀 능력치 계산 (0-100 스케일)
-  const teamAbilities = useMemo((): TeamAbilities => {
-    // 파워: (TB-H)/AB 기준 (장타율의 일종, 안타를 제외한 추가 루타율)
-    // (TB-H)/AB 범위: 0-0.350을 0-100으로 변환
-    const tbMinusH = teamStats.totalBases - teamStats.hits;
-    const power = (teamStats.atBats > 0)
-      ? Math.min(100, ((tbMinusH / teamStats.atBats) / 0.350) * 100)
-      : Math.min(100, (teamStats.homeRuns / 60) * 100); // 폴백: 홈런 기준
-
-    // 정확도: 타율 기준 (0-0.400을 0-100으로 변환)
-    const accuracy = Math.min(100, (teamStats.battingAvg / 0.400) * 100);
-
-    // 득점력: 득점 기준 (0-100점을 0-100으로 변환)
-    const scoring = Math.min(100, (teamStats.runs / 100) * 100);
-
-    // 수비: 수비율 기준 (0.850-1.000을 0-100으로 변환, 완화된 범위)
-    const defense = teamStats.fieldingPercentage > 0
-      ? Math.max(0, Math.min(100, ((teamStats.fieldingPercentage - 0.850) / 0.150) * 100))
-      : (accuracy * 0.6 + power * 0.4); // 수비율 데이터가 없으면 기존 계산 사용
+  // 팀 기록 / 능력치 / 예상 승률은 서버에서 계산 (라인업별 캐시)
+  useEffect(() => {
+    if (batters.length === 0 && pitchers.length === 0) {
+      setTeamSummaryResult(null);
+      return;
+    }
+    let cancelled = false;
+    getTeamSummary(teamLineup)
+      .then(summary => {
+        if (!cancelled) setTeamSummaryResult({ lineup: teamLineup, summary, failed: false });
+      })
+      .catch(error => {
+        console.error('Error fetching team summary:', error);
+        if (!cancelled) setTeamSummaryResult({ lineup: teamLineup, summary: null, failed: true });
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [teamLineup, batters.length, pitchers.length]);
 
-    // 투수력: ERA 기준 (0-6.0을 역으로 100-0으로 변환, 낮을수록 좋음)
-    const pitching = teamStats.era > 0 
-      ? Math.max(0, Math.min(100, ((6.0 - teamStats.era) / 6.0) * 100))
-      : 50; // ERA 데이터가 없으면 평균값
+  // 현재 라인업의 응답만 사용 (요청 중이거나 실패하면 null → 0 대신 자리 표시)
+  const currentSummaryResult = teamSummaryResult?.lineup === teamLineup ? teamSummaryResult : null;
+  const teamSummary = currentSummaryResult?.summary ?? null;
+  const teamSummaryFailed = currentSummaryResult?.failed ?? false;
 
+  const teamStats = useMemo((): TeamStats | null => {
+    if (!teamSummary) return null;
+    const stats = teamSummary.stats;
     return {
-      power: Math.round(power),
-      accuracy: Math.round(accuracy),
-      running: Math.round(scoring),
-      defense: Math.round(defense),
-      pitching: Math.round(pitching),
+      battingAvg: stats.batting_avg,
+      rbis: stats.rbis,
+      homeRuns: stats.home_runs,
+      runs: stats.runs,
+      fieldingPercentage: stats.fielding_percentage,
+      totalBases: stats.total_bases,
+      hits: stats.hits,
+      atBats: stats.at_bats,
+      era: stats.era,
+      wins: stats.wins,
+      losses: stats.losses,
+      saves: stats.saves,
+      holds: stats.holds,
+      strikeouts: stats.strikeouts,
     };
-  }, [teamStats]);
+  }, [teamSummary]);
 
-  // 예상 승률 계산 (피타고라스 승률 비슷한 방식)
-  const expectedWinRate = useMemo(() => {
-    const abilities = teamAbilities;
-    
-    // 능력치 기반 승률 계산 (간단한 공식)
-    // 공격력(파워, 정확도, 주루)과 수비력(수비, 투수력)의 평균
-    const offense = (abilities.power + abilities.accuracy + abilities.running) / 3;
-    const defense = (abilities.defense + abilities.pitching) / 2;
-    const totalAbility = (offense * 0.5 + defense * 0.5) / 100;
-
-    // 0.35 ~ 0.65 범위로 정규화 (더 완화된 범위)
-    const winRate = 0.35 + (totalAbility * 0.30);
-    return Math.max(0.25, Math.min(0.75, winRate));
-  }, [teamAbilities]);
+  const teamAbilities = useMemo((): TeamAbilities | null => {
+    if (!teamSummary) return null;
+    const abilities: TeamAbilities = { power: 0, accuracy: 0, running: 0, defense: 0, pitching: 0 };
+    teamSummary.abilities.axes.forEach(axis => {
+      if (axis.key in abilities) abilities[axis.key as keyof TeamAbilities] = axis.value;
+    });
+    return abilities;
+  }, [teamSummary]);
+
+  const expectedWinRate = teamSummary?.expected_win_rate ?? 0;
 
   // 팀 성향 분석
   const teamAnalysis = useMemo(() => {
+    if (!teamAbilities) return '';
     const { power, accuracy, running, defense, pitching } = teamAbilities;
     
     const traits: string[] = [];
@@ -446,65 +414,65 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
 
     // 타순별로 최적 선수 선택
     const lineup: (Player | null)[] = [null, null, null, null, null, null, null, null, null];
-    const used = new Set<number>();
+    const used = new Set<string>();
 
     // 1번: 출루율 + 득점력이 높은 선수
     const leadoff = playersWithScores
-      .filter(p => !used.has(p.player.id))
+      .filter(p => !used.has(lineupKey(p.player)))
       .sort((a, b) => b.scores.leadoff - a.scores.leadoff)[0];
     if (leadoff) {
       lineup[0] = leadoff.player;
-      used.add(leadoff.player.id);
+      used.add(lineupKey(leadoff.player));
     }
 
     // 2번: 출루율이 높은 선수
     const second = playersWithScores
-      .filter(p => !used.has(p.player.id))
+      .filter(p => !used.has(lineupKey(p.player)))
       .sort((a, b) => b.scores.second - a.scores.second)[0];
     if (second) {
       lineup[1] = second.player;
-      used.add(second.player.id);
+      used.add(lineupKey(second.player));
     }
 
     // 3번: 가장 높은 타율
     const third = playersWithScores
-      .filter(p => !used.has(p.player.id))
+      .filter(p => !used.has(lineupKey(p.player)))
       .sort((a, b) => b.scores.third - a.scores.third)[0];
     if (third) {
       lineup[2] = third.player;
-      used.add(third.player.id);
+      used.add(lineupKey(third.player));
     }
 
     // 4번: 홈런 + 타점이 가장 높은 선수
     const cleanup = playersWithScores
-      .filter(p => !used.has(p.player.id))
+      .filter(p => !used.has(lineupKey(p.player)))
       .sort((a, b) => b.scores.cleanup - a.scores.cleanup)[0];
     if (cleanup) {
       lineup[3] = cleanup.player;
-      used.add(cleanup.player.id);
+      used.add(lineupKey(cleanup.player));
     }
 
     // 5번: 두 번째로 높은 홈런 + 타점
     const fifth = playersWithScores
-      .filter(p => !used.has(p.player.id))
+      .filter(p => !used.has(lineupKey(p.player)))
       .sort((a, b) => b.scores.fifth - a.scores.fifth)[0];
     if (fifth) {
       lineup[4] = fifth.player;
-      used.add(fifth.player.id);
+      used.add(lineupKey(fifth.player));
     }
 
     // 6번: 타점 중심
     const sixth = playersWithScores
-      .filter(p => !used.has(p.player.id))
+      .filter(p => !used.has(lineupKey(p.player)))
       .sort((a, b) => b.scores.sixth - a.scores.sixth)[0];
     if (sixth) {
       lineup[5] = sixth.player;
-      used.add(sixth.player.id);
+      used.add(lineupKey(sixth.player));
     }
 
     // 7-9번: 나머지 선수들을 타율 순으로 배치
     const remaining = playersWithScores
-      .filter(p => !used.has(p.player.id))
+      .filter(p => !used.has(lineupKey(p.player)))
       .sort((a, b) => b.scores.bottom - a.scores.bottom);
 
     remaining.forEach((p, idx) => {
@@ -607,6 +575,18 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
 
   const hasData = batters.length > 0 || pitchers.length > 0;
 
+  // 팀 요약을 기다리는 중이거나 실패했을 때 기록 / 능력치 / 예상 성적 대신 표시
+  const summaryValue = (format: (stats: TeamStats) => string) => (teamStats ? format(teamStats) : '-');
+  const teamSummaryPlaceholder = (
+    <BlurView intensity={80} tint="light" style={styles.teamAnalysis}>
+      {teamSummaryFailed ? (
+        <Text style={styles.emptyText}>팀 요약을 불러오지 못했습니다.</Text>
+      ) : (
+        <ActivityIndicator size="small" color="#7896AA" />
+      )}
+    </BlurView>
+  );
+
   if (!hasData) {
     return (
       <View style={styles.emptyContainer}>
@@ -627,19 +607,19 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
         <View style={styles.statsGrid}>
           <BlurView intensity={80} tint="light" style={styles.statCard}>
             <Text style={styles.statLabel}>타율</Text>
-            <Text style={styles.statValue}>{teamStats.battingAvg.toFixed(3)}</Text>
+            <Text style={styles.statValue}>{summaryValue(stats => stats.battingAvg.toFixed(3))}</Text>
           </BlurView>
           <BlurView intensity={80} tint="light" style={styles.statCard}>
             <Text style={styles.statLabel}>타점</Text>
-            <Text style={styles.statValue}>{teamStats.rbis.toFixed(1)}</Text>
+            <Text style={styles.statValue}>{summaryValue(stats => stats.rbis.toFixed(1))}</Text>
           </BlurView>
           <BlurView intensity={80} tint="light" style={styles.statCard}>
             <Text style={styles.statLabel}>홈런</Text>
-            <Text style={styles.statValue}>{teamStats.homeRuns.toFixed(1)}</Text>
+            <Text style={styles.statValue}>{summaryValue(stats => stats.homeRuns.toFixed(1))}</Text>
           </BlurView>
           <BlurView intensity={80} tint="light" style={styles.statCard}>
             <Text style={styles.statLabel}>득점</Text>
-            <Text style={styles.statValue}>{teamStats.runs.toFixed(1)}</Text>
+            <Text style={styles.statValue}>{summaryValue(stats => stats.runs.toFixed(1))}</Text>
           </BlurView>
         </View>
       </View>
@@ -717,7 +697,7 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
           <BlurView intensity={80} tint="light" style={styles.lineupContainer}>
             {optimalLineup.map((player, index) => (
               <View 
-                key={player.id} 
+                key={lineupKey(player)} 
                 style={[
                   styles.lineupItem,
                   index === optimalLineup.length - 1 && styles.lineupItemLast
@@ -744,31 +724,43 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
       {/* 팀 능력치 오각형 그래프 */}
       <View style={styles.section}>
         <Text style={styles.sectionTitle}>팀 능력치</Text>
-        <PentagonChart abilities={teamAbilities} />
-        <BlurView intensity={80} tint="light" style={styles.teamAnalysis}>
-          <Text style={styles.teamAnalysisText}>
-            이 팀은 <Text style={styles.teamTrait}>{teamAnalysis}</Text> 팀입니다.
-          </Text>
-        </BlurView>
+        {teamAbilities ? (
+          <>
+            <PentagonChart abilities={teamAbilities} />
+            <BlurView intensity={80} tint="light" style={styles.teamAnalysis}>
+              <Text style={styles.teamAnalysisText}>
+                이 팀은 <Text style={styles.teamTrait}>{teamAnalysis}</Text> 팀입니다.
+              </Text>
+            </BlurView>
+          </>
+        ) : (
+          teamSummaryPlaceholder
+        )}
       </View>
 
       {/* 예상 승률 */}
       {hasData && (
         <View style={styles.section}>
           <Text style={styles.sectionTitle}>예상 성적</Text>
-          <View style={styles.predictionRow}>
-            <BlurView intensity={80} tint="light" style={[styles.predictionCard, { backgroundColor: rankBackgroundColor }]}>
-              <Text style={styles.predictionLabel}>예상 승률</Text>
-              <Text style={styles.predictionValue}>{(expectedWinRate * 100).toFixed(1)}%</Text>
-            </BlurView>
-            <BlurView intensity={80} tint="light" style={[styles.predictionCard, { backgroundColor: rankBackgroundColor }]}>
-              <Text style={styles.predictionLabel}>예상 순위</Text>
-              <Text style={styles.predictionValue}>{expectedRank}위</Text>
-            </BlurView>
-          </View>
-          <BlurView intensity={80} tint="light" style={[styles.predictionMessageCard, { backgroundColor: rankBackgroundColor }]}>
-            <Text style={styles.predictionMessage}>{winRateMessage}</Text>
-          </BlurView>
+          {teamSummary ? (
+            <>
+              <View style={styles.predictionRow}>
+                <BlurView intensity={80} tint="light" style={[styles.predictionCard, { backgroundColor: rankBackgroundColor }]}>
+                  <Text style={styles.predictionLabel}>예상 승률</Text>
+                  <Text style={styles.predictionValue}>{(expectedWinRate * 100).toFixed(1)}%</Text>
+                </BlurView>
+                <BlurView intensity={80} tint="light" style={[styles.predictionCard, { backgroundColor: rankBackgroundColor }]}>
+                  <Text style={styles.predictionLabel}>예상 순위</Text>
+                  <Text style={styles.predictionValue}>{expectedRank}위</Text>
+                </BlurView>
+              </View>
+              <BlurView intensity={80} tint="light" style={[styles.predictionMessageCard, { backgroundColor: rankBackgroundColor }]}>
+                <Text style={styles.predictionMessage}>{winRateMessage}</Text>
+              </BlurView>
+            </>
+          ) : (
+            teamSummaryPlaceholder
+          )}
         </View>
       )}
 
@@ -872,7 +864,7 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
                 // 2025 성적 데이터가 있는 타자만 표시
                 return hitters2025.some(h => h.선수명 === batter.name);
               })}
-              keyExtractor={(item) => item.id.toString()}
+              keyExtractor={(item) => lineupKey(item)}
               ListEmptyComponent={
                 <View style={styles.modalLoading}>
                   <Text style={styles.modalLoadingText}>
@@ -886,7 +878,7 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
                   <TouchableOpacity
                     style={[
                       styles.modalItem,
-                      selectedBatter?.id === item.id && styles.modalItemSelected
+                      selectedBatter && lineupKey(selectedBatter) === lineupKey(item) && styles.modalItemSelected
                     ]}
                     onPress={() => {
                       setSelectedBatter(item);
@@ -895,7 +887,7 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
                   >
                     <Text style={styles.modalItemText}>{item.name}</Text>
                     <Text style={styles.modalItemSubtext}>
-                      {item.team} | 타율: {hitter2025?.AVG || 'N/A'}
+                      {item.team} | 타율: {hitter2025?.AVG != null ? hitter2025.AVG.toFixed(3) : 'N/A'}
                     </Text>
                   </TouchableOpacity>
                 );
@@ -942,7 +934,7 @@ export default function Stats({ selectedPlayers, startingPitcher, reliefPitchers
                   >
                     <Text style={styles.modalItemText}>{item.선수명}</Text>
                     <Text style={styles.modalItemSubtext}>
-                      ERA: {item.ERA || 'N/A'} | SO: {item.SO || 'N/A'}
+                      ERA: {item.ERA != null ? item.ERA.toFixed(2) : 'N/A'} | SO: {item.SO ?? 'N/A'}
                     </Text>
                   </TouchableOpacity>
                 )}
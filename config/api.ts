@@ -39,15 +39,23 @@ export const API_ENDPOINTS = {
   
   // MySQL 테이블 직접 쿼리 API (batterlist, pitcherlist)
   mysqlPlayers: `${API_URL}/api/mysql-players/`,
+  // 선수 이름 자동완성 검색 API (초성 / 오타 허용)
+  playerSearch: (query: string, limit: number = 50) => `${API_URL}/api/players/search/?q=${encodeURIComponent(query)}&limit=${limit}`,
   
-  // 타자 최근 경기 기록 API
-  hitterRecentGames: (playerName: string) => `${API_URL}/api/hitter-recent-games/?player_name=${encodeURIComponent(playerName)}`,
+  // 타자 최근 경기 기록 API (선수 ID = KBO player_id)
+  hitterRecentGames: (playerId: number) => `${API_URL}/api/hitter-recent-games/?player_id=${playerId}`,
   // 투수 최근 경기 기록 API
-  pitcherRecentGames: (playerName: string) => `${API_URL}/api/pitcher-recent-games/?player_name=${encodeURIComponent(playerName)}`,
+  pitcherRecentGames: (playerId: number) => `${API_URL}/api/pitcher-recent-games/?player_id=${playerId}`,
+  // 선수 프로필 통합 API (기록 + 능력치 + 이미지 + 최근 경기)
+  playerProfile: (id: number) => `${API_URL}/api/players/${id}/profile/`,
   // 2025 타자 목록 API
   hitters2025: `${API_URL}/api/hitters-2025/`,
   // 2025 투수 목록 API
   pitchers2025: `${API_URL}/api/pitchers-2025/`,
+  // 라인업 팀 요약 API (기록 평균 / 합계 + 팀 능력치 + 예상 승률, POST {catcher: id, ..., pitchers: [id, ...]})
+  teamSummary: `${API_URL}/api/team-summary/`,
+  // 최근 폼 상위 선수 API (?type=hitter|pitcher&games=3|5|10&limit=10)
+  hotPlayers: `${API_URL}/api/hot-players/`,
   // 타자 vs 투수 시뮬레이션 API
   simulateAtBat: `${API_URL}/api/simulate-at-bat/`,
 };
@@ -97,6 +97,79 @@ export const getMysqlPlayersByPosition = async (): Promise<Record<PlayerPosition
   }
 };
 
+/**
+ * 선수 이름 검색 (이름 앞부분, 초성 'ㅇㅇㅈ', 오타 허용)
+ * /api/mysql-players/ 와 같은 선수 객체를 일치 순서대로 반환
+ */
+export const searchPlayers = async (query: string, limit: number = 50): Promise<Player[]> => {
+  try {
+    const response = await fetch(API_ENDPOINTS.playerSearch(query, limit), {
+      method: 'GET',
+      headers: API_HEADERS,
+    });
+
+    if (!response.ok) {
+      throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    const data = await response.json();
+    return data;
+  } catch (error) {
+    console.error(`Error searching players for "${query}":`, error);
+    throw error;
+  }
+};
+
+// 팀 요약 요청 라인업 (포지션별 타자 ID + 투수 ID 목록, ID는 /api/mysql-players/ 응답의 id)
+export type TeamLineup = Partial<Record<Exclude<PlayerPosition, 'pitcher'>, number>> & { pitchers: number[] };
+
+// 팀 요약 응답 (/api/team-summary/)
+export interface TeamSummary {
+  lineup_hash: string;
+  stats: {
+    batting_avg: number;
+    rbis: number;
+    home_runs: number;
+    runs: number;
+    fielding_percentage: number;
+    total_bases: number;
+    hits: number;
+    at_bats: number;
+    era: number;
+    wins: number;
+    losses: number;
+    saves: number;
+    holds: number;
+    strikeouts: number;
+  };
+  abilities: { type: 'team'; axes: { key: string; label: string; value: number }[] };
+  expected_win_rate: number;
+  missing: number[];  // 기록을 찾을 수 없어 계산에서 제외한 선수 ID
+}
+
+/**
+ * 라인업 팀 요약 (기록 평균 / 합계 + 팀 능력치 + 예상 승률, 서버에서 라인업별로 한 번만 계산)
+ */
+export const getTeamSummary = async (lineup: TeamLineup): Promise<TeamSummary> => {
+  try {
+    const response = await fetch(API_ENDPOINTS.teamSummary, {
+      method: 'POST',
+      headers: API_HEADERS,
+      body: JSON.stringify(lineup),
+    });
+
+    if (!response.ok) {
+      throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    const data = await response.json();
+    return data;
+  } catch (error) {
+    console.error('Error fetching team summary:', error);
+    throw error;
+  }
+};
+
 /**
  * 특정 선수 상세 정보 가져오기
  */
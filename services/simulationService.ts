@@ -4,33 +4,34 @@
 
 import { API_ENDPOINTS, API_HEADERS } from '../config/api';
 
+// 2025 기록 (기록 컬럼은 숫자, 기록이 없으면 null)
 export interface Hitter2025 {
   player_id: string;
   선수명: string;
-  AVG?: string;
-  G?: string;
-  PA?: string;
-  AB?: string;
-  H?: string;
-  '2B'?: string;
-  '3B'?: string;
-  HR?: string;
-  BB?: string;
-  SO?: string;
+  AVG?: number | null;
+  G?: number | null;
+  PA?: number | null;
+  AB?: number | null;
+  H?: number | null;
+  '2B'?: number | null;
+  '3B'?: number | null;
+  HR?: number | null;
+  BB?: number | null;
+  SO?: number | null;
   [key: string]: any;
 }
 
 export interface Pitcher2025 {
   player_id: string;
   선수명: string;
-  ERA?: string;
-  G?: string;
-  TBF?: string;
-  BB?: string;
-  SO?: string;
-  AVG?: string;
-  H?: string;
-  HR?: string;
+  ERA?: number | null;
+  G?: number | null;
+  TBF?: number | null;
+  BB?: number | null;
+  SO?: number | null;
+  AVG?: number | null;
+  H?: number | null;
+  HR?: number | null;
   [key: string]: any;
 }
 
@@ -36,6 +36,11 @@ export interface Player {
   whip?: number;  // WHIP (이닝당 출루 허용)
   innings_pitched?: number;  // 이닝 수 (IP)
   walks?: number;  // 볼넷 (BB)
+
+  // 능력치 (0-100, /api/mysql-players/가 미리 계산해서 보냄)
+  ratings?: Record<string, number>;
+  // 능력치 척도 (응답 전체에서 같음): 리그 백분위, 또는 능력치 테이블이 없을 때 고정 기준
+  ratings_scale?: 'league_percentile' | 'fixed';
 }
 
 // 포지션 이름 표시용